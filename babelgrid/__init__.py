@@ -5,3 +5,7 @@ __email__ = "joao.carabetta@gmail.com"
 __version__ = "0.1.0"
 
 from babelgrid.babelgrid import *
+from babelgrid.tileset import TileSet
+from babelgrid.join import SpatialJoin
+from babelgrid.aggregate import aggregate_points
+from babelgrid.polyfill_cache import PolyfillCache
@@ -0,0 +1,140 @@
+"""Aggregation of point values into tiles, with hierarchical rollups.
+
+Points are indexed in batch as integer tile ids and their values are
+reduced per tile with NumPy grouping. Each coarser level is reduced from
+the tiles of the level below it, not from the points, so rollups cost as
+much as the number of tiles.
+
+```
+from babelgrid.aggregate import aggregate_points
+
+levels = aggregate_points('s2', df.lat.values, df.lon.values, 14,
+                          df.price.values, rollups=[12, 10])
+levels[10]
+{'tile_id': array(['94ce5', ...]), 'count': array([...]), 'sum': ..., 'mean': ...}
+```
+
+The columns of each level can be passed as they are to `pyarrow.table` or
+`pandas.DataFrame`, and the tile ids to `babelgrid.export`.
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+from babelgrid.babelgrid import Babel
+
+STATISTICS = ("count", "sum", "mean", "min", "max")
+
+DEFAULT_STATISTICS = ("count", "sum", "mean")
+
+
+def _reduce(
+    inverse: np.ndarray, size: int, columns: Dict[str, np.ndarray]
+) -> Dict[str, np.ndarray]:
+    """Reduces partial count, sum, min and max columns by group."""
+
+    reduced = {"count": np.bincount(inverse, columns["count"], size).astype(np.int64)}
+
+    if "sum" in columns:
+        reduced["sum"] = np.bincount(inverse, columns["sum"], size)
+
+    if "min" in columns:
+        reduced["min"] = np.full(size, np.inf)
+        np.minimum.at(reduced["min"], inverse, columns["min"])
+
+    if "max" in columns:
+        reduced["max"] = np.full(size, -np.inf)
+        np.maximum.at(reduced["max"], inverse, columns["max"])
+
+    return reduced
+
+
+def aggregate_points(
+    grid_type: str,
+    lats: Union[np.ndarray, List[float]],
+    lons: Union[np.ndarray, List[float]],
+    resolution: int,
+    values: Union[np.ndarray, List[float], None] = None,
+    rollups: Iterable[int] = (),
+    statistics: Optional[Sequence[str]] = None,
+    as_int: bool = False,
+) -> Dict[int, Dict[str, np.ndarray]]:
+    """Aggregates point values into tiles at a resolution and at coarser
+    rollup resolutions, in a single pass over the points.
+
+    Parameters
+    ----------
+    grid_type : str
+        Example: 'bing', 'h3', 's2'
+    lats : Union[np.ndarray, List[float]]
+    lons : Union[np.ndarray, List[float]]
+    resolution : int
+        Grid system resolution/zoom/size of the finest level
+    values : Union[np.ndarray, List[float]], optional
+        Value of each point. Without values only `count` is computed.
+    rollups : Iterable[int]
+        Coarser resolutions to roll the finest level up to
+    statistics : Sequence[str], optional
+        Columns to compute, any of STATISTICS. By default DEFAULT_STATISTICS
+        if values are given and only `count` otherwise.
+    as_int : bool
+        If True, tile ids are 64-bit integers, see `Babel.to_ints`
+
+    Returns
+    -------
+    Dict[int, Dict[str, np.ndarray]]
+        Resolution to columns. Each level has a `tile_id` column, sorted as
+        the integer ids, plus the requested statistics. Rollup tiles are the
+        ancestors of the finest tiles, which for h3 is not always the
+        hexagon that contains the point.
+    """
+
+    if statistics is None:
+        statistics = DEFAULT_STATISTICS if values is not None else ("count",)
+
+    unknown = set(statistics) - set(STATISTICS)
+    if unknown:
+        raise Exception(
+            f"{', '.join(sorted(unknown))} are not valid statistics. "
+            f"Try one of the following: {', '.join(STATISTICS)}"
+        )
+
+    if values is None and set(statistics) - {"count"}:
+        raise Exception("values are required for statistics other than count")
+
+    rollups = sorted(set(rollups), reverse=True)
+    if rollups and rollups[0] >= resolution:
+        raise Exception(f"All rollup resolutions must be lower than {resolution}")
+
+    babel = Babel(grid_type)
+
+    tile_ints = babel.geo_to_tiles(lats, lons, resolution, as_int=True)
+
+    columns = {"count": np.ones(len(tile_ints))}
+    if values is not None:
+        values = np.asarray(values, dtype=float).ravel()
+        if len(values) != len(tile_ints):
+            raise Exception(
+                f"values and points must have the same length: "
+                f"{len(values)} != {len(tile_ints)}"
+            )
+        columns.update(sum=values, min=values, max=values)
+
+    levels = {}
+    for level in [resolution] + rollups:
+
+        if level != resolution:
+            tile_ints = babel.parents(tile_ints, level)
+
+        tile_ints, inverse = np.unique(tile_ints, return_inverse=True)
+        columns = _reduce(inverse.ravel(), len(tile_ints), columns)
+
+        levels[level] = {"tile_id": tile_ints if as_int else babel.from_ints(tile_ints)}
+        for statistic in statistics:
+            if statistic == "mean":
+                levels[level][statistic] = columns["sum"] / columns["count"]
+            else:
+                levels[level][statistic] = columns[statistic]
+
+    return levels
@@ -0,0 +1,109 @@
+from functools import lru_cache
+
+import numpy as np
+
+
+# pyproj is imported in the cached constructors, on the first area computed,
+# since it dominates the import time of babelgrid
+
+
+@lru_cache(maxsize=None)
+def _web_mercator_transformer():
+
+    import pyproj
+
+    return pyproj.Transformer.from_crs("epsg:4326", "epsg:3857", always_xy=True)
+
+
+@lru_cache(maxsize=None)
+def _geod():
+
+    import pyproj
+
+    return pyproj.Geod(ellps="WGS84")
+
+
+def _polygon_rings(polygon):
+
+    yield polygon.exterior, 1
+    for interior in polygon.interiors:
+        yield interior, -1
+
+
+def polygons_area_km(polygons, geodesic=False):
+    """Area in km squared of many (lon, lat) shapely Polygons at once
+
+    Parameters
+    ----------
+    polygons : list
+        List of shapely Polygons
+    geodesic : bool, optional
+        If True, the area is computed on the WGS84 ellipsoid.
+        If False, the area is computed in Web Mercator (EPSG:3857),
+        by default False
+
+    Returns
+    -------
+    numpy.ndarray
+        Areas in km squared
+    """
+
+    if geodesic:
+        geod = _geod()
+        return np.array(
+            [abs(geod.geometry_area_perimeter(p)[0]) / 10 ** 6 for p in polygons],
+            dtype=float,
+        )
+
+    coords, starts, signs, owners = [], [], [], []
+    size = 0
+    for i, polygon in enumerate(polygons):
+        for ring, sign in _polygon_rings(polygon):
+            ring_coords = np.asarray(ring.coords)
+            coords.append(ring_coords)
+            starts.append(size)
+            signs.append(sign)
+            owners.append(i)
+            size += len(ring_coords)
+
+    if not coords:
+        return np.zeros(len(polygons), dtype=float)
+
+    coords = np.concatenate(coords)
+    x, y = _web_mercator_transformer().transform(coords[:, 0], coords[:, 1])
+
+    # Shoelace formula. Rings are closed, so the term that crosses from the
+    # last point of a ring to the first point of the next one is dropped.
+    starts = np.array(starts, dtype=np.intp)
+    # Coordinates are taken relative to the first point of their ring to
+    # avoid losing precision on small tiles
+    ring_sizes = np.diff(np.append(starts, size))
+    x = x - np.repeat(x[starts], ring_sizes)
+    y = y - np.repeat(y[starts], ring_sizes)
+    cross = np.append(x[:-1] * y[1:] - x[1:] * y[:-1], 0.0)
+    cross[starts[1:] - 1] = 0.0
+    ring_areas = np.abs(np.add.reduceat(cross, starts)) / 2
+
+    return np.bincount(
+        owners, weights=ring_areas * np.array(signs), minlength=len(polygons)
+    ) / (10 ** 6)
+
+
+def polygon_area_km(polygon, geodesic=False):
+    """Area in km squared of a (lon, lat) shapely Polygon
+
+    Parameters
+    ----------
+    polygon : shapely.geometry.Polygon
+    geodesic : bool, optional
+        If True, the area is computed on the WGS84 ellipsoid.
+        If False, the area is computed in Web Mercator (EPSG:3857),
+        by default False
+
+    Returns
+    -------
+    float
+        Area in km squared
+    """
+
+    return float(polygons_area_km([polygon], geodesic)[0])
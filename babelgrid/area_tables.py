@@ -0,0 +1,391 @@
+"""Mean tile area in km squared per grid, resolution and absolute latitude
+band. Generated by `python -m babelgrid.resolution`, do not edit.
+"""
+
+LATITUDE_BAND = 5
+MAX_LATITUDE = 85
+
+# fmt: off
+AREA_TABLES = {
+    "s2": [
+        [
+            84154909.02, 24599524.09, 5489241.024, 1379875.721, 318361.4634,
+            80780.87843, 20299.93508, 5012.353805, 1249.590383, 311.9528678, 78.0558736,
+            19.52377886, 4.879275174, 1.219929128, 0.3049945315, 0.07624967184,
+            0.01906220132, 0.004765547018, 0.001191383046, 0.0002978453339,
+            7.446127625e-05, 1.861532241e-05, 4.653829054e-06, 1.163457356e-06,
+            2.908643488e-07, 7.271608922e-08, 1.817902244e-08, 4.544755615e-09,
+            1.136188899e-09, 2.840472178e-10, 7.101180623e-11,
+        ],
+        [
+            84154909.02, 24599524.09, 5489241.024, 1420666.298, 352301.4674,
+            89277.44685, 22465.38423, 5585.573247, 1392.422402, 347.5492001,
+            86.94105167, 21.74321103, 5.434803498, 1.358725709, 0.3396844691,
+            0.08492072236, 0.02122981572, 0.005307424972, 0.001326851562,
+            0.0003317125912, 8.292813028e-05, 2.073203874e-05, 5.183008454e-06,
+            1.295752223e-06, 3.239380617e-07, 8.098451571e-08, 2.024612925e-08,
+            5.061532325e-09, 1.265383083e-09, 3.163457608e-10, 7.908644302e-11,
+        ],
+        [
+            84154909.02, 24599524.09, 5489241.024, 1623022.172, 381200.2453,
+            96691.18021, 24415.39924, 6064.907045, 1510.94179, 376.7817561, 94.19294135,
+            23.5576356, 5.888213236, 1.472122039, 0.3680374929, 0.09201109987,
+            0.0230024547, 0.005750581839, 0.001437640217, 0.000359409136,
+            8.985216923e-05, 2.246304543e-05, 5.61576009e-06, 1.403940112e-06,
+            3.509850405e-07, 8.774626109e-08, 2.193656553e-08, 5.484141389e-09,
+            1.371035339e-09, 3.427588237e-10, 8.568970954e-11,
+        ],
+        [
+            84154909.02, 24599524.09, 5489241.024, 1632820.563, 402108.3119,
+            102484.8342, 25862.86631, 6431.262743, 1603.537372, 399.9692896,
+            99.99947716, 25.00686665, 6.250618952, 1.562706479, 0.390685262,
+            0.09767238171, 0.02441777292, 0.006104409903, 0.001526097441,
+            0.0003815236848, 9.538083635e-05, 2.384521395e-05, 5.961302108e-06,
+            1.490325564e-06, 3.725814019e-07, 9.314535093e-08, 2.328633819e-08,
+            5.821584525e-09, 1.455396126e-09, 3.638490172e-10, 9.096225933e-11,
+        ],
+        [
+            84154909.02, 24599524.09, 6548004.656, 1775418.449, 421768.9713,
+            107098.5562, 26995.43851, 6706.486873, 1671.777404, 417.4976819,
+            104.4171483, 26.11077291, 6.526336229, 1.631682624, 0.4079250986,
+            0.1019834693, 0.0254956243, 0.006373871817, 0.001593463652, 0.000398365247,
+            9.959124901e-05, 2.48978187e-05, 6.224453406e-06, 1.556113398e-06,
+            3.890283657e-07, 9.725709269e-08, 2.431427337e-08, 6.078568345e-09,
+            1.519642068e-09, 3.799105034e-10, 9.497762992e-11,
+        ],
+        [
+            84154909.02, 24599524.09, 6687670.171, 1791738.029, 435401.9854,
+            110497.3261, 27800.18955, 6910.2179, 1722.200909, 429.7720918, 107.4963045,
+            26.87990278, 6.718688519, 1.679736473, 0.4199453602, 0.1049874866,
+            0.02624662539, 0.006561613048, 0.001640398222, 0.0004100990879,
+            0.000102524702, 2.563118018e-05, 6.407793751e-06, 1.601948517e-06,
+            4.00487139e-07, 1.001217858e-07, 2.503044669e-08, 6.257611678e-09,
+            1.564402929e-09, 3.911007203e-10, 9.777518441e-11,
+        ],
+        [
+            84154909.02, 24599524.09, 6687670.171, 1828261.389, 441721.3013,
+            112183.4793, 28231.9273, 7020.503839, 1750.236846, 436.8679138, 109.2546398,
+            27.31942077, 6.828681041, 1.707244224, 0.4268199607, 0.1067060252,
+            0.02667621231, 0.006669015602, 0.001667249375, 0.000416811717,
+            0.0001042028564, 2.605071827e-05, 6.512678535e-06, 1.628169706e-06,
+            4.070424348e-07, 1.017606099e-07, 2.544015264e-08, 6.360038211e-09,
+            1.590009546e-09, 3.975023749e-10, 9.937559869e-11,
+        ],
+        [
+            84154909.02, 24599524.09, 6687670.171, 1841006.917, 444416.781, 112668.036,
+            28340.96519, 7048.03159, 1757.196049, 438.6923841, 109.7116693, 27.43293607,
+            6.857049491, 1.71433735, 0.4285932317, 0.1071494201, 0.02678706384,
+            0.006696729983, 0.001674177961, 0.0004185439182, 0.0001046359077,
+            2.615898136e-05, 6.539744242e-06, 1.634936127e-06, 4.087340397e-07,
+            1.021835108e-07, 2.554587805e-08, 6.386469473e-09, 1.596617362e-09,
+            3.991543332e-10, 9.978858379e-11,
+        ],
+        [
+            1154979563, 1154979563, 9044660.598, 2198571.302, 503365.4017, 125439.2757,
+            30958.5106, 7711.222497, 1924.563907, 481.0055112, 120.1522539, 30.02417512,
+            7.504140209, 1.876247575, 0.4690241118, 0.1172529862, 0.02931335685,
+            0.007328325754, 0.001832087201, 0.0004580210609, 0.0001145052282,
+            2.862628656e-05, 7.156572846e-06, 1.789142927e-06, 4.472857522e-07,
+            1.118214419e-07, 2.795536077e-08, 6.988840171e-09, 1.747210049e-09,
+            4.36802514e-10, 1.092006263e-10,
+        ],
+        [
+            1671430446, 1671430446, 11321152.62, 2449358.955, 658475.8188, 164746.5282,
+            41318.84543, 10363.06142, 2577.858896, 646.2254831, 161.3265235,
+            40.34498882, 10.08619397, 2.521528287, 0.6303811188, 0.1575949802,
+            0.03939890519, 0.009849736495, 0.00246242063, 0.0006156056337,
+            0.0001539015999, 3.847542835e-05, 9.618858317e-06, 2.404714992e-06,
+            6.011786803e-07, 1.5029467e-07, 3.757366753e-08, 9.393416903e-09,
+            2.34835424e-09, 5.870885517e-10, 1.467721404e-10,
+        ],
+        [
+            1671430446, 1671430446, 15873102.82, 4029379.41, 933040.615, 222552.1847,
+            56907.50267, 14272.31487, 3580.103417, 894.5211136, 223.6115073,
+            55.86082655, 13.96498225, 3.491664109, 0.8728688989, 0.2182174769,
+            0.05455356436, 0.01363837065, 0.003409602831, 0.0008523986141,
+            0.000213099714, 5.327497447e-05, 1.331873945e-05, 3.329684792e-06,
+            8.324211524e-07, 2.081052753e-07, 5.202631631e-08, 1.30065791e-08,
+            3.251644735e-09, 8.129111834e-10, 2.032277821e-10,
+        ],
+        [
+            1671430446, 1671430446, 15873102.82, 5574027.794, 1280900.869, 323182.0812,
+            80693.82986, 20007.45504, 4990.792092, 1245.3324, 311.9237409, 77.99581311,
+            19.49181454, 4.873436678, 1.218309236, 0.3045743524, 0.07614535582,
+            0.01903614117, 0.004759048203, 0.001189763626, 0.0002974411512,
+            7.436032389e-05, 1.85900822e-05, 4.647520957e-06, 1.161880072e-06,
+            2.904700077e-07, 7.261750172e-08, 1.815437533e-08, 4.538593803e-09,
+            1.134648462e-09, 2.836620958e-10,
+        ],
+        [
+            1671430446, 1671430446, 294950241.6, 6440151.942, 1887587.483, 468063.8488,
+            114722.2192, 28599.95872, 7131.004678, 1779.489208, 445.2664025,
+            111.2836886, 27.82246249, 6.954001673, 1.738603024, 0.4346448263,
+            0.1086658277, 0.02716652206, 0.006791622287, 0.001697905906,
+            0.0004244762091, 0.0001061190696, 2.652976959e-05, 6.63244308e-06,
+            1.658110643e-06, 4.145276414e-07, 1.036319104e-07, 2.590797755e-08,
+            6.476994313e-09, 1.619248607e-09, 4.048121633e-10,
+        ],
+        [
+            1671430446, 1671430446, 1550162442, 12283837.94, 2714983.429, 682661.2946,
+            171523.947, 42366.03625, 10613.98347, 2654.495437, 663.6685221, 165.8050772,
+            41.44992217, 10.36022491, 2.590380933, 0.647563716, 0.1618856136,
+            0.04047149713, 0.01011795404, 0.002529498169, 0.0006323739738,
+            0.000158093408, 3.952334018e-05, 9.880835833e-06, 2.470208788e-06,
+            6.175522225e-07, 1.543880552e-07, 3.859701339e-08, 9.649253243e-09,
+            2.412313346e-09, 6.03078342e-10,
+        ],
+        [
+            1671430446, 1671430446, 1642764872, 17276037.26, 4907136.1, 1125967.913,
+            276813.0669, 68736.27125, 17112.99249, 4281.122077, 1067.652434,
+            267.0321577, 66.77713404, 16.6994277, 4.174288595, 1.043734468,
+            0.2609297884, 0.06523243437, 0.01630798678, 0.004076985237, 0.001019245006,
+            0.0002548110954, 6.370278049e-05, 1.592569701e-05, 3.981425017e-06,
+            9.953563051e-07, 2.488390751e-07, 6.220976771e-08, 1.555244206e-08,
+            3.888110506e-09, 9.720276618e-10,
+        ],
+        [
+            1671430446, 1671430446, 1642764872, 608959253.6, 7648015.973, 2059977.952,
+            528061.0986, 129132.8218, 32203.28088, 8017.480056, 2004.332153,
+            501.5054239, 125.4446263, 31.36244968, 7.842325629, 1.960668293,
+            0.4901525369, 0.1225371948, 0.03063443289, 0.007658669186, 0.001914675743,
+            0.0004786695275, 0.0001196673314, 2.991682495e-05, 7.479207369e-06,
+            1.869801903e-06, 4.674504358e-07, 1.168626064e-07, 2.921565141e-08,
+            7.303912791e-09, 1.825978102e-09,
+        ],
+        [
+            1671430446, 1671430446, 1642764872, 1609737742, 284613796, 5590999.719,
+            1370292.806, 348467.4696, 86552.73426, 21720.50805, 5440.480903,
+            1364.021228, 340.6893944, 85.15930429, 21.28657407, 5.321114834,
+            1.330308721, 0.3325705938, 0.08314418326, 0.02078600322, 0.005196465674,
+            0.001299115778, 0.0003247787495, 8.119474756e-05, 2.029869819e-05,
+            5.074675005e-06, 1.268668861e-06, 3.171672195e-07, 7.929180491e-08,
+            1.982295097e-08, 4.955737523e-09,
+        ],
+    ],
+    "h3": [
+        [
+            3888925.003, 549076.424, 78538.04086, 11198.59696, 1599.283992, 228.6544484,
+            32.66148408, 4.666174915, 0.6665745014, 0.09522536853, 0.0136035747,
+            0.001943366694, 0.0002776238458, 3.966054679e-05, 5.665792356e-06,
+            8.093989361e-07,
+        ],
+        [
+            3901683.863, 549138.3199, 79361.13291, 11323.05942, 1619.379321,
+            231.4535876, 33.07025251, 4.72419181, 0.6748879229, 0.09641184466,
+            0.01377313719, 0.001967590278, 0.0002810842187, 4.015489628e-05,
+            5.73641369e-06, 8.194876886e-07,
+        ],
+        [
+            4021891.808, 571329.233, 82805.48707, 11833.05081, 1691.311023, 241.6068802,
+            34.52485754, 4.932222588, 0.7046150962, 0.1006588469, 0.0143797931,
+            0.002054255808, 0.0002934652787, 4.192360625e-05, 5.989086656e-06,
+            8.555837743e-07,
+        ],
+        [
+            4437710.548, 620224.5843, 88733.28599, 12670.38239, 1815.663016,
+            259.3218482, 37.04240794, 5.292138172, 0.7560011007, 0.108002461,
+            0.01542895637, 0.002204134553, 0.0003148764659, 4.498234794e-05,
+            6.426049509e-06, 9.180070724e-07,
+        ],
+        [
+            4768275.729, 672552.0801, 96142.49477, 13711.25726, 1959.904097,
+            279.6978772, 39.94913825, 5.7067558, 0.8152646381, 0.1164663887,
+            0.01663814078, 0.002376877059, 0.0003395538994, 4.850769665e-05,
+            6.929671309e-06, 9.899530292e-07,
+        ],
+        [
+            5322073.751, 748148.3349, 105733.8032, 15159.09912, 2163.097807,
+            309.2246182, 44.17499324, 6.311585773, 0.9016612705, 0.1288105545,
+            0.01840150115, 0.002628787425, 0.000375541243, 5.364873472e-05,
+            7.664104315e-06, 1.094872151e-06,
+        ],
+        [
+            5815430.837, 847113.7826, 118616.5071, 16872.43336, 2409.824784,
+            344.3331987, 49.1889168, 7.027148197, 1.003832086, 0.1434030226,
+            0.02048619885, 0.002926598982, 0.0004180855983, 5.972648417e-05,
+            8.532355189e-06, 1.218907905e-06,
+        ],
+        [
+            6784753.405, 931042.1301, 134211.1558, 19047.20414, 2718.188772,
+            388.6952584, 55.5289027, 7.933060177, 1.133295057, 0.1619018191,
+            0.02312887717, 0.003304117853, 0.0004720164714, 6.743091959e-05,
+            9.632989416e-06, 1.376141398e-06,
+        ],
+        [
+            7298397.035, 1105860.918, 155582.5135, 22305.87562, 3193.624733,
+            455.9157017, 65.13917105, 9.305793851, 1.329363035, 0.1899097485,
+            0.02712984639, 0.003875709985, 0.0005536726076, 7.909607028e-05,
+            1.129944005e-05, 1.614205731e-06,
+        ],
+        [
+            9704225.271, 1334488.6, 190728.7396, 27009.42265, 3849.046417, 550.8205341,
+            78.66119631, 11.23866454, 1.60568447, 0.2293753185, 0.03276814957,
+            0.004681152132, 0.0006687355705, 9.553366346e-05, 1.364766493e-05,
+            1.949666427e-06,
+        ],
+        [
+            13217217.31, 1615290.636, 235921.9397, 33997.16023, 4849.643303, 692.036492,
+            98.86727953, 14.12546786, 2.017870897, 0.2882626658, 0.0411802472,
+            0.005882895644, 0.0008404135788, 0.0001200591259, 1.715130147e-05,
+            2.450185992e-06,
+        ],
+        [
+            16171971.69, 2271541.176, 315259.5678, 44357.5183, 6336.041038, 905.249198,
+            129.3104757, 18.47102433, 2.638853613, 0.3769809072, 0.05385389626,
+            0.007693440946, 0.001099062565, 0.0001570088269, 2.242983527e-05,
+            3.204262048e-06,
+        ],
+        [
+            17215479.79, 3005863.337, 426705.6595, 60928.26168, 8696.051191,
+            1240.537741, 177.2124034, 25.31129409, 3.615969775, 0.5165604472,
+            0.07379374066, 0.01054195904, 0.001505994825, 0.0002151422177,
+            3.073459115e-05, 4.390655716e-06,
+        ],
+        [
+            43225357.32, 4455554.937, 624400.1254, 88082.60722, 12667.09351,
+            1810.466633, 258.8322037, 36.96434942, 5.280755896, 0.7543836771,
+            0.1077695534, 0.01539556278, 0.002199364273, 0.0003141950393,
+            4.488499966e-05, 6.412142393e-06,
+        ],
+        [
+            99763962.07, 7449882.094, 1022897.505, 145490.2287, 20789.41036,
+            2968.863715, 424.9634691, 60.70427379, 8.670559816, 1.238670339,
+            0.1769536805, 0.02527930079, 0.003611327418, 0.0005159041495,
+            7.370062761e-05, 1.052865794e-05,
+        ],
+        [
+            111507002.2, 15559175.04, 1997688.832, 286940.8503, 41381.27497,
+            5926.241906, 846.4673949, 120.8267829, 17.2583932, 2.465636072,
+            0.3522346842, 0.05031974615, 0.007188545581, 0.001026937911,
+            0.0001467053612, 2.095790824e-05,
+        ],
+        [
+            112463706.5, 52810416.71, 6420532.141, 907484.2667, 124693.3953, 17759.0663,
+            2536.691781, 361.5803448, 51.66186094, 7.381072448, 1.054430551,
+            0.1506325541, 0.02151895712, 0.003074133813, 0.0004391619042,
+            6.273738341e-05,
+        ],
+    ],
+    "bing": [
+        [
+            401501740.6, 100375435.1, 25093858.79, 6273464.697, 1568366.174,
+            392091.5435, 98022.88589, 24505.72147, 6126.430368, 1531.607592, 382.901898,
+            95.7254745, 23.93136862, 5.982842156, 1.495710539, 0.3739276348,
+            0.09348190869, 0.02337047717, 0.005842619293, 0.001460654823,
+            0.0003651637058, 9.129092645e-05, 2.282273162e-05,
+        ],
+        [
+            401501740.6, 100375435.1, 25093858.79, 6273464.697, 1568366.174,
+            392091.5435, 98022.88589, 24505.72147, 6126.430368, 1531.607592, 382.901898,
+            95.7254745, 23.93136862, 5.982842156, 1.495710539, 0.3739276348,
+            0.09348190869, 0.02337047717, 0.005842619293, 0.001460654823,
+            0.0003651637058, 9.129092645e-05, 2.282273162e-05,
+        ],
+        [
+            401501740.6, 100375435.1, 25093858.79, 6273464.697, 1568366.174,
+            392091.5435, 98022.88589, 24505.72147, 6126.430368, 1531.607592, 382.901898,
+            95.7254745, 23.93136862, 5.982842156, 1.495710539, 0.3739276348,
+            0.09348190869, 0.02337047717, 0.005842619293, 0.001460654823,
+            0.0003651637058, 9.129092645e-05, 2.282273162e-05,
+        ],
+        [
+            401501740.6, 100375435.1, 25093858.79, 6273464.697, 1568366.174,
+            392091.5435, 98022.88589, 24505.72147, 6126.430368, 1531.607592, 382.901898,
+            95.7254745, 23.93136862, 5.982842156, 1.495710539, 0.3739276348,
+            0.09348190869, 0.02337047717, 0.005842619293, 0.001460654823,
+            0.0003651637058, 9.129092645e-05, 2.282273161e-05,
+        ],
+        [
+            401501740.6, 100375435.1, 25093858.79, 6273464.697, 1568366.174,
+            392091.5435, 98022.88589, 24505.72147, 6126.430368, 1531.607592, 382.901898,
+            95.7254745, 23.93136862, 5.982842156, 1.495710539, 0.3739276348,
+            0.09348190869, 0.02337047717, 0.005842619293, 0.001460654823,
+            0.0003651637058, 9.129092645e-05, 2.282273161e-05,
+        ],
+        [
+            401501740.6, 100375435.1, 25093858.79, 6273464.697, 1568366.174,
+            392091.5435, 98022.88589, 24505.72147, 6126.430368, 1531.607592, 382.901898,
+            95.7254745, 23.93136862, 5.982842156, 1.495710539, 0.3739276348,
+            0.09348190869, 0.02337047717, 0.005842619293, 0.001460654823,
+            0.0003651637058, 9.129092646e-05, 2.282273161e-05,
+        ],
+        [
+            401501740.6, 100375435.1, 25093858.79, 6273464.697, 1568366.174,
+            392091.5435, 98022.88589, 24505.72147, 6126.430368, 1531.607592, 382.901898,
+            95.7254745, 23.93136862, 5.982842156, 1.495710539, 0.3739276348,
+            0.09348190869, 0.02337047717, 0.005842619293, 0.001460654823,
+            0.0003651637058, 9.129092645e-05, 2.282273162e-05,
+        ],
+        [
+            401501740.6, 100375435.1, 25093858.79, 6273464.697, 1568366.174,
+            392091.5435, 98022.88589, 24505.72147, 6126.430368, 1531.607592, 382.901898,
+            95.7254745, 23.93136862, 5.982842156, 1.495710539, 0.3739276348,
+            0.09348190869, 0.02337047717, 0.005842619293, 0.001460654823,
+            0.0003651637058, 9.129092645e-05, 2.282273162e-05,
+        ],
+        [
+            401501740.6, 100375435.1, 25093858.79, 6273464.697, 1568366.174,
+            392091.5435, 98022.88589, 24505.72147, 6126.430368, 1531.607592, 382.901898,
+            95.7254745, 23.93136862, 5.982842156, 1.495710539, 0.3739276348,
+            0.09348190869, 0.02337047717, 0.005842619293, 0.001460654823,
+            0.0003651637058, 9.129092645e-05, 2.282273161e-05,
+        ],
+        [
+            401501740.6, 100375435.1, 25093858.79, 6273464.697, 1568366.174,
+            392091.5435, 98022.88589, 24505.72147, 6126.430368, 1531.607592, 382.901898,
+            95.7254745, 23.93136862, 5.982842156, 1.495710539, 0.3739276348,
+            0.09348190869, 0.02337047717, 0.005842619293, 0.001460654823,
+            0.0003651637058, 9.129092647e-05, 2.282273162e-05,
+        ],
+        [
+            401501740.6, 100375435.1, 25093858.79, 6273464.697, 1568366.174,
+            392091.5435, 98022.88589, 24505.72147, 6126.430368, 1531.607592, 382.901898,
+            95.7254745, 23.93136862, 5.982842156, 1.495710539, 0.3739276348,
+            0.09348190869, 0.02337047717, 0.005842619293, 0.001460654823,
+            0.0003651637058, 9.129092646e-05, 2.282273161e-05,
+        ],
+        [
+            401501740.6, 100375435.1, 25093858.79, 6273464.697, 1568366.174,
+            392091.5435, 98022.88589, 24505.72147, 6126.430368, 1531.607592, 382.901898,
+            95.7254745, 23.93136862, 5.982842156, 1.495710539, 0.3739276348,
+            0.09348190869, 0.02337047717, 0.005842619293, 0.001460654823,
+            0.0003651637058, 9.129092645e-05, 2.282273162e-05,
+        ],
+        [
+            401501740.6, 100375435.1, 25093858.79, 6273464.697, 1568366.174,
+            392091.5435, 98022.88589, 24505.72147, 6126.430368, 1531.607592, 382.901898,
+            95.7254745, 23.93136862, 5.982842156, 1.495710539, 0.3739276348,
+            0.09348190869, 0.02337047717, 0.005842619293, 0.001460654823,
+            0.0003651637058, 9.129092645e-05, 2.282273162e-05,
+        ],
+        [
+            401501740.6, 100375435.1, 25093858.79, 6273464.697, 1568366.174,
+            392091.5435, 98022.88589, 24505.72147, 6126.430368, 1531.607592, 382.901898,
+            95.7254745, 23.93136862, 5.982842156, 1.495710539, 0.3739276348,
+            0.09348190869, 0.02337047717, 0.005842619293, 0.001460654823,
+            0.0003651637059, 9.129092647e-05, 2.282273162e-05,
+        ],
+        [
+            401501740.6, 100375435.1, 25093858.79, 6273464.697, 1568366.174,
+            392091.5435, 98022.88589, 24505.72147, 6126.430368, 1531.607592, 382.901898,
+            95.7254745, 23.93136862, 5.982842156, 1.495710539, 0.3739276348,
+            0.09348190869, 0.02337047717, 0.005842619293, 0.001460654823,
+            0.0003651637058, 9.129092646e-05, 2.282273161e-05,
+        ],
+        [
+            401501740.6, 100375435.1, 25093858.79, 6273464.697, 1568366.174,
+            392091.5435, 98022.88589, 24505.72147, 6126.430368, 1531.607592, 382.901898,
+            95.7254745, 23.93136862, 5.982842156, 1.495710539, 0.3739276348,
+            0.09348190869, 0.02337047717, 0.005842619293, 0.001460654823,
+            0.0003651637058, 9.129092646e-05, 2.282273161e-05,
+        ],
+        [
+            401501740.6, 100375435.1, 25093858.79, 6273464.697, 1568366.174,
+            392091.5435, 98022.88589, 24505.72147, 6126.430368, 1531.607592, 382.901898,
+            95.7254745, 23.93136862, 5.982842156, 1.495710539, 0.3739276348,
+            0.09348190869, 0.02337047717, 0.005842619293, 0.001460654823,
+            0.0003651637058, 9.129092643e-05, 2.282273164e-05,
+        ],
+    ],
+}
+# fmt: on
@@ -1,26 +1,34 @@
 #!/usr/bin/python3
 from __future__ import annotations
 
-from typing import List, Tuple, Union, Any, Optional
+from typing import (
+    List,
+    Tuple,
+    Union,
+    Any,
+    Optional,
+    Iterator,
+    Iterable,
+    Callable,
+    cast,
+)
 from collections import namedtuple
+from itertools import chain, islice
 
-from h3 import h3
+import numpy as np
 import shapely
-from shapely import wkt
-import pyproj
+from shapely import wkb, wkt
 from functools import partial
-from shapely.ops import transform
 
-from babelgrid import quadtree, s2
+from babelgrid import area, profiling
+from babelgrid.backends import GridBackend, get_backend, grids
+from babelgrid.cache import get_cache
+from babelgrid.lazy import lazy_import
+from babelgrid.polyfill_cache import PolyfillCache
+from babelgrid.resolution import best_resolution
 
-VALID_GRIDS = ["s2", "h3", "bing"]  #'quadtree
-
-RESOLUTION_RANGE = {
-    "h3": range(0, 16),
-    "s2": range(0, 31),
-    "bing": range(1, 24),
-    "quadtree": range(1, 24),
-}
+# The process pool is imported on first use, see `babelgrid.lazy`
+parallel = lazy_import("babelgrid.parallel")
 
 ShapelyPolys = Union[
     shapely.geometry.polygon.Polygon, shapely.geometry.multipolygon.MultiPolygon,
@@ -28,11 +36,17 @@ ShapelyPolys = Union[
 
 Point = namedtuple("Point", "latitude longitude")
 
+BATCH_CHUNK_SIZE = 100_000
+
+POLYFILL_CHUNK_SIZE = 10_000
+
 
 class Conversors:
     # def __init__(self):
     #     pass
 
+    __slots__ = ()
+
     def any_to_shapely(
         self, polygon: Union[str, dict, ShapelyPolys, List[Any], Tuple[Any],],
     ) -> ShapelyPolys:
@@ -109,6 +123,12 @@ class Conversors:
 
 
 class Polygon(Conversors):
+    """Geometry of a tile. The geojson, wkt and centroid descriptions are
+    only built on first access and then memoized.
+    """
+
+    __slots__ = ("shapely", "_geojson", "_wkt", "_centroid")
+
     def __init__(
         self,
         polygon: Union[
@@ -124,14 +144,50 @@ class Polygon(Conversors):
             )
 
         self.shapely: shapely.geometry.polygon.Polygon = polygon
-        self.geojson: dict = self.from_shapely_to_geojson(polygon)
-        self.wkt: str = self.from_shapely_to_wkt(polygon)
-        self.centroid: Point = Point(
-            latitude=polygon.centroid.y, longitude=polygon.centroid.x
-        )
+        self._geojson: Optional[dict] = None
+        self._wkt: Optional[str] = None
+        self._centroid: Optional[Point] = None
+
+    @property
+    def geojson(self) -> dict:
+
+        if self._geojson is None:
+            with profiling.timer("serialization.geojson"):
+                self._geojson = self.from_shapely_to_geojson(self.shapely)
+
+        return self._geojson
+
+    @property
+    def wkt(self) -> str:
+
+        if self._wkt is None:
+            with profiling.timer("serialization.wkt"):
+                self._wkt = self.from_shapely_to_wkt(self.shapely)
+
+        return self._wkt
+
+    @property
+    def centroid(self) -> Point:
+
+        if self._centroid is None:
+            centroid = self.shapely.centroid
+            self._centroid = Point(latitude=centroid.y, longitude=centroid.x)
+
+        return self._centroid
+
+
+def _polyfill_wkb(grid_type: str, resolution: int, geometry: bytes) -> List[str]:
+    """Polyfill of a WKB polygon. Used by the process pool of `Babel.polyfill`."""
+
+    return list(
+        Babel(grid_type)._polyfill_ids(Polygon(wkb.loads(geometry)), resolution)
+    )
 
 
 class Babel:
+
+    __slots__ = ("grid_type",)
+
     def __init__(self, grid_type: str) -> None:
         """To start the magic, assign a grid_type.
 
@@ -145,18 +201,24 @@ class Babel:
 
     @staticmethod
     def available_grids() -> List:
-        return VALID_GRIDS
+        return grids()
+
+    @property
+    def backend(self) -> GridBackend:
+        """Backend of the grid, see `babelgrid.backends`"""
+
+        return get_backend(self.grid_type)
 
     def grid_range(self) -> range:
-        return RESOLUTION_RANGE[self.grid_type]
+        return self.backend.resolutions
 
     def _validate_grid(self, grid_type: str):
 
-        if grid_type.lower() not in VALID_GRIDS:
+        if grid_type.lower() not in grids():
             raise Exception(
-                f"{self.grid_type} is not a valid type. "
+                f"{grid_type} is not a valid type. "
                 "Try one of the following: "
-                f'{", ".join(VALID_GRIDS)}'
+                f'{", ".join(grids())}'
             )
         else:
             return grid_type.lower()
@@ -164,7 +226,8 @@ class Babel:
     def _best_resolution(self, lat: float, area_km: float) -> int:
         """Approximate best resolution given area in km squared.
 
-        TODO: This is not a very efficient method.
+        It is a binary search over precomputed tables of mean tile area by
+        resolution and latitude band, see `babelgrid.resolution`.
 
         Parameters
         ----------
@@ -177,16 +240,7 @@ class Babel:
             Best resolution
         """
 
-        return min(
-            zip(
-                self.grid_range(),
-                [
-                    abs(self.geo_to_tile(lat, 0, resolution).area_km - area_km)
-                    for resolution in self.grid_range()
-                ],
-            ),
-            key=lambda t: t[1],
-        )[0]
+        return best_resolution(self.grid_type, lat, area_km, self.grid_range())
 
     def _checks_resolution_option(
         self, resolution: Union[int, None], area_km: Union[float, None], latitude: float
@@ -239,21 +293,395 @@ class Babel:
 
         resolution = self._checks_resolution_option(resolution, area_km, lat)
 
-        if self.grid_type == "s2":
+        return self.id_to_tile(self.backend.index(lat, lon, resolution))
+
+    def geo_to_tiles(
+        self,
+        lats: Union[np.ndarray, List[float]],
+        lons: Union[np.ndarray, List[float]],
+        resolution: Union[int, None] = None,
+        area_km: Union[float, None] = None,
+        chunk_size: int = BATCH_CHUNK_SIZE,
+        as_int: bool = False,
+    ) -> np.ndarray:
+        """Map arrays of coordinates and a resolution to an array of tile ids.
+
+        It is the batch version of `geo_to_tile`. No Tile objects are built,
+        so it is the way to go to index large amounts of points.
+
+        ```
+        Babel('s2').geo_to_tiles(df.lat.values, df.lon.values, resolution=10)
+        ```
+
+        If `area_km` is given, the resolution is chosen at the mean latitude
+        of the points.
+
+        Parameters
+        ----------
+        lats : Union[np.ndarray, List[float]]
+        lons : Union[np.ndarray, List[float]]
+        resolution : int
+            Grid system resolution/zoom/size
+        area_km : float
+            Desired tile area in km squared
+        chunk_size : int
+            Number of points indexed per chunk
+        as_int : bool
+            If True, returns 64-bit integer ids instead of strings, see
+            `to_ints`
+
+        Returns
+        -------
+        np.ndarray
+            Array of tile ids
+        """
+
+        lats = np.asarray(lats, dtype=float).ravel()
+        lons = np.asarray(lons, dtype=float).ravel()
+
+        if lats.shape != lons.shape:
+            raise Exception(
+                f"lats and lons must have the same length: {len(lats)} != {len(lons)}"
+            )
+
+        resolution = self._checks_resolution_option(
+            resolution, area_km, float(lats.mean()) if len(lats) else 0.0
+        )
+
+        backend = self.backend
+        index = partial(
+            backend.index_int_batch if as_int else backend.index_batch,
+            resolution=resolution,
+        )
+
+        tile_ids: np.ndarray = np.empty(
+            len(lats), dtype=backend.int_dtype if as_int else object
+        )
+        for start in range(0, len(lats), chunk_size):
+            end = start + chunk_size
+            tile_ids[start:end] = index(lats[start:end], lons[start:end])
+
+        return tile_ids
+
+    def to_ints(self, tile_ids: Iterable[Union[str, int]]) -> np.ndarray:
+        """Converts tile ids to 64-bit integers. They take less memory and
+        hash faster than strings, and parent, children and resolution are
+        bit arithmetic on them.
+
+        - s2: cell id, as uint64 since it uses all 64 bits
+        - h3: h3 index, as int64
+        - bing: digits with 2 bits each, left aligned at level
+          `quadtree.QUADKEY_MAX_LEVEL`, and the level in the lowest 5 bits,
+          as int64. They sort as the quadkeys.
+
+        Parameters
+        ----------
+        tile_ids : Iterable[Union[str, int]]
+
+        Returns
+        -------
+        np.ndarray
+            Integer tile ids
+        """
+
+        backend = self.backend
+
+        if not isinstance(tile_ids, np.ndarray):
+            tile_ids = list(tile_ids)
+
+        if not any(isinstance(tile_id, (int, np.integer)) for tile_id in tile_ids):
+            return backend.to_ints(cast(Iterable[str], tile_ids))
+
+        return np.array(
+            [
+                tile_id
+                if isinstance(tile_id, (int, np.integer))
+                else backend.to_int(tile_id)
+                for tile_id in tile_ids
+            ],
+            dtype=backend.int_dtype,
+        )
+
+    def from_ints(self, tile_ints: Iterable[int]) -> np.ndarray:
+        """Converts 64-bit integer tile ids back to strings. It is the
+        inverse of `to_ints`.
+
+        Parameters
+        ----------
+        tile_ints : Iterable[int]
+
+        Returns
+        -------
+        np.ndarray
+            Array of tile ids
+        """
+
+        return self.backend.from_ints(np.asarray(tile_ints).ravel())
+
+    def int_parent(self, tile_int: int, resolution: Optional[int] = None) -> int:
+        """Parent of an integer tile id, by bit arithmetic.
+
+        Parameters
+        ----------
+        tile_int : int
+        resolution : int
+            Resolution of the ancestor, by default the resolution of the tile
+            minus one
+
+        Returns
+        -------
+        int
+        """
+
+        if resolution is not None:
+            self._check_coarser(self._as_int_array(tile_int), resolution)
+
+        return self.backend.int_parent(int(tile_int), resolution)
+
+    def int_children(
+        self, tile_int: int, resolution: Optional[int] = None
+    ) -> List[int]:
+        """Children of an integer tile id, by bit arithmetic.
+
+        Parameters
+        ----------
+        tile_int : int
+        resolution : int
+            Resolution of the descendants, by default the resolution of the
+            tile plus one
+
+        Returns
+        -------
+        List[int]
+        """
+
+        if resolution is not None:
+            self._check_finer(self._as_int_array(tile_int), resolution)
+
+        return self.backend.int_children(int(tile_int), resolution)
+
+    def int_resolution(self, tile_int: int) -> int:
+        """Resolution of an integer tile id, by bit arithmetic.
+
+        Parameters
+        ----------
+        tile_int : int
+
+        Returns
+        -------
+        int
+        """
+
+        return self.backend.int_resolution(int(tile_int))
+
+    def resolutions(self, tile_ids: Iterable[Union[str, int]]) -> np.ndarray:
+        """Batch resolution of tile ids, by bit arithmetic on their integer
+        ids. No Tile objects are built.
+
+        Parameters
+        ----------
+        tile_ids : Iterable[Union[str, int]]
+            String or 64-bit integer tile ids, see `to_ints`
+
+        Returns
+        -------
+        np.ndarray
+            Resolutions, as int64
+        """
+
+        tile_ints, _ = self._as_ints(tile_ids)
+
+        return self.backend.ints_resolution(tile_ints).astype(np.int64)
+
+    def parents(
+        self, tile_ids: Iterable[Union[str, int]], resolution: int
+    ) -> np.ndarray:
+        """Batch ancestors of tile ids at any coarser resolution, in a single
+        bit arithmetic step. No Tile objects are built, so it is the way to
+        go to roll up indexed points.
+
+        ```
+        tile_ints = Babel('s2').geo_to_tiles(lats, lons, 20, as_int=True)
+        Babel('s2').parents(tile_ints, 10)
+        ```
+
+        Parameters
+        ----------
+        tile_ids : Iterable[Union[str, int]]
+            String or 64-bit integer tile ids, with resolution from
+            `resolution`
+        resolution : int
+            Resolution of the ancestors
+
+        Returns
+        -------
+        np.ndarray
+            Ancestor ids, integers if `tile_ids` are integers and strings
+            otherwise
+        """
+
+        tile_ints, as_int = self._as_ints(tile_ids)
+        self._check_coarser(tile_ints, resolution)
+
+        parents = self.backend.ints_parent(tile_ints, resolution)
+
+        return parents if as_int else self.from_ints(parents)
+
+    def descendants(
+        self, tile_ids: Iterable[Union[str, int]], resolution: int
+    ) -> np.ndarray:
+        """Batch descendants of tile ids at any finer resolution, by bit
+        arithmetic. The descendants of each tile follow the order of
+        `tile_ids`.
+
+        Parameters
+        ----------
+        tile_ids : Iterable[Union[str, int]]
+            String or 64-bit integer tile ids, with resolution up to
+            `resolution`
+        resolution : int
+            Resolution of the descendants
 
-            tile_id = s2.geo_to_s2(lat, lon, resolution)
+        Returns
+        -------
+        np.ndarray
+            Descendant ids, integers if `tile_ids` are integers and strings
+            otherwise
+        """
 
-        elif self.grid_type == "h3":
+        tile_ints, as_int = self._as_ints(tile_ids)
+        self._check_finer(tile_ints, resolution)
 
-            tile_id = h3.geo_to_h3(lat, lon, resolution)
+        children = self.backend.ints_children(tile_ints, resolution)
 
-        elif self.grid_type in ("bing", "quadtree"):
+        return children if as_int else self.from_ints(children)
 
-            tile_id = quadtree.geo_to_tile(lat, lon, resolution)
+    def descendant_counts(
+        self, tile_ids: Iterable[Union[str, int]], resolution: int
+    ) -> np.ndarray:
+        """Batch number of descendants of tile ids at any finer resolution,
+        without enumerating them.
 
-        return self.id_to_tile(tile_id)
+        Parameters
+        ----------
+        tile_ids : Iterable[Union[str, int]]
+            String or 64-bit integer tile ids, with resolution up to
+            `resolution`
+        resolution : int
+            Resolution of the descendants
+
+        Returns
+        -------
+        np.ndarray
+            Number of descendants, as int64
+        """
 
-    def id_to_tile(self, tile_id: str) -> Tile:
+        tile_ints, _ = self._as_ints(tile_ids)
+        self._check_finer(tile_ints, resolution)
+
+        return self.backend.ints_children_count(tile_ints, resolution).astype(
+            np.int64
+        )
+
+    def _as_ints(self, tile_ids: Iterable[Union[str, int]]) -> Tuple[np.ndarray, bool]:
+        """Integer tile ids of tile_ids and whether they were integers."""
+
+        tile_ids = np.asarray(
+            tile_ids if isinstance(tile_ids, np.ndarray) else list(tile_ids)
+        ).ravel()
+
+        if tile_ids.dtype.kind in "iu":
+            return tile_ids.astype(self.backend.int_dtype), True
+
+        return self.to_ints(tile_ids), False
+
+    def _as_int_array(self, tile_int: int) -> np.ndarray:
+
+        return np.array([int(tile_int)], dtype=self.backend.int_dtype)
+
+    def _check_coarser(self, tile_ints: np.ndarray, resolution: int) -> None:
+
+        self._check_grid_resolution(resolution)
+
+        if len(tile_ints):
+            self._check_ancestor(
+                self.backend.ints_resolution(tile_ints).min(), resolution
+            )
+
+    def _check_finer(self, tile_ints: np.ndarray, resolution: int) -> None:
+
+        self._check_grid_resolution(resolution)
+
+        if len(tile_ints):
+            self._check_descendant(
+                self.backend.ints_resolution(tile_ints).max(), resolution
+            )
+
+    def _check_grid_resolution(self, resolution: int) -> None:
+
+        grid_range = self.grid_range()
+
+        if resolution not in grid_range:
+            raise Exception(
+                f"{resolution} is not a valid {self.grid_type} resolution. "
+                f"Try one from {grid_range[0]} to {grid_range[-1]}"
+            )
+
+    def _check_ancestor(self, tile_resolution: int, resolution: int) -> None:
+
+        if resolution > tile_resolution:
+            raise Exception(f"All tile ids must have a resolution from {resolution}")
+
+    def _check_descendant(self, tile_resolution: int, resolution: int) -> None:
+
+        if resolution < tile_resolution:
+            raise Exception(f"All tile ids must have a resolution up to {resolution}")
+
+    def neighbors(self, tile_id: str, k: int = 1) -> List[str]:
+        """Tile ids within k steps of a tile, the tile itself included.
+
+        - s2: each step adds the edge and vertex neighbors
+        - h3: k_ring
+        - bing: tiles within k in x and y, wrapping around the antimeridian
+
+        Parameters
+        ----------
+        tile_id : str
+        k : int
+            Number of steps
+
+        Returns
+        -------
+        List[str]
+            Tile ids, sorted as the grid polyfill returns them
+        """
+
+        return self.backend.neighbors(tile_id, k)
+
+    def neighbors_batch(self, tile_ids: Iterable[str], k: int = 1) -> np.ndarray:
+        """Batch version of `neighbors`. Tiles shared by the neighborhoods
+        of several tiles are returned once, so it dilates a set of tiles.
+
+        ```
+        region = Babel('h3').polyfill(geometry, 8, ids_only=True)
+        dilated = Babel('h3').neighbors_batch(region, k=2)
+        ```
+
+        Parameters
+        ----------
+        tile_ids : Iterable[str]
+        k : int
+            Number of steps
+
+        Returns
+        -------
+        np.ndarray
+            Tile ids, sorted as the grid polyfill returns them
+        """
+
+        return self.backend.neighbors_batch(tile_ids, k)
+
+    def id_to_tile(self, tile_id: Union[str, int]) -> Tile:
         """Maps tile id to a Tile object.
         
         The Tile object has nice properties. Let's say that `tile` is an
@@ -267,26 +695,130 @@ class Babel:
         tile.parent           --> to access the tile parent id
         tile.parent           --> to access the tile children id
         ```
+
+        Tile objects are kept in a bounded LRU cache per grid, see
+        `babelgrid.cache`.
+
         Parameters
         ----------
-        tile_id : str
+        tile_id : Union[str, int]
+            String or 64-bit integer tile id, see `to_ints`
 
         Returns
         -------
         Tile
         """
 
-        if self.grid_type == "s2":
+        if isinstance(tile_id, (int, np.integer)):
+            tile_id = self.backend.from_int(int(tile_id))
+
+        tiles = get_cache("tile", self.grid_type)
+
+        tile = tiles.get(tile_id)
+        if tile is None:
+            tile = Tile(tile_id, self.grid_type)
+            tiles.put(tile_id, tile)
+
+        return tile
+
+    def areas_km(
+        self, tiles: Iterable[Union[Tile, str]], geodesic: bool = False
+    ) -> np.ndarray:
+        """Batch version of `Tile.area_km`. All tiles are projected at once.
+
+        Parameters
+        ----------
+        tiles : Iterable[Union[Tile, str]]
+            Tile objects or tile ids of this grid
+        geodesic : bool
+            If True, the area is computed on the WGS84 ellipsoid instead of
+            Web Mercator (EPSG:3857)
+
+        Returns
+        -------
+        np.ndarray
+            Areas in km squared
+        """
+
+        return np.round(area.polygons_area_km(self.boundaries(tiles), geodesic), 10)
+
+    def boundaries(
+        self, tiles: Iterable[Union[Tile, str]]
+    ) -> List[shapely.geometry.polygon.Polygon]:
+        """Batch version of `Tile.geometry.shapely`. The boundaries of tiles
+        that have not built their geometry yet are computed at once by the
+        grid backend.
+
+        Parameters
+        ----------
+        tiles : Iterable[Union[Tile, str]]
+            Tile objects or tile ids of this grid
+
+        Returns
+        -------
+        List[shapely.geometry.polygon.Polygon]
+        """
+
+        tiles = list(tiles)
+        polygons: List[Any] = [None] * len(tiles)
+
+        pending, tile_ids = [], []
+        for i, tile in enumerate(tiles):
+            if not isinstance(tile, Tile):
+                pending.append(i)
+                tile_ids.append(tile)
+            elif tile._has_geometry():
+                polygons[i] = tile.geometry.shapely
+            else:
+                pending.append(i)
+                tile_ids.append(tile.tile_id)
+
+        for i, polygon in zip(pending, self.backend.boundaries(tile_ids)):
+            polygons[i] = polygon
+
+        return polygons
+
+    def compact(self, tile_ids: Iterable[str]) -> List[str]:
+        """Compacts a set of tile ids. Complete groups of siblings are merged
+        into their parent, recursively, so a polyfill interior is described
+        by a few coarse tiles.
 
-            return Tile(s2.s2_to_geo_boundary(tile_id, True), tile_id, self.grid_type)
+        ```
+        tile_ids = Babel('s2').polyfill(geometry, 16, ids_only=True)
+        compacted = Babel('s2').compact(tile_ids)
+        ```
 
-        elif self.grid_type == "h3":
+        Parameters
+        ----------
+        tile_ids : Iterable[str]
+            Tile ids, of any resolution
 
-            return Tile(h3.h3_to_geo_boundary(tile_id, True), tile_id, self.grid_type)
+        Returns
+        -------
+        List[str]
+            Mixed resolution tile ids
+        """
+
+        return self.backend.compact(tile_ids)
+
+    def uncompact(self, tile_ids: Iterable[str], resolution: int) -> List[str]:
+        """Expands tile ids to all their descendants at a resolution. It is
+        the inverse of `compact`.
+
+        Parameters
+        ----------
+        tile_ids : Iterable[str]
+            Tile ids, with resolution up to `resolution`
+        resolution : int
+            Grid system resolution/zoom/size
 
-        elif self.grid_type in ("bing", "quadtree"):
+        Returns
+        -------
+        List[str]
+            Tile ids at `resolution`
+        """
 
-            return Tile(quadtree.tile_to_geo_boundary(tile_id), tile_id, self.grid_type)
+        return self.backend.uncompact(tile_ids, resolution)
 
     def polyfill(
         self,
@@ -298,12 +830,16 @@ class Babel:
         ],
         resolution: Union[int, None] = None,
         area_km: Union[float, None] = None,
-    ) -> List[Tile]:
+        ids_only: bool = False,
+        processes: Optional[int] = None,
+        disk_cache: Optional[PolyfillCache] = None,
+    ) -> Union[List[Tile], List[str]]:
         """Fill an arbitrary geometry with tiles of a given resolution or tile area.
 
         It accepts Polygons or MultiPolygons.
 
-        It returns a list of Tile objects.
+        It returns a list of Tile objects or, if `ids_only` is True, a list
+        of tile ids.
 
         A Tile object has nice properties. Let's say that `tile` is an
         object from the Tile class.
@@ -320,7 +856,9 @@ class Babel:
         You can easily turn it into a geopandas GeoDataFrame
 
         ```
-        gpd.GeoDataFrame([t.to_dict() for t in Babel('h3').polyfill(geometry, resolution=2)])
+        from babelgrid.export import to_geodataframe
+
+        to_geodataframe(Babel('h3').polyfill(geometry, resolution=2))
         ```
 
         Or plot your result with folium with few lines:
@@ -334,6 +872,15 @@ class Babel:
         m
         ```
 
+        Large geometries can be filled in parallel with `processes` worker
+        processes. The work is split by polygon part and large parts are cut
+        in partitions. Tile ids are returned in the same order as the serial
+        polyfill.
+
+        With a `disk_cache`, the tile ids are stored on disk by geometry,
+        grid type and resolution, and later calls with the same geometry
+        skip the polyfill, see `babelgrid.polyfill_cache`.
+
         Parameters
         ----------
         geometry : Union[str, dict, shapely.geometry.polygon.Polygon, shapely.geometry.multipolygon.MultiPolygon]
@@ -341,13 +888,248 @@ class Babel:
             are prefered.
         resolution : int
             Grid system resolution/zoom/size
+        area_km : float
+            Desired tile area in km squared
+        ids_only : bool
+            If True, returns tile ids instead of Tile objects
+        processes : int, optional
+            If given, the polyfill runs in a pool of this many processes
+        disk_cache : PolyfillCache, optional
+            Persistent cache of polyfills to read from and write to
 
         Returns
         -------
-        List[Tile]
+        Union[List[Tile], List[str]]
         """
 
-        flatten = lambda l: [item for sublist in l for item in sublist]
+        with profiling.timer("polyfill"):
+
+            if disk_cache is None:
+                tiles = self._polyfill_all(
+                    geometry, resolution, area_km, ids_only, processes
+                )
+            else:
+                tiles = self._polyfill_cached(
+                    disk_cache, geometry, resolution, area_km, ids_only, processes
+                )
+
+        profiling.count("polyfill.tiles_kept", len(tiles))
+
+        return tiles
+
+    def _polyfill_all(
+        self,
+        geometry: Union[
+            str,
+            dict,
+            shapely.geometry.polygon.Polygon,
+            shapely.geometry.multipolygon.MultiPolygon,
+        ],
+        resolution: Union[int, None],
+        area_km: Union[float, None],
+        ids_only: bool,
+        processes: Optional[int],
+    ) -> Union[List[Tile], List[str]]:
+
+        geometries, resolution = self._prepare_polyfill(geometry, resolution, area_km)
+
+        if processes is not None:
+
+            tile_ids = parallel.polyfill_ids(
+                partial(_polyfill_wkb, self.grid_type, resolution),
+                [geom.shapely for geom in geometries],
+                processes,
+                sort_key=self.backend.sort_key,
+            )
+
+            if ids_only:
+                return tile_ids
+
+            with profiling.timer("polyfill.tiles"):
+                return [Tile(tile_id, self.grid_type) for tile_id in tile_ids]
+
+        if ids_only:
+            return list(
+                chain.from_iterable(
+                    self._polyfill_ids(geom, resolution) for geom in geometries
+                )
+            )
+
+        return list(
+            chain.from_iterable(self._polyfill(geom, resolution) for geom in geometries)
+        )
+
+    def _polyfill_cached(
+        self,
+        disk_cache: PolyfillCache,
+        geometry: Union[
+            str,
+            dict,
+            shapely.geometry.polygon.Polygon,
+            shapely.geometry.multipolygon.MultiPolygon,
+        ],
+        resolution: Union[int, None],
+        area_km: Union[float, None],
+        ids_only: bool,
+        processes: Optional[int],
+    ) -> Union[List[Tile], List[str]]:
+
+        raw_geometry = Conversors().any_to_shapely(geometry)
+        resolution = self._checks_resolution_option(
+            resolution, area_km, raw_geometry.centroid.y
+        )
+
+        cached_ids = disk_cache.get(raw_geometry, self.backend.name, resolution)
+
+        if cached_ids is None:
+            tile_ids = cast(
+                List[str],
+                self._polyfill_all(raw_geometry, resolution, None, True, processes),
+            )
+            disk_cache.put(raw_geometry, self.backend.name, resolution, tile_ids)
+        else:
+            profiling.count("polyfill.disk_cache_hits")
+            tile_ids = cached_ids
+
+        if ids_only:
+            return tile_ids
+
+        with profiling.timer("polyfill.tiles"):
+            return [Tile(tile_id, self.grid_type) for tile_id in tile_ids]
+
+    def polyfill_iter(
+        self,
+        geometry: Union[
+            str,
+            dict,
+            shapely.geometry.polygon.Polygon,
+            shapely.geometry.multipolygon.MultiPolygon,
+        ],
+        resolution: Union[int, None] = None,
+        area_km: Union[float, None] = None,
+        ids_only: bool = False,
+        chunk_size: int = POLYFILL_CHUNK_SIZE,
+    ) -> Iterator[Union[List[Tile], List[str]]]:
+        """Streaming version of `polyfill`. It yields lists of at most
+        `chunk_size` tiles as they are produced, so the full result set is
+        never held in memory.
+
+        ```
+        for chunk in Babel('s2').polyfill_iter(geometry, 18, ids_only=True):
+            writer.write(chunk)
+        ```
+
+        Parameters
+        ----------
+        geometry : Union[str, dict, shapely.geometry.polygon.Polygon, shapely.geometry.multipolygon.MultiPolygon]
+            Arbitrary geometry. It accepts geojson and wkt, but shapely Objects
+            are prefered.
+        resolution : int
+            Grid system resolution/zoom/size
+        area_km : float
+            Desired tile area in km squared
+        ids_only : bool
+            If True, yields tile ids instead of Tile objects
+        chunk_size : int
+            Maximum number of tiles per chunk
+
+        Yields
+        ------
+        Union[List[Tile], List[str]]
+        """
+
+        geometries, resolution = self._prepare_polyfill(geometry, resolution, area_km)
+
+        tile_ids = chain.from_iterable(
+            self._polyfill_ids(geom, resolution) for geom in geometries
+        )
+
+        while True:
+
+            chunk = list(islice(tile_ids, chunk_size))
+
+            if not chunk:
+                return
+
+            if ids_only:
+                yield chunk
+            else:
+                yield [Tile(tile_id, self.grid_type) for tile_id in chunk]
+
+    def polyfill_adaptive(
+        self,
+        geometry: Union[
+            str,
+            dict,
+            shapely.geometry.polygon.Polygon,
+            shapely.geometry.multipolygon.MultiPolygon,
+        ],
+        resolution: Union[int, None] = None,
+        area_km: Union[float, None] = None,
+        max_cells: Optional[int] = None,
+        ids_only: bool = False,
+    ) -> Union[List[Tile], List[str]]:
+        """Cover a geometry with tiles of mixed resolutions. Tiles inside the
+        geometry are as coarse as possible and tiles on its boundary are
+        refined down to `resolution`, or `area_km`, while the cover has at
+        most `max_cells` tiles.
+
+        ```
+        Babel('s2').polyfill_adaptive(country, resolution=16, max_cells=5000)
+        ```
+
+        Without `max_cells`, the cover holds the same area as `polyfill`
+        with far fewer tiles. With it, boundary tiles that would exceed the
+        budget are not refined, so the cover spills over the boundary with
+        coarser tiles. For h3, whose children do not tile their parent
+        exactly, the cover is the compacted polyfill coarsened from the
+        finest hexagons up.
+
+        Parameters
+        ----------
+        geometry : Union[str, dict, shapely.geometry.polygon.Polygon, shapely.geometry.multipolygon.MultiPolygon]
+            Arbitrary geometry. It accepts geojson and wkt, but shapely Objects
+            are prefered.
+        resolution : int
+            Finest grid system resolution/zoom/size
+        area_km : float
+            Desired area in km squared of the finest tiles
+        max_cells : int, optional
+            Tile budget of the cover
+        ids_only : bool
+            If True, returns tile ids instead of Tile objects
+
+        Returns
+        -------
+        Union[List[Tile], List[str]]
+        """
+
+        geometries, resolution = self._prepare_polyfill(geometry, resolution, area_km)
+
+        tile_ids = self.backend.polyfill_adaptive(geometries, resolution, max_cells)
+
+        if ids_only:
+            return tile_ids
+
+        return [Tile(tile_id, self.grid_type) for tile_id in tile_ids]
+
+    def _prepare_polyfill(
+        self,
+        geometry: Union[
+            str,
+            dict,
+            shapely.geometry.polygon.Polygon,
+            shapely.geometry.multipolygon.MultiPolygon,
+        ],
+        resolution: Union[int, None],
+        area_km: Union[float, None],
+    ) -> Tuple[List[Polygon], int]:
+        """Splits geometry in Polygons and resolves the polyfill resolution.
+
+        Returns
+        -------
+        Tuple[List[Polygon], int]
+        """
 
         raw_geometry = Conversors().any_to_shapely(geometry)
 
@@ -360,55 +1142,91 @@ class Babel:
             resolution, area_km, raw_geometry.centroid.y
         )
 
-        return flatten([self._polyfill(geom, resolution) for geom in geometries])
+        return geometries, resolution
 
-    def _polyfill(
-        self, geometry: shapely.geometry.polygon.Polygon, resolution: int
-    ) -> List[Tile]:
-        """Internal polyfill. Calls grids polyfills accordinly.
+    def _polyfill(self, geometry: Polygon, resolution: int) -> List[Tile]:
+        """Internal polyfill. Wraps the filled tile ids in Tile objects.
 
         Parameters
         ----------
-        geometry : shapely.geometry.polygon.Polygon
+        geometry : Polygon
         resolution : int
 
         Returns
         -------
         List[Tile]
         """
-        if self.grid_type == "s2":
 
-            return [
-                Tile(geo["geometry"], geo["id"], "s2")
-                for geo in s2.polyfill(geometry.geojson, resolution, True, with_id=True)
-            ]
+        with profiling.timer("polyfill.ids"):
+            tile_ids = list(self._polyfill_ids(geometry, resolution))
 
-        elif self.grid_type == "h3":
+        with profiling.timer("polyfill.tiles"):
+            return [Tile(tile_id, self.grid_type) for tile_id in tile_ids]
 
-            return [
-                Tile(h3.h3_to_geo_boundary(tile_id, True), tile_id, "h3")
-                for tile_id in h3.polyfill_geojson(geometry.geojson, resolution)
-            ]
+    def _polyfill_ids(self, geometry: Polygon, resolution: int) -> Iterable[str]:
+        """Internal polyfill. Calls the grid backend polyfill.
 
-        elif self.grid_type in ("bing", "quadtree"):
+        Parameters
+        ----------
+        geometry : Polygon
+        resolution : int
+
+        Returns
+        -------
+        Iterable[str]
+            Tile ids
+        """
 
-            return [
-                Tile(quadtree.tile_to_geo_boundary(tile_id), tile_id, self.grid_type)
-                for tile_id in quadtree.polyfill(geometry.shapely, resolution)
-            ]
+        return self.backend.polyfill(geometry, resolution)
 
 
 class Tile(Babel):
+    """A tile only holds its id and grid type. The geometry is built on first
+    access of `tile.geometry` and then memoized.
+
+    If the boundary is already at hand, it can be passed as `polygon` to skip
+    its computation. It is keyword-only, so that calls with the former
+    `Tile(polygon, tile_id, grid_type)` order fail instead of building a
+    wrong Tile.
+    """
+
+    __slots__ = ("tile_id", "_polygon", "_geometry")
+
     def __init__(
         self,
-        polygon: Union[str, dict, shapely.geometry.polygon.Polygon],
         tile_id: str,
         grid_type: str,
+        *,
+        polygon: Union[str, dict, shapely.geometry.polygon.Polygon, None] = None,
     ) -> None:
 
-        self.geometry: Polygon = Polygon(polygon)
         self.tile_id: str = tile_id
         self.grid_type: str = grid_type
+        self._polygon = polygon
+        self._geometry: Optional[Polygon] = None
+
+        if profiling.current is not None:
+            profiling.current.count("tile.created")
+
+    def _has_geometry(self) -> bool:
+        """Whether the geometry is built or was passed in."""
+
+        return self._geometry is not None or self._polygon is not None
+
+    @property
+    def geometry(self) -> Polygon:
+
+        if self._geometry is None:
+
+            with profiling.timer("tile.geometry"):
+
+                if self._polygon is None:
+                    self._geometry = Polygon(self.backend.boundary(self.tile_id))
+                else:
+                    self._geometry = Polygon(self._polygon)
+                    self._polygon = None
+
+        return self._geometry
 
     def __str__(self) -> str:
 
@@ -424,58 +1242,71 @@ class Tile(Babel):
             "grid_type": self.grid_type,
             "tile_id": self.tile_id,
             "resolution": self.resolution,
-            "parent_id": self.to_parent().tile_id,
-            "children_id": [cid.tile_id for cid in self.to_children()],
+            "parent_id": self.backend.parent(self.tile_id),
+            "children_id": list(self.backend.children(self.tile_id)),
             "geojson": self.geometry.geojson,
             "wkt": self.geometry.wkt,
             "shapely": self.geometry.shapely,
             "centroid": self.geometry.centroid,
         }
 
-    def to_parent(self) -> Tile:
+    def to_parent(self, resolution: Optional[int] = None) -> Tile:
         """Maps current tile to parent Tile object.
 
+        Parameters
+        ----------
+        resolution : int, optional
+            Resolution of the ancestor, by default the resolution of the tile
+            minus one
+
         Returns
         -------
         Tile
         """
 
-        if self.grid_type == "s2":
-
-            parent_id = s2.s2_to_parent(self.tile_id)
-
-        elif self.grid_type == "h3":
-
-            parent_id = h3.h3_to_parent(self.tile_id)
-
-        elif self.grid_type in ("bing", "quadtree"):
-
-            parent_id = quadtree.tile_to_parent(self.tile_id)
+        if resolution is not None:
+            self._check_grid_resolution(resolution)
+            self._check_ancestor(self.resolution, resolution)
 
-        return self.id_to_tile(parent_id)
+        return self.id_to_tile(self.backend.parent(self.tile_id, resolution))
 
-    def to_children(self) -> List[Tile]:
+    def to_children(self, resolution: Optional[int] = None) -> List[Tile]:
         """Maps current tile to children Tile objects
 
+        Parameters
+        ----------
+        resolution : int, optional
+            Resolution of the descendants, by default the resolution of the
+            tile plus one
+
         Returns
         -------
         List[Tile]
             List of children Tile objects
         """
 
-        if self.grid_type == "s2":
+        if resolution is not None:
+            self._check_grid_resolution(resolution)
+            self._check_descendant(self.resolution, resolution)
 
-            children_ids = s2.s2_to_children(self.tile_id)
+        return [
+            self.id_to_tile(cid)
+            for cid in self.backend.children(self.tile_id, resolution)
+        ]
 
-        elif self.grid_type == "h3":
+    def to_neighbors(self, k: int = 1) -> List[Tile]:
+        """Maps current tile to the Tile objects within k steps, itself
+        included, see `Babel.neighbors`
 
-            children_ids = h3.h3_to_children(self.tile_id)
-
-        elif self.grid_type in ("bing", "quadtree"):
-
-            children_ids = quadtree.tile_to_children(self.tile_id)
+        Returns
+        -------
+        List[Tile]
+        """
 
-        return [self.id_to_tile(cid) for cid in children_ids]
+        return [
+            self.id_to_tile(nid)
+            for nid in self.backend.neighbors(self.tile_id, k)
+        ]
 
     @property
     def resolution(self) -> int:
@@ -491,35 +1322,28 @@ class Tile(Babel):
             Resolution/zoom/size
         """
 
-        if self.grid_type == "s2":
-
-            return s2.s2_get_resolution(self.tile_id)
-
-        elif self.grid_type == "h3":
-
-            return h3.h3_get_resolution(self.tile_id)
+        return self.backend.resolution(self.tile_id)
 
-        elif self.grid_type in ("bing", "quadtree"):
+    @property
+    def tile_int(self) -> int:
+        """Tile id as a 64-bit integer, see `Babel.to_ints`"""
 
-            return quadtree.tile_get_resolution(self.tile_id)
+        return self.backend.to_int(self.tile_id)
 
     @property
     def area_km(self) -> float:
         """Tile area in km squared
         """
 
-        return round(
-            transform(
-                partial(
-                    pyproj.transform,
-                    pyproj.Proj("epsg:4326"),
-                    pyproj.Proj("epsg:3857"),
-                ),
-                self.geometry.shapely,
-            ).area
-            / 10 ** 6,
-            10,
-        )
+        return round(area.polygon_area_km(self.geometry.shapely), 10)
+
+    @property
+    def area_km_geodesic(self) -> float:
+        """Tile area in km squared on the WGS84 ellipsoid. Unlike `area_km`,
+        it is not distorted by the Web Mercator projection at high latitudes.
+        """
+
+        return round(area.polygon_area_km(self.geometry.shapely, geodesic=True), 10)
 
 
 if __name__ == "__main__":
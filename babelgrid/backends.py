@@ -0,0 +1,808 @@
+"""Grid backends.
+
+Each grid is implemented by a backend registered under its grid type.
+`Babel` and `Tile` resolve the backend once per call and delegate to it,
+so a faster implementation of a grid, or a new grid, can be registered
+without touching them.
+
+A backend must implement the scalar operations on string tile ids and
+their 64-bit integer versions. The batch operations, on arrays of ids or
+points, default to loops over the scalar ones and are overridden with
+vectorized versions where the grid allows it.
+
+```
+from babelgrid.backends import QuadkeyBackend, register_backend
+
+class MyQuadkeyBackend(QuadkeyBackend):
+
+    name = "bing"
+
+    def index_batch(self, lats, lons, resolution):
+        ...
+
+register_backend(MyQuadkeyBackend())
+```
+"""
+
+import abc
+from collections import defaultdict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+import shapely
+from shapely import wkt
+from shapely.geometry import Polygon
+
+from babelgrid.cache import cached
+from babelgrid.lazy import lazy_import
+
+h3 = lazy_import("h3", "h3")
+s2 = lazy_import("babelgrid.s2")
+quadtree = lazy_import("babelgrid.quadtree")
+
+
+class GridBackend(abc.ABC):
+    """Operations of a grid. Subclasses set `name` and `resolutions` and
+    implement the scalar operations, which are abstract, so an incomplete
+    backend cannot be instantiated. Geometries passed to the polyfills are
+    `babelgrid.Polygon` objects, with `shapely` and `geojson` attributes.
+    """
+
+    name: str = ""
+
+    resolutions: range = range(0)
+
+    # dtype of the integer tile ids
+    int_dtype: type = np.int64
+
+    # Key that sorts tile ids as `polyfill` returns them, if it returns
+    # them sorted
+    sort_key: Optional[Callable[[str], Any]] = None
+
+    # Scalar operations
+
+    @abc.abstractmethod
+    def index(self, lat: float, lon: float, resolution: int) -> str:
+        """Tile id of the tile that contains a point."""
+
+    @abc.abstractmethod
+    def boundary(self, tile_id: str) -> Union[str, Sequence[Sequence[float]]]:
+        """Boundary in a format accepted by `babelgrid.Polygon`: geojson
+        conformant coordinates or a wkt string."""
+
+    @abc.abstractmethod
+    def parent(self, tile_id: str, resolution: Optional[int] = None) -> str:
+        """Ancestor at resolution, by default the direct parent."""
+
+    @abc.abstractmethod
+    def children(self, tile_id: str, resolution: Optional[int] = None) -> List[str]:
+        """Descendants at resolution, by default the direct children."""
+
+    @abc.abstractmethod
+    def resolution(self, tile_id: str) -> int:
+        """Resolution of a tile id."""
+
+    @abc.abstractmethod
+    def neighbors(self, tile_id: str, k: int = 1) -> List[str]:
+        """Tiles within k steps of a tile, itself included, sorted."""
+
+    @abc.abstractmethod
+    def polyfill(self, geometry: Any, resolution: int) -> Iterable[str]:
+        """Tile ids of a Polygon at resolution."""
+
+    @abc.abstractmethod
+    def polyfill_adaptive(
+        self, geometries: List[Any], resolution: int, max_cells: Optional[int]
+    ) -> List[str]:
+        """Mixed resolution cover of Polygons, with at most max_cells tiles."""
+
+    @abc.abstractmethod
+    def compact(self, tile_ids: Iterable[str]) -> List[str]:
+        """Replaces complete sets of siblings by their parent."""
+
+    @abc.abstractmethod
+    def uncompact(self, tile_ids: Iterable[str], resolution: int) -> List[str]:
+        """Expands tile ids to their descendants at resolution."""
+
+    @abc.abstractmethod
+    def to_int(self, tile_id: str) -> int:
+        """64-bit integer id of a tile id."""
+
+    @abc.abstractmethod
+    def from_int(self, tile_int: int) -> str:
+        """Tile id of a 64-bit integer id."""
+
+    @abc.abstractmethod
+    def int_parent(self, tile_int: int, resolution: Optional[int] = None) -> int:
+        """`parent` of an integer id."""
+
+    @abc.abstractmethod
+    def int_children(
+        self, tile_int: int, resolution: Optional[int] = None
+    ) -> List[int]:
+        """`children` of an integer id."""
+
+    @abc.abstractmethod
+    def int_resolution(self, tile_int: int) -> int:
+        """`resolution` of an integer id."""
+
+    # Batch operations
+
+    def index_batch(
+        self, lats: np.ndarray, lons: np.ndarray, resolution: int
+    ) -> np.ndarray:
+
+        index = self.index
+
+        return np.array(
+            [
+                index(lat, lon, resolution)
+                for lat, lon in zip(lats.tolist(), lons.tolist())
+            ],
+            dtype=object,
+        )
+
+    def index_int_batch(
+        self, lats: np.ndarray, lons: np.ndarray, resolution: int
+    ) -> np.ndarray:
+
+        return self.to_ints(self.index_batch(lats, lons, resolution))
+
+    def boundaries(self, tile_ids: Iterable[str]) -> List[Polygon]:
+        """Boundaries of tile ids as shapely Polygons, with the same vertices
+        as `boundary`."""
+
+        polygons = []
+        for tile_id in tile_ids:
+            boundary = self.boundary(tile_id)
+            polygons.append(
+                wkt.loads(boundary) if isinstance(boundary, str) else Polygon(boundary)
+            )
+
+        return polygons
+
+    def to_ints(self, tile_ids: Iterable[str]) -> np.ndarray:
+
+        return np.array([self.to_int(t) for t in tile_ids], dtype=self.int_dtype)
+
+    def from_ints(self, tile_ints: np.ndarray) -> np.ndarray:
+
+        return np.array([self.from_int(t) for t in tile_ints.tolist()], dtype=object)
+
+    def ints_resolution(self, tile_ints: np.ndarray) -> np.ndarray:
+
+        return np.array(
+            [self.int_resolution(t) for t in tile_ints.tolist()], dtype=np.int64
+        )
+
+    def ints_parent(self, tile_ints: np.ndarray, resolution: int) -> np.ndarray:
+
+        return np.array(
+            [self.int_parent(t, resolution) for t in tile_ints.tolist()],
+            dtype=self.int_dtype,
+        )
+
+    def ints_children(self, tile_ints: np.ndarray, resolution: int) -> np.ndarray:
+
+        return np.array(
+            [
+                child
+                for tile_int in tile_ints.tolist()
+                for child in self.int_children(tile_int, resolution)
+            ],
+            dtype=self.int_dtype,
+        )
+
+    def ints_children_count(self, tile_ints: np.ndarray, resolution: int) -> np.ndarray:
+
+        return np.array(
+            [len(self.int_children(t, resolution)) for t in tile_ints.tolist()],
+            dtype=np.int64,
+        )
+
+    def neighbors_batch(self, tile_ids: Iterable[str], k: int = 1) -> np.ndarray:
+
+        neighbors = set().union(*(self.neighbors(t, k) for t in tile_ids))
+
+        return np.array(sorted(neighbors, key=self.sort_key), dtype=object)
+
+
+def _s2_sort_key(tile_id: str) -> int:
+
+    return s2.s2_token_to_id(tile_id)
+
+
+class S2Backend(GridBackend):
+
+    name = "s2"
+
+    resolutions = range(0, 31)
+
+    # s2 cell ids use all 64 bits
+    int_dtype = np.uint64
+
+    # Tokens sort as their cell ids
+    sort_key = staticmethod(_s2_sort_key)
+
+    def index(self, lat: float, lon: float, resolution: int) -> str:
+
+        return s2.geo_to_s2(lat, lon, resolution)
+
+    def boundary(self, tile_id: str) -> List[List[float]]:
+
+        return s2.s2_to_geo_boundary(tile_id, True)
+
+    def boundaries(self, tile_ids: Iterable[str]) -> List[Polygon]:
+
+        return [
+            Polygon(boundary)
+            for boundary in s2._ids_to_geo_boundaries(self.to_ints(tile_ids), True)
+        ]
+
+    def parent(self, tile_id: str, resolution: Optional[int] = None) -> str:
+
+        return s2.s2_to_parent(tile_id, resolution)
+
+    def children(self, tile_id: str, resolution: Optional[int] = None) -> List[str]:
+
+        return s2.s2_to_children(tile_id, resolution)
+
+    def resolution(self, tile_id: str) -> int:
+
+        return s2.s2_get_resolution(tile_id)
+
+    def neighbors(self, tile_id: str, k: int = 1) -> List[str]:
+
+        return s2.s2_to_neighbors(tile_id, k)
+
+    def polyfill(self, geometry: Any, resolution: int) -> Iterable[str]:
+
+        return s2.polyfill_ids(geometry.geojson, resolution)
+
+    def polyfill_adaptive(
+        self, geometries: List[Any], resolution: int, max_cells: Optional[int]
+    ) -> List[str]:
+
+        return s2.polyfill_adaptive_ids(
+            shapely.geometry.mapping(
+                shapely.geometry.MultiPolygon([geom.shapely for geom in geometries])
+            ),
+            resolution,
+            max_cells,
+        )
+
+    def compact(self, tile_ids: Iterable[str]) -> List[str]:
+
+        return s2.compact(tile_ids)
+
+    def uncompact(self, tile_ids: Iterable[str], resolution: int) -> List[str]:
+
+        return s2.uncompact(tile_ids, resolution)
+
+    def to_int(self, tile_id: str) -> int:
+
+        return s2.s2_token_to_id(tile_id)
+
+    def from_int(self, tile_int: int) -> str:
+
+        return s2.s2_id_to_token(tile_int)
+
+    def int_parent(self, tile_int: int, resolution: Optional[int] = None) -> int:
+
+        return s2.s2_id_to_parent(tile_int, resolution)
+
+    def int_children(
+        self, tile_int: int, resolution: Optional[int] = None
+    ) -> List[int]:
+
+        return s2.s2_id_to_children(tile_int, resolution)
+
+    def int_resolution(self, tile_int: int) -> int:
+
+        return s2.s2_id_get_resolution(tile_int)
+
+    def index_batch(
+        self, lats: np.ndarray, lons: np.ndarray, resolution: int
+    ) -> np.ndarray:
+
+        return s2.geo_to_s2_batch(lats, lons, resolution)
+
+    def index_int_batch(
+        self, lats: np.ndarray, lons: np.ndarray, resolution: int
+    ) -> np.ndarray:
+
+        return s2.geo_to_s2_id_batch(lats, lons, resolution)
+
+    def ints_resolution(self, tile_ints: np.ndarray) -> np.ndarray:
+
+        return s2.s2_ids_get_resolution_batch(tile_ints)
+
+    def ints_parent(self, tile_ints: np.ndarray, resolution: int) -> np.ndarray:
+
+        return s2.s2_ids_to_parent_batch(tile_ints, resolution)
+
+    def ints_children(self, tile_ints: np.ndarray, resolution: int) -> np.ndarray:
+
+        return s2.s2_ids_to_children_batch(tile_ints, resolution)
+
+    def ints_children_count(self, tile_ints: np.ndarray, resolution: int) -> np.ndarray:
+
+        return s2.s2_ids_children_count_batch(tile_ints, resolution)
+
+
+@cached("boundary", "h3")
+def _h3_to_geo_boundary(tile_id: str) -> Tuple[Tuple[float, float], ...]:
+
+    return h3.h3_to_geo_boundary(tile_id, True)
+
+
+# Base cells of the 12 h3 pentagons, which have no children on digit 1
+H3_PENTAGON_BASE_CELLS = frozenset([4, 14, 24, 38, 49, 58, 63, 72, 83, 97, 107, 117])
+
+
+def _h3_drop_covered(tile_ids: Set[str]) -> Set[str]:
+    """Drops the ids that have an ancestor in tile_ids. h3 compact and
+    uncompact would return both."""
+
+    return {
+        tile_id
+        for tile_id in tile_ids
+        if not any(
+            h3.h3_to_parent(tile_id, resolution) in tile_ids
+            for resolution in range(h3.h3_get_resolution(tile_id))
+        )
+    }
+
+
+def _h3_compact(tile_ids: Set[str]) -> List[str]:
+    """h3 compact only accepts sets with no id covered by another and fails
+    on some mixed resolution sets, so those are merged level by level."""
+
+    tile_ids = _h3_drop_covered(tile_ids)
+    resolutions = {h3.h3_get_resolution(tile_id) for tile_id in tile_ids}
+
+    if len(resolutions) < 2:
+        return list(h3.compact(tile_ids))
+
+    for resolution in range(max(resolutions), 0, -1):
+
+        siblings = defaultdict(list)
+        for tile_id in tile_ids:
+            if h3.h3_get_resolution(tile_id) == resolution:
+                siblings[h3.h3_to_parent(tile_id, resolution - 1)].append(tile_id)
+
+        for parent, children in siblings.items():
+            if len(children) == (6 if h3.h3_is_pentagon(parent) else 7):
+                tile_ids.difference_update(children)
+                tile_ids.add(parent)
+
+    return list(tile_ids)
+
+
+def _h3_int_resolution(h: int) -> int:
+
+    return (h >> 52) & 0xF
+
+
+def _h3_int_parent(h: int, resolution: Optional[int] = None) -> int:
+
+    if resolution is None:
+        resolution = max(_h3_int_resolution(h) - 1, 0)
+    elif resolution > _h3_int_resolution(h):
+        raise Exception(f"All tile ids must have a resolution from {resolution}")
+
+    # Digits finer than the resolution are set to 7
+    unused = (1 << 3 * (15 - resolution)) - 1
+
+    return (h & ~(0xF << 52)) | (resolution << 52) | unused
+
+
+def _h3_int_children(h: int, resolution: Optional[int] = None) -> List[int]:
+
+    level = _h3_int_resolution(h)
+
+    if resolution is not None and resolution < level:
+        raise Exception(f"All tile ids must have a resolution up to {resolution}")
+
+    if resolution is not None and resolution > level + 1:
+        return [
+            descendant
+            for child in _h3_int_children(h)
+            for descendant in _h3_int_children(child, resolution)
+        ]
+
+    if resolution == level:
+        return [h]
+
+    shift = 3 * (14 - level)
+    base = (h & ~(0xF << 52) & ~(7 << shift)) | ((level + 1) << 52)
+
+    pentagon = ((h >> 45) & 0x7F) in H3_PENTAGON_BASE_CELLS and not (
+        (h >> 3 * (15 - level)) & ((1 << 3 * level) - 1)
+    )
+
+    return [
+        base | (digit << shift) for digit in range(7) if not (pentagon and digit == 1)
+    ]
+
+
+def _h3_ints_resolution(values: np.ndarray) -> np.ndarray:
+
+    return (values >> 52) & 0xF
+
+
+def _h3_ints_parent(values: np.ndarray, resolution: int) -> np.ndarray:
+
+    unused = (1 << 3 * (15 - resolution)) - 1
+
+    return (values & ~(0xF << 52)) | (resolution << 52) | unused
+
+
+def _h3_ints_children_count(values: np.ndarray, resolution: int) -> np.ndarray:
+    """Hexagons have 7 children. Pentagons have a pentagon and 5 hexagons,
+    so 1 + 5 * (7**d - 1) / 6 descendants d levels down."""
+
+    levels = _h3_ints_resolution(values)
+    hexagons = np.int64(7) ** (resolution - levels)
+
+    base_cells = (values >> 45) & 0x7F
+    digits = (values >> 3 * (15 - levels)) & ((np.int64(1) << 3 * levels) - 1)
+    pentagon = np.isin(base_cells, list(H3_PENTAGON_BASE_CELLS)) & (digits == 0)
+
+    return np.where(pentagon, 1 + 5 * (hexagons - 1) // 6, hexagons)
+
+
+def _h3_polyfill_adaptive(
+    geojsons: List[dict], resolution: int, max_cells: Optional[int]
+) -> List[str]:
+    """h3 children do not tile their parent exactly, so the cover is built
+    bottom-up: the polyfill at resolution is compacted and, while over the
+    budget, the finest hexagons are replaced by their parents, largest
+    sibling groups first."""
+
+    cells = set()
+    for geojson in geojsons:
+        cells.update(h3.polyfill_geojson(geojson, resolution))
+    cells = set(h3.compact(cells))
+
+    def merge_siblings(level):
+        """h3.compact only takes hexagons of a single resolution, so new
+        parents are compacted level by level."""
+
+        for res in range(level, 0, -1):
+            same_level = {cell for cell in cells if h3.h3_get_resolution(cell) == res}
+            cells.difference_update(same_level)
+            cells.update(h3.compact(same_level))
+
+    while max_cells is not None and len(cells) > max_cells:
+
+        finest = max(h3.h3_get_resolution(cell) for cell in cells)
+        if finest == 0:
+            break
+
+        siblings = defaultdict(list)
+        for cell in cells:
+            if h3.h3_get_resolution(cell) == finest:
+                siblings[h3.h3_to_parent(cell)].append(cell)
+
+        for parent, children in sorted(
+            siblings.items(), key=lambda group: (-len(group[1]), group[0])
+        ):
+            if len(cells) <= max_cells:
+                break
+            cells.difference_update(children)
+            cells.add(parent)
+
+        merge_siblings(finest - 1)
+
+    return sorted(cells)
+
+
+def _geo_to_h3_batch(lats: np.ndarray, lons: np.ndarray, resolution: int) -> np.ndarray:
+
+    geo_to_h3 = h3.geo_to_h3
+
+    return np.array(
+        [
+            geo_to_h3(lat, lon, resolution)
+            for lat, lon in zip(lats.tolist(), lons.tolist())
+        ],
+        dtype=object,
+    )
+
+
+class H3Backend(GridBackend):
+
+    name = "h3"
+
+    resolutions = range(0, 16)
+
+    # Ids of a resolution have the same length, so they sort as the h3 index
+    sort_key = str
+
+    def index(self, lat: float, lon: float, resolution: int) -> str:
+
+        return h3.geo_to_h3(lat, lon, resolution)
+
+    def boundary(self, tile_id: str) -> Tuple[Tuple[float, float], ...]:
+
+        return _h3_to_geo_boundary(tile_id)
+
+    def parent(self, tile_id: str, resolution: Optional[int] = None) -> str:
+
+        return h3.h3_to_parent(tile_id, resolution)
+
+    def children(self, tile_id: str, resolution: Optional[int] = None) -> List[str]:
+
+        return h3.h3_to_children(tile_id, resolution)
+
+    def resolution(self, tile_id: str) -> int:
+
+        return h3.h3_get_resolution(tile_id)
+
+    def neighbors(self, tile_id: str, k: int = 1) -> List[str]:
+
+        return sorted(h3.k_ring(tile_id, k))
+
+    def polyfill(self, geometry: Any, resolution: int) -> Iterable[str]:
+
+        # h3 returns a set, sorting makes the order deterministic
+        return sorted(h3.polyfill_geojson(geometry.geojson, resolution))
+
+    def polyfill_adaptive(
+        self, geometries: List[Any], resolution: int, max_cells: Optional[int]
+    ) -> List[str]:
+
+        return _h3_polyfill_adaptive(
+            [geom.geojson for geom in geometries], resolution, max_cells
+        )
+
+    def compact(self, tile_ids: Iterable[str]) -> List[str]:
+
+        return _h3_compact(set(tile_ids))
+
+    def uncompact(self, tile_ids: Iterable[str], resolution: int) -> List[str]:
+
+        tile_ids = _h3_drop_covered(set(tile_ids))
+
+        if any(h3.h3_get_resolution(tile_id) > resolution for tile_id in tile_ids):
+            raise Exception(f"All h3 ids must have a resolution up to {resolution}")
+
+        return list(h3.uncompact(tile_ids, resolution))
+
+    def to_int(self, tile_id: str) -> int:
+
+        return int(tile_id, 16)
+
+    def from_int(self, tile_int: int) -> str:
+
+        return format(tile_int, "x")
+
+    def int_parent(self, tile_int: int, resolution: Optional[int] = None) -> int:
+
+        return _h3_int_parent(tile_int, resolution)
+
+    def int_children(
+        self, tile_int: int, resolution: Optional[int] = None
+    ) -> List[int]:
+
+        return _h3_int_children(tile_int, resolution)
+
+    def int_resolution(self, tile_int: int) -> int:
+
+        return _h3_int_resolution(tile_int)
+
+    def index_batch(
+        self, lats: np.ndarray, lons: np.ndarray, resolution: int
+    ) -> np.ndarray:
+
+        return _geo_to_h3_batch(lats, lons, resolution)
+
+    def ints_resolution(self, tile_ints: np.ndarray) -> np.ndarray:
+
+        return _h3_ints_resolution(tile_ints)
+
+    def ints_parent(self, tile_ints: np.ndarray, resolution: int) -> np.ndarray:
+
+        return _h3_ints_parent(tile_ints, resolution)
+
+    def ints_children_count(self, tile_ints: np.ndarray, resolution: int) -> np.ndarray:
+
+        return _h3_ints_children_count(tile_ints, resolution)
+
+    def neighbors_batch(self, tile_ids: Iterable[str], k: int = 1) -> np.ndarray:
+
+        neighbors = set().union(*(h3.k_ring(t, k) for t in tile_ids))
+
+        return np.array(sorted(neighbors), dtype=object)
+
+
+class QuadkeyBackend(GridBackend):
+    """Bing quadkeys. Integer ids are packed quadkeys, see
+    `quadtree.quadkey_to_int`."""
+
+    name = "bing"
+
+    resolutions = range(1, 24)
+
+    sort_key = str
+
+    def index(self, lat: float, lon: float, resolution: int) -> str:
+
+        return quadtree.geo_to_tile(lat, lon, resolution)
+
+    def boundary(self, tile_id: str) -> str:
+
+        return quadtree.tile_to_geo_boundary(tile_id)
+
+    def boundaries(self, tile_ids: Iterable[str]) -> List[Polygon]:
+
+        bounds = quadtree.tile_to_bounds_batch(np.asarray(list(tile_ids), dtype=str))
+
+        # Same vertex order as `quadtree.tile_to_geo_boundary`
+        return [
+            Polygon(
+                [
+                    (min_lon, min_lat),
+                    (min_lon, max_lat),
+                    (max_lon, max_lat),
+                    (max_lon, min_lat),
+                ]
+            )
+            for min_lon, min_lat, max_lon, max_lat in zip(
+                *(bound.tolist() for bound in bounds)
+            )
+        ]
+
+    def parent(self, tile_id: str, resolution: Optional[int] = None) -> str:
+
+        return quadtree.tile_to_parent(tile_id, resolution)
+
+    def children(self, tile_id: str, resolution: Optional[int] = None) -> List[str]:
+
+        return quadtree.tile_to_children(tile_id, resolution)
+
+    def resolution(self, tile_id: str) -> int:
+
+        return quadtree.tile_get_resolution(tile_id)
+
+    def neighbors(self, tile_id: str, k: int = 1) -> List[str]:
+
+        return quadtree.tile_to_neighbors(tile_id, k)
+
+    def polyfill(self, geometry: Any, resolution: int) -> Iterable[str]:
+
+        return quadtree.polyfill_ids(geometry.shapely, resolution)
+
+    def polyfill_adaptive(
+        self, geometries: List[Any], resolution: int, max_cells: Optional[int]
+    ) -> List[str]:
+
+        return quadtree.polyfill_adaptive_ids(
+            shapely.geometry.MultiPolygon([geom.shapely for geom in geometries]),
+            resolution,
+            max_cells,
+        )
+
+    def compact(self, tile_ids: Iterable[str]) -> List[str]:
+
+        return quadtree.compact(tile_ids)
+
+    def uncompact(self, tile_ids: Iterable[str], resolution: int) -> List[str]:
+
+        return quadtree.uncompact(tile_ids, resolution)
+
+    def to_int(self, tile_id: str) -> int:
+
+        return quadtree.quadkey_to_int(tile_id)
+
+    def from_int(self, tile_int: int) -> str:
+
+        return quadtree.int_to_quadkey(tile_int)
+
+    def int_parent(self, tile_int: int, resolution: Optional[int] = None) -> int:
+
+        return quadtree.quadint_to_parent(tile_int, resolution)
+
+    def int_children(
+        self, tile_int: int, resolution: Optional[int] = None
+    ) -> List[int]:
+
+        return list(quadtree.quadint_to_children(tile_int, resolution))
+
+    def int_resolution(self, tile_int: int) -> int:
+
+        return quadtree.quadint_get_resolution(tile_int)
+
+    def index_batch(
+        self, lats: np.ndarray, lons: np.ndarray, resolution: int
+    ) -> np.ndarray:
+
+        return quadtree.geo_to_tile_batch(lats, lons, resolution)
+
+    def index_int_batch(
+        self, lats: np.ndarray, lons: np.ndarray, resolution: int
+    ) -> np.ndarray:
+
+        return quadtree.geo_to_quadint_batch(lats, lons, resolution)
+
+    def ints_resolution(self, tile_ints: np.ndarray) -> np.ndarray:
+
+        return quadtree.quadints_get_resolution_batch(tile_ints)
+
+    def ints_parent(self, tile_ints: np.ndarray, resolution: int) -> np.ndarray:
+
+        return quadtree.quadints_to_parent_batch(tile_ints, resolution)
+
+    def ints_children(self, tile_ints: np.ndarray, resolution: int) -> np.ndarray:
+
+        return quadtree.quadints_to_children_batch(tile_ints, resolution)
+
+    def ints_children_count(self, tile_ints: np.ndarray, resolution: int) -> np.ndarray:
+
+        return quadtree.quadints_children_count_batch(tile_ints, resolution)
+
+    def neighbors_batch(self, tile_ids: Iterable[str], k: int = 1) -> np.ndarray:
+
+        return quadtree.tile_to_neighbors_batch(list(tile_ids), k)
+
+
+_backends: Dict[str, GridBackend] = {}
+
+_grids: List[str] = []
+
+
+def register_backend(backend: GridBackend, aliases: Iterable[str] = ()) -> None:
+    """Registers a backend under its name and aliases. A backend registered
+    under the name of another one replaces it.
+
+    Parameters
+    ----------
+    backend : GridBackend
+    aliases : Iterable[str]
+        Other grid types served by the backend. They are not listed by
+        `grids`.
+    """
+
+    if not isinstance(backend, GridBackend):
+        raise Exception(f"{backend!r} is not a GridBackend")
+
+    if backend.name not in _grids:
+        _grids.append(backend.name)
+
+    for name in [backend.name, *aliases]:
+        _backends[name] = backend
+
+
+def get_backend(grid_type: str) -> GridBackend:
+    """Backend registered for a grid type."""
+
+    try:
+        return _backends[grid_type]
+    except KeyError:
+        raise Exception(
+            f"{grid_type} is not a valid type. "
+            f"Try one of the following: {', '.join(_grids)}"
+        ) from None
+
+
+def grids() -> List[str]:
+    """Names of the registered backends."""
+
+    return list(_grids)
+
+
+register_backend(S2Backend())
+register_backend(H3Backend())
+register_backend(QuadkeyBackend(), aliases=["quadtree"])
@@ -0,0 +1,176 @@
+"""Size-bounded LRU caches for tile boundaries and Tile objects.
+
+There is one cache per kind ("boundary" or "tile") and grid. Each one keeps
+hit, miss and eviction counters, so it can be sized in production.
+
+```
+from babelgrid import cache
+
+cache.configure(boundary=100_000, tile=10_000)
+cache.cache_info()
+{'s2': {'boundary': {'hits': 10, 'misses': 3, 'evictions': 0, 'size': 3, 'maxsize': 100000}, ...}}
+```
+
+Cached values are shared, so cached functions return immutable values,
+such as tuples and strings, and public functions copy them on the way out.
+A maxsize of 0 disables the cache.
+"""
+
+from collections import OrderedDict
+from functools import wraps
+from threading import Lock
+from typing import Any, Callable, Dict, Optional
+
+DEFAULT_MAXSIZE = {"boundary": 10_000, "tile": 10_000}
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Least recently used cache with hit, miss and eviction counters."""
+
+    __slots__ = ("maxsize", "hits", "misses", "evictions", "_data", "_lock")
+
+    def __init__(self, maxsize: int) -> None:
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+
+        return len(self._data)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+
+        with self._lock:
+
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                self.misses += 1
+                return default
+
+            self.hits += 1
+            return self._data[key]
+
+    def put(self, key: Any, value: Any) -> None:
+
+        if self.maxsize <= 0:
+            return
+
+        with self._lock:
+
+            self._data[key] = value
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def resize(self, maxsize: int) -> None:
+
+        with self._lock:
+
+            self.maxsize = maxsize
+
+            while len(self._data) > max(maxsize, 0):
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+
+        with self._lock:
+
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+        }
+
+
+_maxsize: Dict[str, int] = dict(DEFAULT_MAXSIZE)
+
+_caches: Dict[str, Dict[str, LRUCache]] = {}
+
+
+def get_cache(kind: str, grid_type: str) -> LRUCache:
+    """Cache of a kind ("boundary" or "tile") for a grid."""
+
+    grid_caches = _caches.setdefault(grid_type, {})
+
+    if kind not in grid_caches:
+        grid_caches[kind] = LRUCache(_maxsize[kind])
+
+    return grid_caches[kind]
+
+
+def configure(boundary: Optional[int] = None, tile: Optional[int] = None) -> None:
+    """Sets the maximum number of entries of the boundary and Tile caches
+    of every grid. A maxsize of 0 disables the cache.
+
+    Parameters
+    ----------
+    boundary : int, optional
+    tile : int, optional
+    """
+
+    for kind, maxsize in (("boundary", boundary), ("tile", tile)):
+
+        if maxsize is None:
+            continue
+
+        _maxsize[kind] = maxsize
+        for grid_caches in _caches.values():
+            if kind in grid_caches:
+                grid_caches[kind].resize(maxsize)
+
+
+def cache_info() -> Dict[str, Dict[str, Dict[str, int]]]:
+    """Hit, miss, eviction and size counters of every cache, by grid and kind."""
+
+    return {
+        grid_type: {kind: c.stats() for kind, c in grid_caches.items()}
+        for grid_type, grid_caches in _caches.items()
+    }
+
+
+def clear() -> None:
+    """Empties every cache and resets its counters."""
+
+    for grid_caches in _caches.values():
+        for c in grid_caches.values():
+            c.clear()
+
+
+def cached(kind: str, grid_type: str) -> Callable:
+    """Decorator that memoizes a function of hashable arguments in the cache
+    of a kind and grid."""
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+
+            key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            c = get_cache(kind, grid_type)
+
+            value = c.get(key, _MISSING)
+            if value is _MISSING:
+                value = func(*args, **kwargs)
+                c.put(key, value)
+
+            return value
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,232 @@
+"""Columnar export of tiles.
+
+Tiles are turned straight into columns of a pyarrow Table or a geopandas
+GeoDataFrame, instead of going through `Tile.to_dict`. Only the requested
+fields are computed.
+
+```
+from babelgrid.export import to_geodataframe
+
+to_geodataframe(Babel('h3').polyfill(geometry, resolution=8, ids_only=True), 'h3')
+```
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+from babelgrid import area
+from babelgrid.babelgrid import Babel, Tile
+
+FIELDS = ("tile_id", "resolution", "parent_id", "children_id", "area_km", "geometry")
+
+DEFAULT_FIELDS = ("tile_id", "resolution", "parent_id", "geometry")
+
+
+def _to_tiles(
+    tiles: Iterable[Union[Tile, str]], grid_type: Optional[str]
+) -> List[Tile]:
+
+    result = []
+    for tile in tiles:
+
+        if not isinstance(tile, Tile):
+            if grid_type is None:
+                raise Exception("grid_type is required when exporting tile ids")
+            tile = Tile(tile, grid_type)
+
+        result.append(tile)
+
+    return result
+
+
+def _by_grid(
+    tiles: Sequence[Tile], batch: Callable[[Babel, List[Tile]], Iterable[Any]]
+) -> np.ndarray:
+    """Applies a batch operation to the tiles of each grid and returns the
+    results in the order of the tiles."""
+
+    groups: Dict[str, List[int]] = {}
+    for i, tile in enumerate(tiles):
+        groups.setdefault(tile.grid_type, []).append(i)
+
+    results = np.empty(len(tiles), dtype=object)
+    for grid_type, indices in groups.items():
+        group = batch(Babel(grid_type), [tiles[i] for i in indices])
+        for i, value in zip(indices, group):
+            results[i] = value
+
+    return results
+
+
+def _parent_ids(babel: Babel, tiles: List[Tile]) -> np.ndarray:
+    """Parents of the tiles of a grid, one batch per resolution. Tiles at
+    the coarsest resolution are their own parents."""
+
+    tile_ids = [tile.tile_id for tile in tiles]
+    resolutions = np.maximum(babel.resolutions(tile_ids) - 1, babel.grid_range()[0])
+
+    parents = np.empty(len(tiles), dtype=object)
+    for resolution in np.unique(resolutions):
+        (indices,) = np.nonzero(resolutions == resolution)
+        parents[indices] = babel.parents(
+            [tile_ids[i] for i in indices], int(resolution)
+        )
+
+    return parents
+
+
+def to_columns(
+    tiles: Iterable[Union[Tile, str]],
+    grid_type: Optional[str] = None,
+    fields: Sequence[str] = DEFAULT_FIELDS,
+) -> Dict[str, np.ndarray]:
+    """Turns tiles into a dict of column arrays.
+
+    Parameters
+    ----------
+    tiles : Iterable[Union[Tile, str]]
+        Tile objects or tile ids, for instance a polyfill result
+    grid_type : str, optional
+        Grid type of the tiles. Required if tile ids are given.
+    fields : Sequence[str]
+        Columns to compute, any of FIELDS. The geometry is exported as WKB.
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+    """
+
+    unknown = set(fields) - set(FIELDS)
+    if unknown:
+        raise Exception(
+            f"{', '.join(sorted(unknown))} are not valid fields. "
+            f"Try one of the following: {', '.join(FIELDS)}"
+        )
+
+    tile_list = _to_tiles(tiles, grid_type)
+
+    if {"area_km", "geometry"} & set(fields):
+        polygons = _by_grid(tile_list, lambda babel, group: babel.boundaries(group))
+
+    columns = {}
+    for field in fields:
+
+        if field == "tile_id":
+
+            columns[field] = np.array([t.tile_id for t in tile_list], dtype=object)
+
+        elif field == "resolution":
+
+            columns[field] = _by_grid(
+                tile_list,
+                lambda babel, group: babel.resolutions([t.tile_id for t in group]),
+            ).astype(int)
+
+        elif field == "parent_id":
+
+            columns[field] = _by_grid(tile_list, _parent_ids)
+
+        elif field == "children_id":
+
+            columns[field] = np.empty(len(tile_list), dtype=object)
+            columns[field][:] = [list(t.backend.children(t.tile_id)) for t in tile_list]
+
+        elif field == "area_km":
+
+            columns[field] = np.round(area.polygons_area_km(list(polygons)), 10)
+
+        elif field == "geometry":
+
+            columns[field] = np.array(
+                [polygon.wkb for polygon in polygons], dtype=object
+            )
+
+    return columns
+
+
+def to_arrow(
+    tiles: Iterable[Union[Tile, str]],
+    grid_type: Optional[str] = None,
+    fields: Sequence[str] = DEFAULT_FIELDS,
+):
+    """Turns tiles into a pyarrow Table. The geometry column holds WKB.
+
+    It requires pyarrow.
+
+    Parameters
+    ----------
+    tiles : Iterable[Union[Tile, str]]
+        Tile objects or tile ids, for instance a polyfill result
+    grid_type : str, optional
+        Grid type of the tiles. Required if tile ids are given.
+    fields : Sequence[str]
+        Columns to compute, any of FIELDS
+
+    Returns
+    -------
+    pyarrow.Table
+    """
+
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError("to_arrow requires pyarrow. Try `pip install pyarrow`")
+
+    columns = to_columns(tiles, grid_type, fields)
+
+    types = {
+        "tile_id": pa.string(),
+        "resolution": pa.int64(),
+        "parent_id": pa.string(),
+        "children_id": pa.list_(pa.string()),
+        "area_km": pa.float64(),
+        "geometry": pa.binary(),
+    }
+
+    return pa.table(
+        {
+            field: pa.array(column.tolist(), type=types[field])
+            for field, column in columns.items()
+        }
+    )
+
+
+def to_geodataframe(
+    tiles: Iterable[Union[Tile, str]],
+    grid_type: Optional[str] = None,
+    fields: Sequence[str] = DEFAULT_FIELDS,
+):
+    """Turns tiles into a geopandas GeoDataFrame in EPSG:4326.
+
+    It requires geopandas.
+
+    Parameters
+    ----------
+    tiles : Iterable[Union[Tile, str]]
+        Tile objects or tile ids, for instance a polyfill result
+    grid_type : str, optional
+        Grid type of the tiles. Required if tile ids are given.
+    fields : Sequence[str]
+        Columns to compute, any of FIELDS
+
+    Returns
+    -------
+    geopandas.GeoDataFrame
+    """
+
+    try:
+        import geopandas as gpd
+    except ImportError:
+        raise ImportError(
+            "to_geodataframe requires geopandas. Try `pip install geopandas`"
+        )
+
+    columns = to_columns(tiles, grid_type, fields)
+
+    if "geometry" not in columns:
+        return gpd.GeoDataFrame(columns)
+
+    geometry = gpd.GeoSeries.from_wkb(columns.pop("geometry"))
+
+    return gpd.GeoDataFrame(columns, geometry=geometry, crs="EPSG:4326")
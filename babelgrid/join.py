@@ -0,0 +1,175 @@
+"""Point to region spatial join on top of polyfill indexes.
+
+Each region is polyfilled once and its tiles are classified as interior,
+fully inside the region, or boundary, crossed by its border. Points are
+then indexed in batch and mapped to regions with a lookup of their tile
+id. Only points that fall in boundary tiles are tested with shapely.
+
+```
+join = SpatialJoin('h3', {'sao paulo': sp_geometry, 'rio': rj_geometry}, 9)
+join.assign(df.lat.values, df.lon.values)
+array(['sao paulo', None, 'rio', ...], dtype=object)
+```
+"""
+
+from typing import Any, Dict, Hashable, List, Mapping, Union, cast
+
+import numpy as np
+import shapely
+from shapely.geometry import Point
+from shapely.prepared import prep
+
+from babelgrid.babelgrid import Babel, Conversors, Tile
+
+
+class SpatialJoin:
+    """Assigns points to the region that contains them.
+
+    Parameters
+    ----------
+    grid_type : str
+        Example: 'bing', 'h3', 's2'
+    regions : Mapping[Hashable, Any]
+        Region key to geometry (Polygon or MultiPolygon as shapely, wkt or
+        geojson). Regions should not overlap. If they do, a point gets the
+        first region that contains it.
+    resolution : int
+        Grid system resolution/zoom/size of the index
+    """
+
+    def __init__(
+        self, grid_type: str, regions: Mapping[Hashable, Any], resolution: int
+    ) -> None:
+
+        self.babel = Babel(grid_type)
+        self.resolution = resolution
+
+        self._regions: Dict[Hashable, Any] = {}
+        self._interior: Dict[str, Hashable] = {}
+        self._boundary: Dict[str, List[Hashable]] = {}
+
+        for key, geometry in regions.items():
+            self.add(key, geometry)
+
+    def _tile_polygon(self, tile_id: str) -> shapely.geometry.Polygon:
+
+        return Tile(tile_id, self.babel.grid_type).geometry.shapely
+
+    def _h3_boundary_tiles(self, geometry, border) -> set:
+        """h3 polyfill only keeps hexagons with the center inside the
+        geometry. Hexagons crossed by the border are found walking from the
+        hexagons of its vertices."""
+
+        coordinates = [
+            xy for line in getattr(border, "geoms", [border]) for xy in line.coords
+        ]
+
+        lons, lats = np.array(coordinates, dtype=float).T[:2]
+        visited = set(self.babel.geo_to_tiles(lats, lons, self.resolution).tolist())
+        queue = list(visited)
+        boundary = set()
+
+        while queue:
+
+            tile_id = queue.pop()
+
+            if not border.intersects(self._tile_polygon(tile_id)):
+                continue
+
+            boundary.add(tile_id)
+
+            for neighbor in self.babel.neighbors(tile_id, 1):
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    queue.append(neighbor)
+
+        return boundary
+
+    def add(self, key: Hashable, geometry: Any) -> None:
+        """Polyfills a region and adds its tiles to the index.
+
+        Parameters
+        ----------
+        key : Hashable
+            Region key, returned by `assign`
+        geometry : Any
+            Polygon or MultiPolygon as shapely, wkt or geojson
+        """
+
+        geometry = Conversors().any_to_shapely(geometry)
+        prepared_border = prep(geometry.boundary)
+
+        self._regions[key] = prep(geometry)
+
+        tile_ids = set(
+            cast(
+                List[str],
+                self.babel.polyfill(geometry, self.resolution, ids_only=True),
+            )
+        )
+
+        if self.babel.grid_type == "h3":
+            boundary = self._h3_boundary_tiles(geometry, geometry.boundary)
+        else:
+            boundary = {
+                tile_id
+                for tile_id in tile_ids
+                if prepared_border.intersects(self._tile_polygon(tile_id))
+            }
+
+        for tile_id in boundary:
+            self._boundary.setdefault(tile_id, []).append(key)
+
+        for tile_id in tile_ids - boundary:
+            if tile_id in self._interior:
+                # Overlapping regions are solved as boundary tiles
+                self._boundary.setdefault(tile_id, []).extend(
+                    [self._interior.pop(tile_id), key]
+                )
+            elif tile_id in self._boundary:
+                self._boundary[tile_id].append(key)
+            else:
+                self._interior[tile_id] = key
+
+    def assign(
+        self,
+        lats: Union[np.ndarray, List[float]],
+        lons: Union[np.ndarray, List[float]],
+    ) -> np.ndarray:
+        """Region key of each point, or None if no region contains it.
+
+        Parameters
+        ----------
+        lats : Union[np.ndarray, List[float]]
+        lons : Union[np.ndarray, List[float]]
+
+        Returns
+        -------
+        np.ndarray
+            Region keys
+        """
+
+        lats = np.asarray(lats, dtype=float).ravel()
+        lons = np.asarray(lons, dtype=float).ravel()
+
+        tile_ids = self.babel.geo_to_tiles(lats, lons, self.resolution)
+        unique_ids, inverse = np.unique(tile_ids.astype(str), return_inverse=True)
+
+        keys = np.empty(len(unique_ids), dtype=object)
+        keys[:] = [self._interior.get(tile_id) for tile_id in unique_ids]
+        keys = keys[inverse]
+
+        in_boundary = np.array(
+            [tile_id in self._boundary for tile_id in unique_ids], dtype=bool
+        )[inverse]
+
+        for i in np.flatnonzero(in_boundary):
+
+            point = Point(lons[i], lats[i])
+
+            for key in self._boundary[tile_ids[i]]:
+                if self._regions[key].intersects(point):
+                    keys[i] = key
+                    break
+
+        return keys
@@ -0,0 +1,68 @@
+"""Modules imported on first use.
+
+Grid backends and pyproj are slow to import and most jobs only use one
+grid, so they are bound to proxies that import the module on first
+attribute access. After that, the proxy holds the attributes of the module
+and lookups cost as much as on the module itself.
+
+```
+h3 = lazy_import("h3", "h3")  # nothing is imported yet
+h3.geo_to_h3(0, 0, 5)      # h3 is imported here
+```
+"""
+
+import importlib
+import sys
+from types import ModuleType
+from typing import Optional
+
+
+class LazyModule(ModuleType):
+    """Proxy of a module, or of a module attribute of a package, that is
+    imported on first attribute access."""
+
+    def __init__(self, name: str, attribute: Optional[str] = None) -> None:
+
+        super().__init__(name)
+        self._attribute = attribute
+
+    def _load(self) -> ModuleType:
+
+        module = importlib.import_module(self.__name__)
+        if self._attribute is not None:
+            module = getattr(module, self._attribute)
+
+        self.__dict__.update(module.__dict__)
+
+        return module
+
+    def __getattr__(self, name: str):
+
+        return getattr(self._load(), name)
+
+    def __dir__(self):
+
+        return dir(self._load())
+
+
+def lazy_import(name: str, attribute: Optional[str] = None) -> ModuleType:
+    """Module proxy of name, or the module itself if it is already imported.
+
+    Parameters
+    ----------
+    name : str
+        Absolute module name
+    attribute : str, optional
+        Module attribute of the package to proxy instead, as in
+        `from h3 import h3`
+
+    Returns
+    -------
+    ModuleType
+    """
+
+    if name in sys.modules:
+        module = sys.modules[name]
+        return module if attribute is None else getattr(module, attribute)
+
+    return LazyModule(name, attribute)
@@ -0,0 +1,30 @@
+"""Elementwise math functions over NumPy arrays that match the math module.
+
+NumPy may use SIMD versions of the transcendental functions that differ
+from libm in the last bit. The batch paths of the grids apply the math
+module elementwise instead, so their results are bit-for-bit equal to the
+scalar paths and to the reference libraries.
+"""
+
+import numpy as np
+
+
+def elementwise(func, *arrays):
+    """Applies a math function elementwise to arrays of the same shape.
+
+    Parameters
+    ----------
+    func : Callable
+        Function of the math module
+    arrays : numpy.ndarray
+
+    Returns
+    -------
+    numpy.ndarray
+        Float array of the shape of the arrays
+    """
+
+    shape = np.shape(arrays[0])
+    values = map(func, *[np.ravel(array).tolist() for array in arrays])
+
+    return np.fromiter(values, dtype=float, count=int(np.prod(shape))).reshape(shape)
@@ -0,0 +1,130 @@
+"""Process-pool execution of polyfills.
+
+The work is split by polygon part and large parts are further cut into a
+regular grid of partitions. Each piece is filled in a worker process and
+the results of each part are merged without duplicates, in the order of
+the serial polyfill.
+"""
+
+import math
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from shapely.geometry import box
+from shapely.geometry.polygon import Polygon
+
+PARTITIONS_PER_PROCESS = 4
+
+
+def _polygons(geometry) -> List[Polygon]:
+    """Polygons of a clipped geometry. Lines and points are dropped."""
+
+    if isinstance(geometry, Polygon):
+        return [geometry] if not geometry.is_empty else []
+
+    return [g for part in getattr(geometry, "geoms", []) for g in _polygons(part)]
+
+
+def partition(polygon: Polygon, n_partitions: int) -> List[Polygon]:
+    """Cuts a polygon with a regular grid of about n_partitions boxes
+    over its bounding box.
+
+    Parameters
+    ----------
+    polygon : Polygon
+    n_partitions : int
+
+    Returns
+    -------
+    List[Polygon]
+        Pieces of the polygon
+    """
+
+    k = math.ceil(math.sqrt(n_partitions))
+
+    if k <= 1:
+        return [polygon]
+
+    min_x, min_y, max_x, max_y = polygon.bounds
+    width, height = (max_x - min_x) / k, (max_y - min_y) / k
+
+    return [
+        piece
+        for i in range(k)
+        for j in range(k)
+        for piece in _polygons(
+            polygon.intersection(
+                box(
+                    min_x + i * width,
+                    min_y + j * height,
+                    min_x + (i + 1) * width,
+                    min_y + (j + 1) * height,
+                )
+            )
+        )
+    ]
+
+
+def polyfill_ids(
+    polyfill_wkb: Callable[[bytes], List[str]],
+    polygons: List[Polygon],
+    processes: int,
+    sort_key: Optional[Callable] = None,
+    partitions_per_process: int = PARTITIONS_PER_PROCESS,
+) -> List[str]:
+    """Fills polygons in a process pool.
+
+    Each polygon gets a share of processes * partitions_per_process
+    partitions proportional to its area.
+
+    Parameters
+    ----------
+    polyfill_wkb : Callable[[bytes], List[str]]
+        Picklable function that fills a WKB polygon and returns its tile ids
+    polygons : List[Polygon]
+    processes : int
+        Number of worker processes
+    sort_key : Callable, optional
+        If given, the ids of each polygon are sorted with it, as the grid
+        polyfill would return them. Otherwise, the order in which the pieces
+        were filled is kept.
+    partitions_per_process : int
+
+    Returns
+    -------
+    List[str]
+        Tile ids of each polygon, without duplicates, one polygon after the
+        other. As in the serial polyfill, tiles shared by two polygons are
+        returned by both.
+    """
+
+    total_area = sum(p.area for p in polygons) or 1
+    n_partitions = processes * partitions_per_process
+
+    pieces = [
+        partition(polygon, round(n_partitions * polygon.area / total_area))
+        for polygon in polygons
+    ]
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        results = iter(
+            list(
+                executor.map(
+                    polyfill_wkb, [piece.wkb for part in pieces for piece in part]
+                )
+            )
+        )
+
+    tile_ids: List[str] = []
+    for part in pieces:
+
+        part_ids: Dict[str, None] = {}
+        for _ in part:
+            part_ids.update(dict.fromkeys(next(results)))
+
+        if sort_key is not None:
+            tile_ids.extend(sorted(part_ids, key=sort_key))
+        else:
+            tile_ids.extend(part_ids)
+
+    return tile_ids
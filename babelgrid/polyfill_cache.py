@@ -0,0 +1,253 @@
+"""Persistent on-disk cache of polyfills.
+
+Polyfills are stored in a local SQLite file, keyed by a hash of the
+normalized geometry WKB, the grid type and the resolution. Tile ids are
+stored as arrays of 64-bit integer ids, see `Babel.to_ints`. Warm runs
+read them back instead of polyfilling, across processes and restarts.
+
+```
+from babelgrid import PolyfillCache
+
+disk_cache = PolyfillCache("polyfills.sqlite", max_bytes=2 * 1024 ** 3)
+Babel('s2').polyfill(geometry, 14, ids_only=True, disk_cache=disk_cache)
+disk_cache.stats()
+{'hits': 1, 'misses': 0, 'evictions': 0, 'size': 1, 'bytes': 5728, 'max_bytes': ...}
+```
+
+Once the stored arrays exceed `max_bytes`, or `max_entries`, the least
+recently used polyfills are evicted.
+"""
+
+import hashlib
+import sqlite3
+import time
+from contextlib import closing
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import shapely
+from shapely import wkb
+from shapely.geometry import MultiPolygon, Polygon
+from shapely.geometry.polygon import orient
+
+from babelgrid.backends import get_backend
+
+DEFAULT_MAX_BYTES = 1 << 30
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS polyfills (
+    key TEXT PRIMARY KEY,
+    grid_type TEXT NOT NULL,
+    resolution INTEGER NOT NULL,
+    dtype TEXT NOT NULL,
+    tile_ints BLOB NOT NULL,
+    bytes INTEGER NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS polyfills_last_access ON polyfills (last_access);
+"""
+
+
+def _normalize_ring(coords: List[Tuple[float, ...]]) -> List[Tuple[float, ...]]:
+    """Closed ring that starts at its smallest vertex."""
+
+    start = coords.index(min(coords[:-1]))
+    return coords[start:-1] + coords[: start + 1]
+
+
+def _normalize(
+    geometry: shapely.geometry.base.BaseGeometry,
+) -> shapely.geometry.base.BaseGeometry:
+    """Polygons with counter-clockwise shells, clockwise holes and rings
+    that start at their smallest vertex. Shapely 1.7 has no `normalize`."""
+
+    if isinstance(geometry, MultiPolygon):
+        return MultiPolygon(
+            sorted(
+                (_normalize(polygon) for polygon in geometry.geoms),
+                key=lambda polygon: polygon.wkb,
+            )
+        )
+
+    if not isinstance(geometry, Polygon):
+        raise Exception(
+            f"Polyfills of {geometry.geom_type} geometries can not be cached. "
+            "Use a Polygon or a MultiPolygon"
+        )
+
+    if geometry.is_empty:
+        return geometry
+
+    polygon = orient(geometry)
+
+    return Polygon(
+        _normalize_ring(list(polygon.exterior.coords)),
+        sorted(_normalize_ring(list(ring.coords)) for ring in polygon.interiors),
+    )
+
+
+def geometry_key(
+    geometry: shapely.geometry.base.BaseGeometry, grid_type: str, resolution: int
+) -> str:
+    """Hash of the normalized geometry WKB, the grid type and the
+    resolution. Normalization makes the key independent of the ring
+    orientation and starting vertex, and of the order of the parts."""
+
+    digest = hashlib.sha256(wkb.dumps(_normalize(geometry)))
+    digest.update(f"{grid_type}:{resolution}".encode())
+
+    return digest.hexdigest()
+
+
+class PolyfillCache:
+    """Polyfill results stored in a SQLite file.
+
+    Parameters
+    ----------
+    path : str
+        SQLite file, created if it does not exist
+    max_bytes : int
+        Maximum total size of the stored tile id arrays
+    max_entries : int, optional
+        Maximum number of stored polyfills
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_entries: Optional[int] = None,
+    ) -> None:
+
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        with closing(self._connect()) as connection, connection:
+            connection.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get(
+        self,
+        geometry: shapely.geometry.base.BaseGeometry,
+        grid_type: str,
+        resolution: int,
+    ) -> Optional[List[str]]:
+        """Stored polyfill of a geometry, or None.
+
+        Returns
+        -------
+        Optional[List[str]]
+            Tile ids, in the order they were stored
+        """
+
+        key = geometry_key(geometry, grid_type, resolution)
+
+        with closing(self._connect()) as connection, connection:
+
+            row = connection.execute(
+                "SELECT dtype, tile_ints FROM polyfills WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            connection.execute(
+                "UPDATE polyfills SET last_access = ? WHERE key = ?",
+                (time.time(), key),
+            )
+
+        self.hits += 1
+        dtype, blob = row
+
+        return get_backend(grid_type).from_ints(np.frombuffer(blob, dtype)).tolist()
+
+    def put(
+        self,
+        geometry: shapely.geometry.base.BaseGeometry,
+        grid_type: str,
+        resolution: int,
+        tile_ids: List[str],
+    ) -> None:
+        """Stores the polyfill of a geometry and evicts the least recently
+        used ones over the size limits."""
+
+        key = geometry_key(geometry, grid_type, resolution)
+        tile_ints = get_backend(grid_type).to_ints(tile_ids)
+
+        if tile_ints.nbytes > self.max_bytes:
+            return
+
+        with closing(self._connect()) as connection, connection:
+
+            connection.execute(
+                "INSERT OR REPLACE INTO polyfills VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    grid_type,
+                    resolution,
+                    tile_ints.dtype.str,
+                    tile_ints.tobytes(),
+                    tile_ints.nbytes,
+                    time.time(),
+                ),
+            )
+
+            self._evict(connection)
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+
+        entries, total = connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(bytes), 0) FROM polyfills"
+        ).fetchone()
+
+        oldest = connection.execute(
+            "SELECT key, bytes FROM polyfills ORDER BY last_access"
+        )
+
+        evicted = []
+        for key, size in oldest:
+
+            if total <= self.max_bytes and (
+                self.max_entries is None or entries <= self.max_entries
+            ):
+                break
+
+            evicted.append((key,))
+            entries -= 1
+            total -= size
+
+        connection.executemany("DELETE FROM polyfills WHERE key = ?", evicted)
+        self.evictions += len(evicted)
+
+    def clear(self) -> None:
+        """Deletes every stored polyfill and resets the counters."""
+
+        with closing(self._connect()) as connection, connection:
+            connection.execute("DELETE FROM polyfills")
+
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Optional[int]]:
+
+        with closing(self._connect()) as connection:
+            entries, total = connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(bytes), 0) FROM polyfills"
+            ).fetchone()
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": entries,
+            "bytes": total,
+            "max_bytes": self.max_bytes,
+            "max_entries": self.max_entries,
+        }
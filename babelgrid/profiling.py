@@ -0,0 +1,186 @@
+"""Opt-in stage timers and counters of the hot paths.
+
+While a profile is active, polyfills record where their time goes:
+candidate cell generation, geometry tests, Tile construction and
+serialization. Nothing is recorded otherwise, and the instrumented code
+only pays a check of `current`.
+
+```
+from babelgrid import profiling
+
+with profiling.profile() as stats:
+    Babel('s2').polyfill(geometry, 14)
+
+stats.to_dict()
+{'timers': {'polyfill': 0.41, 's2.candidates': 0.12, 's2.geometry_tests': 0.25, ...},
+ 'counters': {'polyfill': 1, 's2.candidates': 912, 'polyfill.tiles_kept': 716, ...}}
+```
+
+A timer records the seconds spent in a stage and a counter of the same name
+the number of times it ran. Profiles are process-wide and can be nested,
+the inner one being active until it ends.
+"""
+
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+class Profile:
+    """Stage timers, in seconds, and counters."""
+
+    __slots__ = ("timers", "counters", "callback")
+
+    def __init__(self, callback: Optional[Callable[[dict], Any]] = None) -> None:
+
+        self.timers: Dict[str, float] = defaultdict(float)
+        self.counters: Dict[str, int] = defaultdict(int)
+        self.callback = callback
+
+    def count(self, name: str, n: int = 1) -> None:
+
+        self.counters[name] += n
+
+    def add_time(self, name: str, seconds: float) -> None:
+
+        self.timers[name] += seconds
+        self.counters[name] += 1
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+
+        return {"timers": dict(self.timers), "counters": dict(self.counters)}
+
+
+# Active profile, None when profiling is disabled
+current: Optional[Profile] = None
+
+_stack: List[Profile] = []
+
+
+def enable(callback: Optional[Callable[[dict], Any]] = None) -> Profile:
+    """Starts a profile. It is active until `disable` is called.
+
+    Parameters
+    ----------
+    callback : Callable[[dict], Any], optional
+        Called with the `Profile.to_dict` of the profile when it ends
+
+    Returns
+    -------
+    Profile
+    """
+
+    global current
+
+    current = Profile(callback)
+    _stack.append(current)
+
+    return current
+
+
+def disable() -> Dict[str, Dict[str, Any]]:
+    """Ends the active profile and reactivates the one it was nested in.
+
+    Returns
+    -------
+    Dict[str, Dict[str, Any]]
+        Timers and counters of the profile
+    """
+
+    global current
+
+    if not _stack:
+        raise Exception("There is no active profile")
+
+    profile = _stack.pop()
+    current = _stack[-1] if _stack else None
+
+    stats = profile.to_dict()
+    if profile.callback is not None:
+        profile.callback(stats)
+
+    return stats
+
+
+@contextmanager
+def profile(callback: Optional[Callable[[dict], Any]] = None) -> Iterator[Profile]:
+    """Context manager version of `enable` and `disable`."""
+
+    active = enable(callback)
+
+    try:
+        yield active
+    finally:
+        disable()
+
+
+def count(name: str, n: int = 1) -> None:
+    """Adds n to a counter of the active profile, if any."""
+
+    if current is not None:
+        current.count(name, n)
+
+
+class _Timer:
+
+    __slots__ = ("profile", "name", "start")
+
+    def __init__(self, profile: Profile, name: str) -> None:
+
+        self.profile = profile
+        self.name = name
+
+    def __enter__(self) -> None:
+
+        self.start = perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+
+        self.profile.add_time(self.name, perf_counter() - self.start)
+
+
+class _NullTimer:
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+
+
+def timer(name: str):
+    """Context manager that times a stage in the active profile, if any."""
+
+    if current is None:
+        return _NULL_TIMER
+
+    return _Timer(current, name)
+
+
+def instrument(func: Callable, name: str) -> Callable:
+    """Wraps func to time each call in the active profile. Without an active
+    profile func is returned as it is, so hot loops resolve the wrapper once
+    and pay nothing when profiling is disabled."""
+
+    if current is None:
+        return func
+
+    active = current
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            active.add_time(name, perf_counter() - start)
+
+    return wrapper
@@ -1,102 +1,670 @@
-from pygeotile.tile import Tile
-from shapely import wkt
+import math
+from collections import Counter
+from functools import partial
+from heapq import heappop, heappush
+from itertools import product
 
+import numpy as np
+from shapely.geometry import box
+from shapely.prepared import prep
 
-def _key_to_shapely(key):
+from babelgrid import profiling
+from babelgrid.cache import cached
+from babelgrid.libm import elementwise
 
-    return wkt.loads(tile_to_geo_boundary(key))
+MAX_LATITUDE = 85.05112877980659
 
+# Web Mercator constants of the Bing tile system
+EARTH_RADIUS = 6378137.0
+TILE_SIZE = 256
+ORIGIN_SHIFT = math.pi * EARTH_RADIUS
+INITIAL_RESOLUTION = 2 * math.pi * EARTH_RADIUS / TILE_SIZE
 
-def _area_ratio(a, b):
+# Deepest level representable by the packed integer quadkeys: 2 bits per
+# digit plus 5 bits for the level fit in a positive int64
+QUADKEY_MAX_LEVEL = 29
 
-    return round(a.intersection(b).area / a.area, 10)
+_LEVEL_BITS = 5
+_LEVEL_MASK = (1 << _LEVEL_BITS) - 1
 
 
-def _get_contained_keys(geometry, initial_key, resolution):
+def _quadkey_to_xyz(key):
 
-    contained_keys = []
+    x = y = 0
+    for digit in key:
+        x, y = x << 1, y << 1
+        digit = int(digit)
+        x |= digit & 1
+        y |= digit >> 1
 
-    def func(key, approved):
+    return x, y, len(key)
 
-        if approved:
-            if len(key) == resolution:
-                contained_keys.append(key)
-            else:
-                for child_key in tile_to_children(key):
-                    func(child_key, True)
-        else:
-            area_ratio = _area_ratio(_key_to_shapely(key), geometry)
-            if area_ratio == 0:
-
-                if int(key) < 3:  # loops through root tiles
-
-                    func(str(int(key) + 1), False)
-                else:
-                    return
-            elif area_ratio >= 1:
-                func(key, True)
-            elif len(key) == resolution:
-                contained_keys.append(key)
-            else:
-                for child_key in tile_to_children(key):
-                    func(child_key, False)
 
-    func(initial_key, False)
+def _xyz_to_quadkey(x, y, z):
+
+    return "".join(
+        str(((x >> i) & 1) | (((y >> i) & 1) << 1)) for i in range(z - 1, -1, -1)
+    )
+
+
+class _MathFunctions:
+    """Functions of the Web Mercator formulas, so that each formula is
+    written once for scalars, with the math module, and for arrays, with
+    NumPy."""
+
+    def __init__(self, atan, exp, log, tan, round, ceil, clip):
+
+        self.atan = atan
+        self.exp = exp
+        self.log = log
+        self.tan = tan
+        self.round = round
+        self.ceil = ceil
+        self.clip = clip
+
+
+_SCALAR = _MathFunctions(
+    math.atan,
+    math.exp,
+    math.log,
+    math.tan,
+    round,
+    math.ceil,
+    lambda value, low, high: min(max(value, low), high),
+)
+
+_ARRAY = _MathFunctions(
+    partial(elementwise, math.atan),
+    partial(elementwise, math.exp),
+    partial(elementwise, math.log),
+    partial(elementwise, math.tan),
+    np.round,
+    np.ceil,
+    np.clip,
+)
+
+
+def _geo_to_xy(lats, lons, resolution, fn):
+    """Tile x, y of points at a zoom level, snapped to the closest pixel as
+    pygeotile does"""
+
+    lats = fn.clip(lats, -MAX_LATITUDE, MAX_LATITUDE)
+
+    meter_x = lons * ORIGIN_SHIFT / 180.0
+    meter_y = fn.log(fn.tan((90.0 + lats) * math.pi / 360.0)) / (math.pi / 180.0)
+    meter_y = meter_y * ORIGIN_SHIFT / 180.0
+
+    pixel_size = INITIAL_RESOLUTION / 2 ** resolution
+    pixel_x = abs(fn.round((meter_x + ORIGIN_SHIFT) / pixel_size))
+    pixel_y = abs(fn.round((meter_y - ORIGIN_SHIFT) / pixel_size))
+
+    max_tile = 2 ** resolution - 1
+
+    return (
+        fn.clip(fn.ceil(pixel_x / TILE_SIZE) - 1, 0, max_tile),
+        fn.clip(fn.ceil(pixel_y / TILE_SIZE) - 1, 0, max_tile),
+    )
+
+
+def _xyz_to_bounds(x, y, z, fn):
+    """Web Mercator bounds of tiles x, y at zoom z as
+    (min_lon, min_lat, max_lon, max_lat), computed as pygeotile does"""
+
+    pixel_size = INITIAL_RESOLUTION / 2.0 ** z
+
+    def to_lon(x):
+        return ((x * TILE_SIZE * pixel_size - ORIGIN_SHIFT) / ORIGIN_SHIFT) * 180.0
+
+    def to_lat(y):
+        lat = ((ORIGIN_SHIFT - y * TILE_SIZE * pixel_size) / ORIGIN_SHIFT) * 180.0
+        return (
+            180.0
+            / math.pi
+            * (2 * fn.atan(fn.exp(lat * math.pi / 180.0)) - math.pi / 2.0)
+        )
 
-    return contained_keys
+    return to_lon(x), to_lat(y + 1), to_lon(x + 1), to_lat(y)
+
+
+def _initial_keys(geometry, resolution):
+    """Keys of the coarsest zoom at which the geometry bounding box
+    overlaps at most 2x2 tiles."""
+
+    min_lon, min_lat, max_lon, max_lat = geometry.bounds
+
+    # Corners are snapped to the closest pixel, so the tiles next to them
+    # are taken too
+    x0, y0 = _geo_to_xy(max_lat, min_lon, resolution, _SCALAR)
+    x1, y1 = _geo_to_xy(min_lat, max_lon, resolution, _SCALAR)
+    x0, y0 = max(x0 - 1, 0), max(y0 - 1, 0)
+    x1, y1 = min(x1 + 1, 2 ** resolution - 1), min(y1 + 1, 2 ** resolution - 1)
+    z = resolution
+
+    while z > 1 and (x1 - x0 > 1 or y1 - y0 > 1):
+        x0, y0, x1, y1, z = x0 >> 1, y0 >> 1, x1 >> 1, y1 >> 1, z - 1
+
+    return sorted(
+        _xyz_to_quadkey(x, y, z) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1)
+    )
+
+
+def _key_descendants(key, resolution):
+
+    for suffix in product("0123", repeat=resolution - len(key)):
+        yield key + "".join(suffix)
+
+
+def _key_box(key):
+
+    return box(*_xyz_to_bounds(*_quadkey_to_xyz(key), _SCALAR))
+
+
+def _get_contained_keys(geometry, resolution):
+    """Yields the keys at resolution that overlap geometry, sorted.
+
+    Tiles are visited with an explicit stack starting from the tiles that
+    overlap the geometry bounding box. Tiles fully inside are expanded to
+    their descendants without further tests, tiles outside are dropped and
+    only boundary tiles are refined.
+    """
+
+    prepared = prep(geometry)
+
+    to_box = profiling.instrument(_key_box, "bing.candidates")
+    intersects = profiling.instrument(prepared.intersects, "bing.geometry_tests")
+    contains = profiling.instrument(prepared.contains, "bing.geometry_tests")
+    touches = profiling.instrument(prepared.touches, "bing.geometry_tests")
+
+    stack = _initial_keys(geometry, resolution)[::-1]
+
+    while stack:
+
+        key = stack.pop()
+        tile = to_box(key)
+
+        if not intersects(tile):
+            continue
+
+        if contains(tile):
+            yield from _key_descendants(key, resolution)
+        elif len(key) < resolution:
+            stack.extend(reversed(tile_to_children(key)))
+        elif not touches(tile):
+            yield key
 
 
 def polyfill(geometry, resolution):
 
-    return _get_contained_keys(geometry, "0", resolution)
+    return list(polyfill_ids(geometry, resolution))
+
 
+def polyfill_ids(geometry, resolution):
 
+    return _get_contained_keys(geometry, resolution)
+
+
+def polyfill_adaptive_ids(geometry, resolution, max_cells=None):
+    """Cover a geometry with quadkeys of mixed resolutions, up to
+    resolution. See `s2.polyfill_adaptive_ids`.
+
+    Parameters
+    ----------
+    geometry : shapely.geometry.Polygon
+        Polygon or MultiPolygon
+    resolution : int
+        Finest zoom level
+    max_cells : int, optional
+        Tile budget, by default unbounded
+
+    Returns
+    -------
+    list
+        Quadkeys, sorted
+    """
+
+    prepared = prep(geometry)
+
+    keys, candidates = [], []
+
+    def classify(key):
+
+        tile = _key_box(key)
+
+        if not prepared.intersects(tile) or prepared.touches(tile):
+            return None
+
+        return prepared.contains(tile)
+
+    for key in _initial_keys(geometry, resolution):
+
+        contained = classify(key)
+
+        if contained:
+            keys.append(key)
+        elif contained is not None:
+            heappush(candidates, (len(key), key))
+
+    while candidates:
+
+        level, key = heappop(candidates)
+
+        if level == resolution:
+            keys.append(key)
+            continue
+
+        children = [
+            (child, contained)
+            for child in tile_to_children(key)
+            for contained in [classify(child)]
+            if contained is not None
+        ]
+
+        if max_cells is not None and (
+            len(keys) + len(candidates) + len(children) > max_cells
+        ):
+            keys.append(key)
+            continue
+
+        for child, contained in children:
+            if contained:
+                keys.append(child)
+            else:
+                heappush(candidates, (level + 1, child))
+
+    return compact(keys)
+
+
+@cached("boundary", "bing")
 def tile_to_geo_boundary(key):
 
-    a = Tile.from_quad_tree(key)
+    min_lon, min_lat, max_lon, max_lat = _xyz_to_bounds(*_quadkey_to_xyz(key), _SCALAR)
+
     return (
-        "Polygon (("
-        + f"{a.bounds[0].longitude}"
-        + " "
-        + f"{a.bounds[0].latitude}"
-        + ","
-        + f"{a.bounds[0].longitude}"
-        + " "
-        + f"{a.bounds[1].latitude}"
-        + ","
-        + f"{a.bounds[1].longitude}"
-        + " "
-        + f"{a.bounds[1].latitude}"
-        + ","
-        + f"{a.bounds[1].longitude}"
-        + " "
-        + f"{a.bounds[0].latitude}"
-        + ","
-        + f"{a.bounds[0].longitude}"
-        + " "
-        + f"{a.bounds[0].latitude}"
-        + "))"
+        f"Polygon (({min_lon} {min_lat},{min_lon} {max_lat},"
+        f"{max_lon} {max_lat},{max_lon} {min_lat},{min_lon} {min_lat}))"
     )
 
 
+def geo_to_xy_batch(lats, lons, resolution):
+    """Tile x, y of arrays of points at a zoom level. Points are snapped to
+    the closest pixel before finding their tile, as pygeotile does.
+
+    Parameters
+    ----------
+    lats : numpy.ndarray
+        latitudes, clipped to +-MAX_LATITUDE
+    lons : numpy.ndarray
+        longitudes
+    resolution : int
+        zoom level
+
+    Returns
+    -------
+    tuple
+        Arrays of tile x and y, as int64
+    """
+
+    x, y = _geo_to_xy(
+        np.asarray(lats, dtype=float), np.asarray(lons, dtype=float), resolution, _ARRAY
+    )
+
+    return x.astype(np.int64), y.astype(np.int64)
+
+
+def xy_to_quadkey_batch(x, y, resolution):
+    """Quadkeys of arrays of tile x, y at a zoom level
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of quadkeys
+    """
+
+    x, y = np.asarray(x, dtype=np.int64), np.asarray(y, dtype=np.int64)
+
+    digits = np.empty((len(x), resolution), dtype=np.uint8)
+    for i in range(resolution):
+        shift = resolution - 1 - i
+        digits[:, i] = ((x >> shift) & 1) | (((y >> shift) & 1) << 1)
+
+    digits += ord("0")
+
+    return digits.view(f"S{resolution}").ravel().astype(str).astype(object)
+
+
+def xy_to_quadint_batch(x, y, resolution):
+    """Packed quadkeys, see `quadkey_to_int`, of arrays of tile x, y at a
+    zoom level
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of packed quadkeys, as int64
+    """
+
+    x, y = np.asarray(x, dtype=np.int64), np.asarray(y, dtype=np.int64)
+
+    digits = np.zeros(len(x), dtype=np.int64)
+    for i in range(resolution):
+        digits |= (((x >> i) & 1) | (((y >> i) & 1) << 1)) << 2 * i
+
+    return (digits << 2 * (QUADKEY_MAX_LEVEL - resolution) + _LEVEL_BITS) | resolution
+
+
+def quadkey_to_xyz_batch(keys):
+    """Tile x, y and zoom of arrays of quadkeys, of any resolution
+
+    Returns
+    -------
+    tuple
+        Arrays of tile x, y and zoom, as int64
+    """
+
+    keys = np.asarray(keys, dtype=bytes)
+    length = keys.dtype.itemsize
+
+    digits = keys.view(np.uint8).reshape(len(keys), length).astype(np.int64)
+    z = np.count_nonzero(digits, axis=1)
+    digits -= ord("0")
+
+    x = np.zeros(len(keys), dtype=np.int64)
+    y = np.zeros(len(keys), dtype=np.int64)
+    for i in range(length):
+        valid = i < z
+        x = np.where(valid, (x << 1) | (digits[:, i] & 1), x)
+        y = np.where(valid, (y << 1) | (digits[:, i] >> 1), y)
+
+    return x, y, z
+
+
+def xyz_to_bounds_batch(x, y, z):
+    """Web Mercator bounds of arrays of tile x, y at zoom z, computed as
+    pygeotile does.
+
+    Returns
+    -------
+    tuple
+        Arrays of min_lon, min_lat, max_lon and max_lat
+    """
+
+    return _xyz_to_bounds(np.asarray(x), np.asarray(y), np.asarray(z), _ARRAY)
+
+
+def tile_to_bounds_batch(keys):
+    """Web Mercator bounds of arrays of quadkeys
+
+    Parameters
+    ----------
+    keys : numpy.ndarray
+        Quadkeys, of any resolution
+
+    Returns
+    -------
+    tuple
+        Arrays of min_lon, min_lat, max_lon and max_lat
+    """
+
+    return xyz_to_bounds_batch(*quadkey_to_xyz_batch(keys))
+
+
 def geo_to_tile(lat, lon, resolution):
 
-    return Tile.for_latitude_longitude(lat, lon, resolution).quad_tree
+    x, y = _geo_to_xy(lat, lon, resolution, _SCALAR)
+
+    return _xyz_to_quadkey(x, y, resolution)
+
+
+def geo_to_tile_batch(lats, lons, resolution):
+
+    return xy_to_quadkey_batch(*geo_to_xy_batch(lats, lons, resolution), resolution)
+
+
+def geo_to_quadint_batch(lats, lons, resolution):
+
+    return xy_to_quadint_batch(*geo_to_xy_batch(lats, lons, resolution), resolution)
 
 
 def tile_get_resolution(key):
 
-    return Tile.from_quad_tree(key).zoom
+    return len(key)
+
 
+def tile_to_children(key, resolution=None):
 
-def tile_to_children(key):
+    if resolution is not None:
+        return tuple(_key_descendants(key, resolution))
 
     return tuple([key + str(i) for i in range(4)])
 
 
-def tile_to_parent(key):
+def tile_to_parent(key, resolution=None):
+
+    if resolution is not None:
+        return key[:resolution]
 
     if len(key) > 1:
         return key[:-1]
     else:
         return key
+
+
+def tile_to_neighbors(key, k=1):
+    """Quadkeys within k tiles of a quadkey in x and y, itself included.
+    Tiles wrap around the antimeridian and stop at the poles.
+    """
+
+    return list(tile_to_neighbors_batch([key], k))
+
+
+def tile_to_neighbors_batch(keys, k=1):
+    """Quadkeys within k tiles of arrays of quadkeys, of any resolution.
+    Neighbors shared by several quadkeys are returned once.
+
+    Returns
+    -------
+    numpy.ndarray
+        Quadkeys, sorted
+    """
+
+    x, y, z = quadkey_to_xyz_batch(keys)
+    steps = np.arange(-k, k + 1)
+    dx, dy = [d.ravel() for d in np.meshgrid(steps, steps)]
+
+    neighbors = [np.array([], dtype=object)]
+    for level in np.unique(z).tolist():
+
+        same_level = z == level
+        n = 2 ** level
+
+        nx = (x[same_level, None] + dx) % n
+        ny = y[same_level, None] + dy
+        valid = (ny >= 0) & (ny < n)
+
+        neighbors.append(xy_to_quadkey_batch(nx[valid], ny[valid], level))
+
+    return np.unique(np.concatenate(neighbors).astype(str)).astype(object)
+
+
+def quadkey_to_int(key):
+    """Packs a quadkey in a 64-bit integer. The digits are stored as 2 bits
+    each, left aligned at QUADKEY_MAX_LEVEL, followed by 5 bits with the
+    level. Integers sort as their quadkeys, parents first.
+
+    Parameters
+    ----------
+    key : str
+        Quadkey, with resolution up to QUADKEY_MAX_LEVEL
+
+    Returns
+    -------
+    int
+        Packed quadkey
+    """
+
+    level = len(key)
+    digits = int(key, 4) if level else 0
+
+    return (digits << 2 * (QUADKEY_MAX_LEVEL - level) + _LEVEL_BITS) | level
+
+
+def int_to_quadkey(value):
+    """Unpacks a quadkey packed by `quadkey_to_int`
+
+    Parameters
+    ----------
+    value : int
+        Packed quadkey
+
+    Returns
+    -------
+    str
+        Quadkey
+    """
+
+    level = value & _LEVEL_MASK
+
+    if not level:
+        return ""
+
+    digits = value >> 2 * (QUADKEY_MAX_LEVEL - level) + _LEVEL_BITS
+
+    return np.base_repr(digits, 4).zfill(level)
+
+
+def quadint_get_resolution(value):
+
+    return value & _LEVEL_MASK
+
+
+def quadint_to_parent(value, resolution=None):
+    """Ancestor of a packed quadkey at a given resolution, by default the
+    resolution of the quadkey minus one. As in `tile_to_parent`, keys of
+    resolution 1 are their own parent.
+    """
+
+    if resolution is None:
+        resolution = max((value & _LEVEL_MASK) - 1, 1)
+
+    shift = 2 * (QUADKEY_MAX_LEVEL - resolution) + _LEVEL_BITS
+
+    return (value >> shift << shift) | resolution
+
+
+def quadint_to_children(value, resolution=None):
+    """Descendants of a packed quadkey at a given resolution, by default the
+    resolution of the quadkey plus one.
+    """
+
+    level = value & _LEVEL_MASK
+
+    if resolution is None:
+        resolution = level + 1
+
+    shift = 2 * (QUADKEY_MAX_LEVEL - resolution) + _LEVEL_BITS
+    base = value & ~_LEVEL_MASK
+
+    return tuple(
+        [base | (i << shift) | resolution for i in range(4 ** (resolution - level))]
+    )
+
+
+def quadints_get_resolution_batch(values):
+
+    return np.asarray(values, dtype=np.int64) & _LEVEL_MASK
+
+
+def quadints_to_parent_batch(values, resolution):
+    """Ancestors of arrays of packed quadkeys at a given resolution"""
+
+    shift = 2 * (QUADKEY_MAX_LEVEL - resolution) + _LEVEL_BITS
+
+    return (np.asarray(values, dtype=np.int64) >> shift << shift) | resolution
+
+
+def quadints_to_children_batch(values, resolution):
+    """Descendants of arrays of packed quadkeys at a given resolution. The
+    descendants of each quadkey are sorted and follow the order of values.
+    """
+
+    values = np.asarray(values, dtype=np.int64).ravel()
+
+    counts = quadints_children_count_batch(values, resolution)
+    base = np.repeat(values & ~_LEVEL_MASK, counts)
+
+    # Position of each descendant among the descendants of its quadkey
+    offsets = np.cumsum(counts) - counts
+    k = np.arange(len(base), dtype=np.int64) - np.repeat(offsets, counts)
+
+    shift = 2 * (QUADKEY_MAX_LEVEL - resolution) + _LEVEL_BITS
+
+    return base | (k << shift) | resolution
+
+
+def quadints_children_count_batch(values, resolution):
+
+    return np.int64(4) ** (resolution - quadints_get_resolution_batch(values))
+
+
+def compact(keys):
+    """Compacts a set of quadkeys. Complete groups of four siblings are
+    replaced by their parent, recursively, and keys with an ancestor in the
+    set are dropped.
+
+    Parameters
+    ----------
+    keys : list
+        Quadkeys, of any resolution
+
+    Returns
+    -------
+    list
+        Mixed resolution quadkeys, sorted
+    """
+
+    compacted = set(keys)
+    compacted = {
+        key
+        for key in compacted
+        if not any(key[:i] in compacted for i in range(1, len(key)))
+    }
+
+    for level in range(max(map(len, compacted), default=0), 1, -1):
+
+        parents = Counter(key[:-1] for key in compacted if len(key) == level)
+
+        for parent, count in parents.items():
+            if count == 4:
+                compacted.difference_update(tile_to_children(parent))
+                compacted.add(parent)
+
+    return sorted(compacted)
+
+
+def uncompact(keys, resolution):
+    """Expands quadkeys to all their descendants at a given resolution
+
+    Parameters
+    ----------
+    keys : list
+        Quadkeys, with resolution up to resolution
+    resolution : int
+
+    Returns
+    -------
+    list
+        Quadkeys at resolution
+    """
+
+    keys = list(keys)
+
+    if any(len(key) > resolution for key in keys):
+        raise Exception(f"All quadkeys must have a resolution up to {resolution}")
+
+    # Descendants shared by overlapping inputs are returned once
+    return list(
+        dict.fromkeys(
+            descendant
+            for key in keys
+            for descendant in _key_descendants(key, resolution)
+        )
+    )
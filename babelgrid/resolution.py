@@ -0,0 +1,143 @@
+"""Resolution lookup by tile area.
+
+The mean Web Mercator tile area of each grid, per resolution and absolute
+latitude band, is precomputed in `babelgrid.area_tables`. To regenerate it,
+run
+
+```
+python -m babelgrid.resolution > babelgrid/area_tables.py
+```
+"""
+
+import textwrap
+from bisect import bisect_left
+
+import numpy as np
+
+from babelgrid import area
+from babelgrid.area_tables import AREA_TABLES, LATITUDE_BAND, MAX_LATITUDE
+
+GRID_TABLES = {"s2": "s2", "h3": "h3", "bing": "bing", "quadtree": "bing"}
+
+# Sampled longitudes stay away from the antimeridian, where coarse cells
+# wrap around and their planar geometry is meaningless.
+SAMPLE_LONGITUDES = (-120, -60, 0, 60, 120)
+SAMPLES_PER_BAND = 5
+
+# Areas negated per band, so they are increasing and can be bisected
+_SEARCH_TABLES = {
+    grid_type: [[-area for area in areas] for areas in bands]
+    for grid_type, bands in AREA_TABLES.items()
+}
+
+
+def _latitude_band(lat):
+
+    return int(min(abs(lat), MAX_LATITUDE - 1e-9) // LATITUDE_BAND)
+
+
+def best_resolution(grid_type, lat, area_km, resolutions):
+    """Resolution which mean tile area at the latitude is the closest to
+    area_km. It is a binary search over the precomputed area tables.
+
+    Parameters
+    ----------
+    grid_type : str
+    lat : float
+        latitude
+    area_km : float
+        Desired tile area in km squared
+    resolutions : range
+        Resolution range of the grid
+
+    Returns
+    -------
+    int
+        Best resolution
+    """
+
+    table = _SEARCH_TABLES[GRID_TABLES[grid_type]][_latitude_band(lat)]
+
+    i = bisect_left(table, -area_km)
+    candidates = [j for j in (i - 1, i) if 0 <= j < len(table)]
+    best = min(candidates, key=lambda j: abs(-table[j] - area_km))
+
+    return resolutions[best]
+
+
+def build_area_tables():
+    """Computes the mean tile area per grid, resolution and latitude band.
+
+    Returns
+    -------
+    dict
+        {grid_type: [[area of each resolution] for each latitude band]}
+    """
+
+    from babelgrid import Babel
+
+    band_offsets = (np.arange(SAMPLES_PER_BAND) + 0.5) / SAMPLES_PER_BAND
+
+    tables = {}
+    for grid_type in ("s2", "h3", "bing"):
+
+        babel = Babel(grid_type)
+        tables[grid_type] = []
+
+        for band_start in range(0, MAX_LATITUDE, LATITUDE_BAND):
+
+            lats = band_start + LATITUDE_BAND * band_offsets
+            lats = np.concatenate([lats, -lats])
+            lats, lons = np.meshgrid(lats, SAMPLE_LONGITUDES)
+
+            areas = np.array(
+                [
+                    area.polygons_area_km(
+                        [
+                            babel.id_to_tile(tile_id).geometry.shapely
+                            for tile_id in babel.geo_to_tiles(lats, lons, resolution)
+                        ]
+                    ).mean()
+                    for resolution in babel.grid_range()
+                ]
+            )
+
+            # Coarse cells spanning a large part of the globe do not have a
+            # meaningful planar area. Areas are forced to decrease with the
+            # resolution, so the table can be bisected.
+            areas = np.maximum.accumulate(areas[::-1])[::-1]
+
+            tables[grid_type].append(areas.tolist())
+
+    return tables
+
+
+if __name__ == "__main__":
+
+    tables = build_area_tables()
+
+    print('"""Mean tile area in km squared per grid, resolution and absolute latitude')
+    print("band. Generated by `python -m babelgrid.resolution`, do not edit.")
+    print('"""')
+    print()
+    print(f"LATITUDE_BAND = {LATITUDE_BAND}")
+    print(f"MAX_LATITUDE = {MAX_LATITUDE}")
+    print()
+    print("# fmt: off")
+    print("AREA_TABLES = {")
+    for grid_type, bands in tables.items():
+        print(f'    "{grid_type}": [')
+        for areas in bands:
+            print("        [")
+            print(
+                textwrap.fill(
+                    ", ".join(f"{a:.10g}" for a in areas) + ",",
+                    width=88,
+                    initial_indent=" " * 12,
+                    subsequent_indent=" " * 12,
+                )
+            )
+            print("        ],")
+        print("    ],")
+    print("}")
+    print("# fmt: on")
@@ -1,35 +1,235 @@
-from s2sphere import RegionCoverer, LatLng, LatLngRect, CellId, Cell
-from shapely.geometry import Polygon
+import math
+from functools import lru_cache
+from heapq import heappop, heappush
 
+import numpy as np
+from s2sphere import RegionCoverer, LatLng, LatLngRect, CellId, Cell, CellUnion
+from shapely.geometry import Polygon, shape
+from shapely.prepared import prep
 
-def _geo_json_to_extremes(geo_json):
+from babelgrid import profiling
+from babelgrid.cache import cached
+from babelgrid.libm import elementwise
 
-    coordinates = geo_json["coordinates"][0]
+# Number of cells used to cover the geometry bounding box before refinement
+INITIAL_MAX_CELLS = 8
 
-    lon = [x[0] for x in coordinates]
-    lat = [x[1] for x in coordinates]
+# Cells coarser than this level have their geodesic edges densified when
+# tested against the geometry
+DENSIFY_MAX_LEVEL = 12
+DENSIFY_POINTS = 8
 
-    return lat, lon
+# Cell id layout and Hilbert curve constants of the vectorized cell math.
+# They follow s2sphere, so ids and vertices are bit-for-bit the same.
+MAX_LEVEL = 30
+_MAX_SIZE = 1 << MAX_LEVEL
+_LOOKUP_BITS = 4
+_SWAP_MASK = 1
+_INVERT_MASK = 2
+_POS_TO_IJ = ((0, 1, 3, 2), (0, 2, 3, 1), (3, 2, 0, 1), (3, 1, 0, 2))
+_POS_TO_ORIENTATION = (_SWAP_MASK, 0, 0, _INVERT_MASK | _SWAP_MASK)
 
 
-def _bbox_polyfill(
-    geo_json, res,
-):
-    """returns list of S2 ids"""
+def _initial_covering(geometry, res):
+    """Covers the geometry bounding box with a few coarse cells."""
 
-    lat, lon = _geo_json_to_extremes(geo_json)
+    min_lon, min_lat, max_lon, max_lat = geometry.bounds
 
-    p1 = LatLng.from_degrees(min(lat), min(lon))
-    p2 = LatLng.from_degrees(max(lat), max(lon))
-
-    region = LatLngRect.from_point_pair(p1, p2)
+    region = LatLngRect.from_point_pair(
+        LatLng.from_degrees(min_lat, min_lon), LatLng.from_degrees(max_lat, max_lon)
+    )
 
     coverer = RegionCoverer()
-    coverer.min_level = res
     coverer.max_level = res
+    coverer.max_cells = INITIAL_MAX_CELLS
     return coverer.get_covering(region)
 
 
+def _cell_to_polygon(cell_id, densify=False):
+    """Planar (lng, lat) shapely Polygon of a cell. If densify, the geodesic
+    edges are approximated with DENSIFY_POINTS points each."""
+
+    cell = Cell(cell_id)
+    vertices = [cell.get_vertex_raw(i) for i in range(4)]
+
+    if densify:
+        points = [
+            vertices[i] * (1 - t / DENSIFY_POINTS)
+            + vertices[(i + 1) % 4] * (t / DENSIFY_POINTS)
+            for i in range(4)
+            for t in range(DENSIFY_POINTS)
+        ]
+    else:
+        points = vertices
+
+    return Polygon([_to_lonlat(LatLng.from_point(p)) for p in points])
+
+
+def _hierarchical_polyfill(geometry, res):
+    """Yields the CellIds at level res that intersect geometry.
+
+    Starts from a coarse covering of the bounding box and tests each cell
+    against the prepared geometry. Cells fully inside are expanded to their
+    descendants without further tests, cells outside are dropped and only
+    cells on the boundary are refined. CellIds are yielded sorted.
+    """
+
+    prepared = prep(geometry)
+
+    to_polygon = profiling.instrument(_cell_to_polygon, "s2.candidates")
+    intersects = profiling.instrument(prepared.intersects, "s2.geometry_tests")
+    contains = profiling.instrument(prepared.contains, "s2.geometry_tests")
+
+    stack = list(reversed(_initial_covering(geometry, res)))
+
+    while stack:
+
+        cell_id = stack.pop()
+        level = cell_id.level()
+        cell_polygon = to_polygon(cell_id, level < DENSIFY_MAX_LEVEL)
+
+        if not intersects(cell_polygon):
+            continue
+
+        if level == res:
+            yield cell_id
+        elif contains(cell_polygon):
+            yield from cell_id.children(res)
+        else:
+            stack.extend(reversed(list(cell_id.children())))
+
+
+@lru_cache(maxsize=None)
+def _lookup_tables():
+    """Hilbert curve lookup tables that convert 4 bits of i and j plus an
+    orientation to 8 bits of position plus an orientation, and back."""
+
+    lookup_pos = np.zeros(1 << (2 * _LOOKUP_BITS + 2), dtype=np.int64)
+    lookup_ij = np.zeros(1 << (2 * _LOOKUP_BITS + 2), dtype=np.int64)
+
+    def init(level, i, j, orig_orientation, pos, orientation):
+
+        if level == _LOOKUP_BITS:
+            ij = (i << _LOOKUP_BITS) + j
+            lookup_pos[(ij << 2) + orig_orientation] = (pos << 2) + orientation
+            lookup_ij[(pos << 2) + orig_orientation] = (ij << 2) + orientation
+            return
+
+        r = _POS_TO_IJ[orientation]
+        for index in range(4):
+            init(
+                level + 1,
+                (i << 1) + (r[index] >> 1),
+                (j << 1) + (r[index] & 1),
+                orig_orientation,
+                (pos << 2) + index,
+                orientation ^ _POS_TO_ORIENTATION[index],
+            )
+
+    for orientation in range(4):
+        init(0, 0, 0, orientation, 0, orientation)
+
+    return lookup_pos, lookup_ij
+
+
+def _xyz_to_face_uv(x, y, z):
+
+    ax, ay, az = np.abs(x), np.abs(y), np.abs(z)
+
+    face = np.where(ax > ay, np.where(ax > az, 0, 2), np.where(ay > az, 1, 2))
+    face = face + 3 * (np.choose(face, (x, y, z)) < 0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        u = np.choose(face, (y / x, -x / y, -x / z, z / x, z / y, -y / z))
+        v = np.choose(face, (z / x, z / y, -y / z, y / x, -x / y, -x / z))
+
+    return face, u, v
+
+
+def _face_uv_to_xyz(face, u, v):
+
+    one = np.ones_like(u)
+
+    x = np.choose(face, (one, -u, -u, -one, v, v))
+    y = np.choose(face, (u, one, -v, -v, -one, u))
+    z = np.choose(face, (v, v, one, -u, -u, -one))
+
+    return x, y, z
+
+
+def _uv_to_st(u):
+
+    with np.errstate(invalid="ignore"):
+        return np.where(u >= 0, 0.5 * np.sqrt(1 + 3 * u), 1 - 0.5 * np.sqrt(1 - 3 * u))
+
+
+def _st_to_uv(s):
+
+    return np.where(
+        s >= 0.5,
+        (1.0 / 3.0) * (4 * s * s - 1),
+        (1.0 / 3.0) * (1 - 4 * (1 - s) * (1 - s)),
+    )
+
+
+def _st_to_ij(s):
+
+    return np.clip(np.floor(_MAX_SIZE * s), 0, _MAX_SIZE - 1).astype(np.int64)
+
+
+def _face_ij_to_ids(face, i, j):
+    """Leaf cell ids, as uint64, of face and i, j leaf coordinates."""
+
+    lookup_pos, _ = _lookup_tables()
+    mask = (1 << _LOOKUP_BITS) - 1
+
+    n = face.astype(np.int64) << (2 * MAX_LEVEL)
+    bits = face & _SWAP_MASK
+
+    for k in range(7, -1, -1):
+        bits = bits + (((i >> k * _LOOKUP_BITS) & mask) << (_LOOKUP_BITS + 2))
+        bits = bits + (((j >> k * _LOOKUP_BITS) & mask) << 2)
+        bits = lookup_pos[bits]
+        n |= (bits >> 2) << (k * 2 * _LOOKUP_BITS)
+        bits &= _SWAP_MASK | _INVERT_MASK
+
+    return n.astype(np.uint64) * np.uint64(2) + np.uint64(1)
+
+
+def _ids_to_face_ij(cell_ids):
+    """Face and i, j leaf coordinates of the first leaf of uint64 cell ids."""
+
+    _, lookup_ij = _lookup_tables()
+    mask = (1 << _LOOKUP_BITS) - 1
+
+    # The int64 view keeps the bits, the face is masked after the shift
+    ids = cell_ids.view(np.int64)
+    face = (ids >> (2 * MAX_LEVEL + 1)) & 7
+
+    i = np.zeros(len(ids), dtype=np.int64)
+    j = np.zeros(len(ids), dtype=np.int64)
+    bits = face & _SWAP_MASK
+
+    for k in range(7, -1, -1):
+        nbits = MAX_LEVEL - 7 * _LOOKUP_BITS if k == 7 else _LOOKUP_BITS
+        bits = bits + (
+            ((ids >> (k * 2 * _LOOKUP_BITS + 1)) & ((1 << 2 * nbits) - 1)) << 2
+        )
+        bits = lookup_ij[bits]
+        i += (bits >> (_LOOKUP_BITS + 2)) << (k * _LOOKUP_BITS)
+        j += ((bits >> 2) & mask) << (k * _LOOKUP_BITS)
+        bits &= _SWAP_MASK | _INVERT_MASK
+
+    return face, i, j
+
+
+def _ids_to_parent(cell_ids, res):
+
+    lsb = np.uint64(1 << 2 * (MAX_LEVEL - res))
+
+    return (cell_ids & ~(lsb - np.uint64(1))) | lsb
+
+
 def _geo_to_wkt(geo, repeat_last=True):
     """returns geo as wkt"""
 
@@ -41,15 +241,6 @@ def _geo_to_wkt(geo, repeat_last=True):
     ).replace("]", ")")
 
 
-def _swipes(x):
-    return [x[1], x[0]]
-
-
-def _geo_intersect(geo_1, geo_2):
-
-    return Polygon(geo_1).intersects(Polygon(geo_2))
-
-
 def _to_latlon(x):
     return [x.lat().degrees, x.lng().degrees]
 
@@ -100,6 +291,31 @@ def geo_to_s2(lat, lon, res):
     return CellId.from_lat_lng(LatLng.from_degrees(lat, lon)).parent(res).to_token()
 
 
+def geo_to_s2_batch(lats, lons, res):
+    """Get s2 tokens for arrays of points at a given resolution
+
+    Parameters
+    ----------
+    lats : numpy.ndarray
+        latitudes
+    lons : numpy.ndarray
+        longitudes
+    res : int
+        s2 square resolution, from 0 to 30
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of s2 unique tokens
+    """
+    tokens = [
+        s2_id_to_token(cell_id)
+        for cell_id in geo_to_s2_id_batch(lats, lons, res).tolist()
+    ]
+
+    return np.array(tokens, dtype=object)
+
+
 def s2_get_resolution(s2_address):
     """Gets resolution from s2 token. Resolution can vary
     from 0 to 30
@@ -114,7 +330,7 @@ def s2_get_resolution(s2_address):
     int
         Resolution
     """
-    return _token_to_cell(s2_address).level()
+    return s2_id_get_resolution(s2_token_to_id(s2_address))
 
 
 def s2_is_valid(s2_address):
@@ -136,15 +352,319 @@ def s2_is_valid(s2_address):
         return False
 
 
-def s2_to_children(s2_address):
+def s2_to_children(s2_address, res=None):
 
     return [
-        children.to_token() for children in CellId.from_token(s2_address).children()
+        s2_id_to_token(child)
+        for child in s2_id_to_children(s2_token_to_id(s2_address), res)
     ]
 
 
-def s2_to_parent(s2_address):
-    return CellId.from_token(s2_address).parent().to_token()
+def s2_to_parent(s2_address, res=None):
+    return s2_id_to_token(s2_id_to_parent(s2_token_to_id(s2_address), res))
+
+
+def s2_to_neighbors(s2_address, k=1):
+    """Gets the s2 squares within k steps of a s2 square, itself
+    included. Each step adds the edge and vertex neighbors of the squares
+    found so far.
+
+    Parameters
+    ----------
+    s2_address : string
+        Unique s2 token
+    k : int, optional
+        Number of steps, by default 1
+
+    Returns
+    -------
+    list
+        s2 unique tokens, sorted by cell id
+    """
+    cell_id = CellId.from_token(s2_address)
+    level = cell_id.level()
+
+    visited = {cell_id.id(): cell_id}
+    frontier = [cell_id]
+
+    for _ in range(k):
+
+        ring = []
+        for cell_id in frontier:
+            for neighbor in cell_id.get_all_neighbors(level):
+                if neighbor.id() not in visited:
+                    visited[neighbor.id()] = neighbor
+                    ring.append(neighbor)
+
+        frontier = ring
+
+    return [visited[cell_id].to_token() for cell_id in sorted(visited)]
+
+
+def s2_token_to_id(s2_address):
+    """Gets the 64-bit integer cell id of a s2 token
+
+    Parameters
+    ----------
+    s2_address : string
+        Unique s2 token
+
+    Returns
+    -------
+    int
+        s2 cell id, from 0 to 2**64 - 1
+    """
+    return int(s2_address.ljust(16, "0"), 16)
+
+
+def s2_id_to_token(cell_id):
+    """Gets the s2 token of a 64-bit integer cell id
+
+    Parameters
+    ----------
+    cell_id : int
+        s2 cell id
+
+    Returns
+    -------
+    string
+        Unique s2 token
+    """
+    return format(cell_id, "016x").rstrip("0")
+
+
+def s2_id_get_resolution(cell_id):
+    """Gets resolution from a s2 cell id. The lowest set bit of the id
+    marks the level.
+
+    Parameters
+    ----------
+    cell_id : int
+        s2 cell id
+
+    Returns
+    -------
+    int
+        Resolution, from 0 to 30
+    """
+    return 30 - ((cell_id & -cell_id).bit_length() - 1) // 2
+
+
+def s2_id_to_parent(cell_id, res=None):
+    """Gets the ancestor of a s2 cell id at a given resolution
+
+    Parameters
+    ----------
+    cell_id : int
+        s2 cell id
+    res : int, optional
+        Resolution of the ancestor, by default the resolution of the cell
+        minus one. Cells of resolution 0 are their own parent.
+
+    Returns
+    -------
+    int
+        s2 cell id of the ancestor
+    """
+    if res is None:
+        res = max(s2_id_get_resolution(cell_id) - 1, 0)
+
+    lsb = 1 << 2 * (30 - res)
+
+    return (cell_id & -lsb) | lsb
+
+
+def s2_id_to_children(cell_id, res=None):
+    """Gets the descendants of a s2 cell id at a given resolution
+
+    Parameters
+    ----------
+    cell_id : int
+        s2 cell id
+    res : int, optional
+        Resolution of the descendants, by default the resolution of the
+        cell plus one
+
+    Returns
+    -------
+    list
+        s2 cell ids of the descendants, sorted
+    """
+    lsb = cell_id & -cell_id
+    child_lsb = lsb >> 2 if res is None else 1 << 2 * (30 - res)
+
+    return list(range(cell_id - lsb + child_lsb, cell_id + lsb, 2 * child_lsb))
+
+
+def s2_ids_get_resolution_batch(cell_ids):
+    """Gets resolutions of arrays of s2 cell ids
+
+    Parameters
+    ----------
+    cell_ids : numpy.ndarray
+        s2 cell ids
+
+    Returns
+    -------
+    numpy.ndarray
+        Resolutions, as int64
+    """
+    cell_ids = np.asarray(cell_ids, dtype=np.uint64)
+
+    # Exponent of the lowest set bit gives the level, exactly
+    _, exponent = np.frexp((cell_ids & (~cell_ids + np.uint64(1))).astype(float))
+
+    return MAX_LEVEL - (exponent.astype(np.int64) - 1) // 2
+
+
+def s2_ids_to_parent_batch(cell_ids, res):
+    """Gets the ancestors of arrays of s2 cell ids at a given resolution
+
+    Parameters
+    ----------
+    cell_ids : numpy.ndarray
+        s2 cell ids, with resolution from res
+    res : int
+        Resolution of the ancestors
+
+    Returns
+    -------
+    numpy.ndarray
+        s2 cell ids of the ancestors, as uint64
+    """
+    return _ids_to_parent(np.asarray(cell_ids, dtype=np.uint64), res)
+
+
+def s2_ids_to_children_batch(cell_ids, res):
+    """Gets the descendants of arrays of s2 cell ids at a given resolution
+
+    Parameters
+    ----------
+    cell_ids : numpy.ndarray
+        s2 cell ids, with resolution up to res
+    res : int
+        Resolution of the descendants
+
+    Returns
+    -------
+    numpy.ndarray
+        s2 cell ids of the descendants, as uint64. The descendants of each
+        cell are sorted and follow the order of cell_ids.
+    """
+    cell_ids = np.asarray(cell_ids, dtype=np.uint64).ravel()
+
+    counts = s2_ids_children_count_batch(cell_ids, res)
+    first = np.repeat(cell_ids - (cell_ids & (~cell_ids + np.uint64(1))), counts)
+
+    # Position of each descendant among the descendants of its cell
+    offsets = np.cumsum(counts) - counts
+    k = np.arange(len(first), dtype=np.uint64) - np.repeat(offsets, counts).astype(
+        np.uint64
+    )
+
+    child_lsb = np.uint64(1 << 2 * (MAX_LEVEL - res))
+
+    return first + child_lsb * (np.uint64(2) * k + np.uint64(1))
+
+
+def s2_ids_children_count_batch(cell_ids, res):
+    """Gets the number of descendants of arrays of s2 cell ids at a given
+    resolution
+
+    Returns
+    -------
+    numpy.ndarray
+        Number of descendants, as int64
+    """
+    return np.int64(4) ** (res - s2_ids_get_resolution_batch(cell_ids))
+
+
+def geo_to_s2_id_batch(lats, lons, res):
+    """Get s2 cell ids for arrays of points at a given resolution
+
+    Parameters
+    ----------
+    lats : numpy.ndarray
+        latitudes
+    lons : numpy.ndarray
+        longitudes
+    res : int
+        s2 square resolution, from 0 to 30
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of s2 cell ids, as uint64
+    """
+    lat = np.radians(np.asarray(lats, dtype=float).ravel())
+    lng = np.radians(np.asarray(lons, dtype=float).ravel())
+
+    cos_lat = elementwise(math.cos, lat)
+    face, u, v = _xyz_to_face_uv(
+        elementwise(math.cos, lng) * cos_lat,
+        elementwise(math.sin, lng) * cos_lat,
+        elementwise(math.sin, lat),
+    )
+
+    cell_ids = _face_ij_to_ids(face, _st_to_ij(_uv_to_st(u)), _st_to_ij(_uv_to_st(v)))
+
+    return _ids_to_parent(cell_ids, res)
+
+
+def s2_id_to_vertices_batch(cell_ids):
+    """Get the four vertices of arrays of s2 cell ids, in counterclockwise
+    order as `Cell.get_vertex`
+
+    Parameters
+    ----------
+    cell_ids : numpy.ndarray
+        s2 cell ids
+
+    Returns
+    -------
+    tuple
+        Arrays of latitudes and longitudes, in degrees, of shape (n, 4)
+    """
+    cell_ids = np.asarray(cell_ids, dtype=np.uint64).ravel()
+
+    face, i, j = _ids_to_face_ij(cell_ids)
+    size = np.int64(1) << (MAX_LEVEL - s2_ids_get_resolution_batch(cell_ids))
+
+    uv = []
+    for ij in (i, j):
+        ij_lo = ij & -size
+        uv.append(
+            (
+                _st_to_uv((1.0 / _MAX_SIZE) * ij_lo),
+                _st_to_uv((1.0 / _MAX_SIZE) * (ij_lo + size)),
+            )
+        )
+
+    (u0, u1), (v0, v1) = uv
+    u = np.stack([u0, u1, u1, u0], axis=1)
+    v = np.stack([v0, v0, v1, v1], axis=1)
+
+    x, y, z = _face_uv_to_xyz(face[:, None], u, v)
+
+    norm = 1.0 / np.sqrt(x * x + y * y + z * z)
+    x, y, z = x * norm, y * norm, z * norm
+
+    lats = np.degrees(elementwise(math.atan2, z, np.sqrt(x * x + y * y)))
+    lons = np.degrees(elementwise(math.atan2, y, x))
+
+    return lats, lons
+
+
+@cached("boundary", "s2")
+def _cell_vertices(s2_address):
+    """(lat, lng) of the four vertices of a s2 square. They are tuples since
+    they are shared through the boundary cache."""
+
+    cell = _token_to_cell(s2_address)
+
+    return tuple(
+        tuple(_to_latlon(LatLng.from_point(cell.get_vertex(i)))) for i in range(4)
+    )
 
 
 def s2_to_geo_boundary(s2_address, geo_json_conformant=False):
@@ -157,25 +677,42 @@ def s2_to_geo_boundary(s2_address, geo_json_conformant=False):
     geo_json : bool, optional
         If True, output coordinates is geo_json conformant (lng, lat)
         If False, coordinates are (lat, lng), by default False
-      
+
     Returns
     -------
     list
         Geometry of given s2 square
     """
 
-    cell = _token_to_cell(s2_address)
+    vertices = _cell_vertices(s2_address)
 
     return (
-        [_to_lonlat(LatLng.from_point(cell.get_vertex(i))) for i in [0, 1, 2, 3, 0]]
+        [[vertices[i][1], vertices[i][0]] for i in [0, 1, 2, 3, 0]]
         if geo_json_conformant
-        else [_to_latlon(LatLng.from_point(cell.get_vertex(i))) for i in [0, 1, 2, 3]]
+        else [list(vertices[i]) for i in [0, 1, 2, 3]]
     )
 
 
+def _ids_to_geo_boundaries(cell_ids, geo_json_conformant=False):
+    """Boundaries of arrays of s2 cell ids, as `s2_to_geo_boundary`"""
+
+    lats, lons = s2_id_to_vertices_batch(cell_ids)
+    lats, lons = lats.tolist(), lons.tolist()
+
+    if geo_json_conformant:
+        return [
+            [[lon[i], lat[i]] for i in [0, 1, 2, 3, 0]] for lat, lon in zip(lats, lons)
+        ]
+
+    return [[[lat[i], lon[i]] for i in [0, 1, 2, 3]] for lat, lon in zip(lats, lons)]
+
+
 def polyfill(geo_json, res, geo_json_conformant=False, with_id=False):
     """Fill a polygon with s2 squares at given resolution
-    
+
+    Cells are found with a hierarchical covering, see `polyfill_ids`.
+    Polygons with holes and MultiPolygons are accepted.
+
     Parameters
     ----------
     geo_json : dict
@@ -195,24 +732,177 @@ def polyfill(geo_json, res, geo_json_conformant=False, with_id=False):
         List of geometries of s2 squares or cell id with geometry if with_id is True
     """
 
-    cells = _bbox_polyfill(geo_json, res)
+    cell_ids = [
+        cell_id.id() for cell_id in _hierarchical_polyfill(shape(geo_json), res)
+    ]
 
-    cells_geo = map(
-        lambda c: (c.to_token(), s2_to_geo_boundary(c.to_token(), geo_json_conformant)),
-        cells,
-    )
+    with profiling.timer("s2.boundaries"):
+        boundaries = _ids_to_geo_boundaries(cell_ids, geo_json_conformant)
+
+    if with_id:
+
+        return [
+            {"id": s2_id_to_token(cell_id), "geometry": boundary}
+            for cell_id, boundary in zip(cell_ids, boundaries)
+        ]
 
-    if geo_json_conformant:
-        coordinates = geo_json["coordinates"][0]
     else:
-        coordinates = list(map(_swipes, geo_json["coordinates"][0]))
 
-    filtered = filter(lambda c: _geo_intersect(coordinates, c[1]), cells_geo)
+        return boundaries
 
-    if with_id:
 
-        return list(map(lambda x: {"id": x[0], "geometry": x[1]}, filtered))
+def polyfill_ids(geo_json, res):
+    """Fill a polygon with s2 squares at given resolution. Only the
+    s2 tokens are returned, lazily, as they are found.
 
-    else:
+    The polygon is covered hierarchically: coarse cells fully inside it
+    are expanded straight to their children at `res` and only cells on its
+    boundary are refined and tested again. Polygons with holes and
+    MultiPolygons are accepted.
+
+    Parameters
+    ----------
+    geo_json : dict
+        Dictionary from a geojson
+    res : int
+        s2 square resolution, from 0 to 30
+
+    Yields
+    ------
+    string
+        s2 unique token
+    """
+
+    for cell_id in _hierarchical_polyfill(shape(geo_json), res):
+        yield cell_id.to_token()
+
+
+def polyfill_adaptive_ids(geo_json, res, max_cells=None):
+    """Cover a polygon with s2 squares of mixed resolutions, up to res.
+
+    Cells fully inside the polygon are kept as coarse as possible. Cells on
+    its boundary are refined coarsest first, down to res, while the cover
+    has at most max_cells cells. Once refining a cell would exceed the
+    budget it is kept as it is, so the cover may spill over the boundary.
+    The cover never has fewer cells than the initial covering of the
+    polygon bounding box. Complete groups of siblings are merged at the end.
+
+    Parameters
+    ----------
+    geo_json : dict
+        Dictionary from a geojson
+    res : int
+        Finest s2 square resolution, from 0 to 30
+    max_cells : int, optional
+        Cell budget, by default unbounded
+
+    Returns
+    -------
+    list
+        s2 unique tokens, sorted by cell id
+    """
+
+    geometry = shape(geo_json)
+    prepared = prep(geometry)
+
+    cells, candidates = [], []
+
+    def classify(cell_id):
 
-        return list(map(lambda x: x[1], filtered))
+        level = cell_id.level()
+        cell_polygon = _cell_to_polygon(cell_id, level < DENSIFY_MAX_LEVEL)
+
+        if not prepared.intersects(cell_polygon):
+            return None
+
+        return prepared.contains(cell_polygon)
+
+    for cell_id in _initial_covering(geometry, res):
+
+        contained = classify(cell_id)
+
+        if contained:
+            cells.append(cell_id)
+        elif contained is not None:
+            heappush(candidates, (cell_id.level(), cell_id.id(), cell_id))
+
+    while candidates:
+
+        level, _, cell_id = heappop(candidates)
+
+        if level == res:
+            cells.append(cell_id)
+            continue
+
+        children = [
+            (child, contained)
+            for child in cell_id.children()
+            for contained in [classify(child)]
+            if contained is not None
+        ]
+
+        if max_cells is not None and (
+            len(cells) + len(candidates) + len(children) > max_cells
+        ):
+            cells.append(cell_id)
+            continue
+
+        for child, contained in children:
+            if contained:
+                cells.append(child)
+            else:
+                heappush(candidates, (level + 1, child.id(), child))
+
+    return compact([cell_id.to_token() for cell_id in cells])
+
+
+def compact(s2_addresses):
+    """Compacts a set of s2 tokens. Complete groups of four siblings are
+    replaced by their parent, recursively, and tokens contained in other
+    tokens are dropped (S2 cell union normalization).
+
+    Parameters
+    ----------
+    s2_addresses : list
+        s2 unique tokens, of any resolution
+
+    Returns
+    -------
+    list
+        Mixed resolution s2 tokens, sorted by cell id
+    """
+
+    union = CellUnion([CellId.from_token(s2_address) for s2_address in s2_addresses])
+
+    return [cell_id.to_token() for cell_id in union.cell_ids()]
+
+
+def uncompact(s2_addresses, res):
+    """Expands s2 tokens to all their descendants at a given resolution
+
+    Parameters
+    ----------
+    s2_addresses : list
+        s2 unique tokens, with resolution up to res
+    res : int
+        s2 square resolution, from 0 to 30
+
+    Returns
+    -------
+    list
+        s2 tokens at resolution res
+    """
+
+    cell_ids = [CellId.from_token(s2_address) for s2_address in s2_addresses]
+
+    if any(cell_id.level() > res for cell_id in cell_ids):
+        raise Exception(f"All s2 tokens must have a resolution up to {res}")
+
+    # Descendants shared by overlapping inputs are returned once
+    return list(
+        dict.fromkeys(
+            child.to_token()
+            for cell_id in cell_ids
+            for child in (cell_id.children(res) if cell_id.level() < res else [cell_id])
+        )
+    )
@@ -0,0 +1,342 @@
+"""Sets of tiles backed by sorted integer ranges.
+
+Every tile covers a contiguous range of the finest cells of its grid, so a
+set of tiles of any resolution is stored as sorted, disjoint, inclusive
+integer intervals [lo, hi] of finest-cell positions:
+
+- s2: leaf cell position, `cell_id >> 1`
+- bing: quadkey digits at level QUADKEY_MAX_LEVEL, read in base 4
+- h3: base cell and the 15 index digits, read in base 7
+
+Set algebra works on the intervals with NumPy and containment is a binary
+search, across resolutions.
+"""
+
+import abc
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, Tuple
+
+import numpy as np
+
+from babelgrid.lazy import lazy_import
+
+h3 = lazy_import("h3", "h3")
+s2sphere = lazy_import("s2sphere")
+quadtree = lazy_import("babelgrid.quadtree")
+
+_DOMAIN_MAX = 2**63 - 2
+
+
+class _Codec(abc.ABC):
+    """Maps the tiles of a grid to inclusive intervals of finest-cell
+    positions and back."""
+
+    branching: int
+    min_level: int
+
+    @property
+    @abc.abstractmethod
+    def max_level(self) -> int:
+        """Level of the finest cells."""
+
+    @abc.abstractmethod
+    def to_interval(self, tile_id: str) -> Tuple[int, int]:
+        """Interval of the finest cells covered by a tile."""
+
+    @abc.abstractmethod
+    def from_block(self, lo: int, level: int) -> str:
+        """Tile id of the aligned block of a level that starts at lo."""
+
+    def is_valid(self, tile_id: str) -> bool:
+
+        return True
+
+    def phantom(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Intervals included in every set of the grid."""
+
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+
+class _S2Codec(_Codec):
+
+    branching = 4
+    max_level = 30
+    min_level = 0
+
+    def to_interval(self, tile_id: str) -> Tuple[int, int]:
+
+        cell_id = s2sphere.CellId.from_token(tile_id)
+        return cell_id.range_min().id() >> 1, cell_id.range_max().id() >> 1
+
+    def from_block(self, lo: int, level: int) -> str:
+
+        return s2sphere.CellId((lo << 1) + (1 << 2 * (30 - level))).to_token()
+
+
+class _QuadkeyCodec(_Codec):
+
+    branching = 4
+    min_level = 1
+
+    @property
+    def max_level(self) -> int:
+
+        return quadtree.QUADKEY_MAX_LEVEL
+
+    def to_interval(self, tile_id: str) -> Tuple[int, int]:
+
+        shift = 2 * (self.max_level - len(tile_id))
+        lo = int(tile_id, 4) << shift
+        return lo, lo + (1 << shift) - 1
+
+    def from_block(self, lo: int, level: int) -> str:
+
+        value = lo >> 2 * (self.max_level - level)
+        return np.base_repr(value, 4).zfill(level)
+
+
+class _H3Codec(_Codec):
+
+    branching = 7
+    max_level = 15
+    min_level = 0
+
+    def to_interval(self, tile_id: str) -> Tuple[int, int]:
+
+        h = int(tile_id, 16)
+        res = (h >> 52) & 0xF
+
+        position = (h >> 45) & 0x7F
+        for i in range(1, res + 1):
+            position = position * 7 + ((h >> 3 * (15 - i)) & 7)
+
+        size = 7 ** (15 - res)
+        return position * size, (position + 1) * size - 1
+
+    def from_block(self, lo: int, level: int) -> str:
+
+        position = lo // 7 ** (15 - level)
+
+        # Digits finer than the resolution are set to 7
+        digits = (1 << 45) - 1
+        for i in range(level, 0, -1):
+            position, digit = divmod(position, 7)
+            digits &= ~(7 << 3 * (15 - i))
+            digits |= digit << 3 * (15 - i)
+
+        return format((1 << 59) | (level << 52) | (position << 45) | digits, "x")
+
+    def is_valid(self, tile_id: str) -> bool:
+
+        # Blocks of deleted pentagon subsequences are not cells
+        return h3.h3_is_valid(tile_id)
+
+    @lru_cache(maxsize=None)
+    def phantom(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Intervals of the deleted subsequence (digit 1 after zero or more
+        0 digits) under each pentagon base cell. Every h3 TileSet includes
+        them, so the children of a pentagon fill its whole interval."""
+
+        intervals = [
+            (position * 7 ** (15 - level), (position + 1) * 7 ** (15 - level) - 1)
+            for pentagon in h3.get_pentagon_indexes(0)
+            for level in range(1, 16)
+            for position in [((int(pentagon, 16) >> 45) & 0x7F) * 7**level + 1]
+        ]
+
+        return _normalize(*np.array(intervals, dtype=np.int64).T)
+
+
+_CODECS: Dict[str, _Codec] = {
+    "s2": _S2Codec(),
+    "h3": _H3Codec(),
+    "bing": _QuadkeyCodec(),
+    "quadtree": _QuadkeyCodec(),
+}
+
+
+def _normalize(lo: np.ndarray, hi: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Sorts intervals and merges the overlapping or adjacent ones."""
+
+    if len(lo) == 0:
+        return lo, hi
+
+    order = np.argsort(lo, kind="stable")
+    lo, hi = lo[order], hi[order]
+
+    reach = np.maximum.accumulate(hi)
+    starts = np.flatnonzero(np.concatenate([[True], lo[1:] > reach[:-1] + 1]))
+
+    return lo[starts], np.maximum.reduceat(hi, starts)
+
+
+def _complement(lo: np.ndarray, hi: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+
+    gaps_lo = np.concatenate([[0], hi + 1])
+    gaps_hi = np.concatenate([lo - 1, [_DOMAIN_MAX]])
+    keep = gaps_lo <= gaps_hi
+
+    return gaps_lo[keep], gaps_hi[keep]
+
+
+class TileSet:
+    """Set of tiles of a grid, at any mix of resolutions.
+
+    ```
+    a = TileSet('s2', Babel('s2').polyfill(region_a, 14, ids_only=True))
+    b = TileSet('s2', Babel('s2').polyfill(region_b, 12, ids_only=True))
+
+    shared = a & b           # or a.intersection(b)
+    '89c25a31' in shared     # containment across resolutions
+    list(shared)             # compacted tile ids
+    ```
+
+    A tile is contained if the whole area it covers is in the set.
+    """
+
+    __slots__ = ("grid_type", "_lo", "_hi")
+
+    def __init__(self, grid_type: str, tile_ids: Iterable[str] = ()) -> None:
+
+        if grid_type not in _CODECS:
+            raise Exception(
+                f"{grid_type} is not a valid type. "
+                f"Try one of the following: {', '.join(_CODECS)}"
+            )
+
+        self.grid_type = grid_type
+
+        to_interval = _CODECS[grid_type].to_interval
+        intervals = np.array(
+            [to_interval(tile_id) for tile_id in tile_ids], dtype=np.int64
+        ).reshape(-1, 2)
+
+        phantom_lo, phantom_hi = _CODECS[grid_type].phantom()
+
+        self._lo, self._hi = _normalize(
+            np.concatenate([intervals[:, 0], phantom_lo]),
+            np.concatenate([intervals[:, 1], phantom_hi]),
+        )
+
+    @classmethod
+    def _from_intervals(
+        cls, grid_type: str, lo: np.ndarray, hi: np.ndarray
+    ) -> "TileSet":
+
+        tileset = cls(grid_type)
+        tileset._lo, tileset._hi = lo, hi
+
+        return tileset
+
+    def _check_grid(self, other: "TileSet") -> None:
+
+        if self.grid_type != other.grid_type:
+            raise Exception(
+                f"Cannot combine {self.grid_type} and {other.grid_type} TileSets"
+            )
+
+    def contains(self, tile_id: str) -> bool:
+        """True if the area of the tile is fully covered by the set.
+
+        Parameters
+        ----------
+        tile_id : str
+            Tile id of any resolution
+
+        Returns
+        -------
+        bool
+        """
+
+        lo, hi = _CODECS[self.grid_type].to_interval(tile_id)
+        i = np.searchsorted(self._lo, lo, side="right") - 1
+
+        return bool(i >= 0 and self._hi[i] >= hi)
+
+    def __contains__(self, tile_id: str) -> bool:
+
+        return self.contains(tile_id)
+
+    def union(self, other: "TileSet") -> "TileSet":
+
+        self._check_grid(other)
+
+        return self._from_intervals(
+            self.grid_type,
+            *_normalize(
+                np.concatenate([self._lo, other._lo]),
+                np.concatenate([self._hi, other._hi]),
+            ),
+        )
+
+    def intersection(self, other: "TileSet") -> "TileSet":
+
+        self._check_grid(other)
+
+        lo, hi = _normalize(
+            *(
+                np.concatenate(x)
+                for x in zip(
+                    _complement(self._lo, self._hi), _complement(other._lo, other._hi)
+                )
+            )
+        )
+
+        return self._from_intervals(self.grid_type, *_complement(lo, hi))
+
+    def difference(self, other: "TileSet") -> "TileSet":
+
+        self._check_grid(other)
+
+        difference = self.intersection(
+            self._from_intervals(self.grid_type, *_complement(other._lo, other._hi))
+        )
+
+        return difference.union(TileSet(self.grid_type))
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    def __eq__(self, other: object) -> bool:
+
+        return (
+            isinstance(other, TileSet)
+            and self.grid_type == other.grid_type
+            and np.array_equal(self._lo, other._lo)
+            and np.array_equal(self._hi, other._hi)
+        )
+
+    def __bool__(self) -> bool:
+
+        return self != TileSet(self.grid_type)
+
+    def __iter__(self) -> Iterator[str]:
+        """Yields the fewest tile ids that cover the set, sorted."""
+
+        codec = _CODECS[self.grid_type]
+        b = codec.branching
+
+        for lo, hi in zip(self._lo.tolist(), self._hi.tolist()):
+
+            while lo <= hi:
+
+                level = codec.max_level
+                size = 1
+                while (
+                    level > codec.min_level
+                    and lo % (size * b) == 0
+                    and lo + size * b - 1 <= hi
+                ):
+                    level -= 1
+                    size *= b
+
+                tile_id = codec.from_block(lo, level)
+                if codec.is_valid(tile_id):
+                    yield tile_id
+
+                lo += size
+
+    def __repr__(self) -> str:
+
+        return f'TileSet: grid_type "{self.grid_type}", {len(self._lo)} ranges'
@@ -0,0 +1,46 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Fixtures of the benchmark suite.
+
+Geometries are fixed local files and points are drawn with a fixed seed,
+so runs on different releases measure the same work.
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from babelgrid import cache
+
+GEOMETRIES = Path(__file__).parent / "data" / "geometries.json"
+
+N_POINTS = 100_000
+
+
+@pytest.fixture(scope="session")
+def geometries():
+
+    with open(GEOMETRIES) as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="session")
+def points():
+
+    random = np.random.RandomState(0)
+
+    return random.uniform(-34.9, -23.0, N_POINTS), random.uniform(
+        -58.4, -45.2, N_POINTS
+    )
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Each benchmark starts with empty boundary and Tile caches."""
+
+    cache.clear()
+    yield
+    cache.clear()
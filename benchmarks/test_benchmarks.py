@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Benchmarks of the hot paths of every grid.
+
+```
+make benchmark
+```
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+from babelgrid import Babel, cache
+
+# Coarse and fine polyfill resolutions per grid and geometry size. The fine
+# ones give from a few hundred to a few thousand tiles.
+POLYFILL_RESOLUTIONS = {
+    "small": {"s2": [10, 13], "h3": [6, 8], "bing": [12, 15]},
+    "medium": {"s2": [8, 11], "h3": [5, 7], "bing": [10, 13]},
+    "country": {"s2": [6, 9], "h3": [4, 6], "bing": [8, 10]},
+}
+
+POINT_RESOLUTIONS = {"s2": [8, 16], "h3": [5, 10], "bing": [10, 18]}
+
+GRIDS = ["s2", "h3", "bing"]
+
+
+def _cases(resolutions):
+
+    return [
+        (grid_type, resolution)
+        for grid_type in GRIDS
+        for resolution in resolutions[grid_type]
+    ]
+
+
+@pytest.mark.parametrize("grid_type, resolution", _cases(POINT_RESOLUTIONS))
+def test_geo_to_tile(benchmark, points, grid_type, resolution):
+
+    babel = Babel(grid_type)
+    lats, lons = points[0][:1000].tolist(), points[1][:1000].tolist()
+
+    def index():
+        cache.clear()
+        return [babel.geo_to_tile(lat, lon, resolution) for lat, lon in zip(lats, lons)]
+
+    benchmark.group = "geo_to_tile (1k points)"
+    benchmark(index)
+
+
+@pytest.mark.parametrize("grid_type, resolution", _cases(POINT_RESOLUTIONS))
+def test_geo_to_tiles(benchmark, points, grid_type, resolution):
+
+    babel = Babel(grid_type)
+
+    benchmark.group = "geo_to_tiles (100k points)"
+    benchmark(babel.geo_to_tiles, *points, resolution)
+
+
+@pytest.mark.parametrize("grid_type, resolution", _cases(POINT_RESOLUTIONS))
+def test_geo_to_tiles_as_int(benchmark, points, grid_type, resolution):
+
+    babel = Babel(grid_type)
+
+    benchmark.group = "geo_to_tiles as_int (100k points)"
+    benchmark(babel.geo_to_tiles, *points, resolution, as_int=True)
+
+
+@pytest.mark.parametrize("grid_type, resolution", _cases(POINT_RESOLUTIONS))
+def test_id_to_tile(benchmark, points, grid_type, resolution):
+
+    babel = Babel(grid_type)
+    tile_ids = babel.geo_to_tiles(points[0][:1000], points[1][:1000], resolution)
+
+    def build():
+        cache.clear()
+        return [babel.id_to_tile(tile_id).geometry for tile_id in tile_ids]
+
+    benchmark.group = "id_to_tile with geometry (1k tiles)"
+    benchmark(build)
+
+
+@pytest.mark.parametrize("size", list(POLYFILL_RESOLUTIONS))
+@pytest.mark.parametrize("grid_type", GRIDS)
+@pytest.mark.parametrize("level", ["coarse", "fine"])
+def test_polyfill(benchmark, geometries, size, grid_type, level):
+
+    babel = Babel(grid_type)
+    resolution = POLYFILL_RESOLUTIONS[size][grid_type][level == "fine"]
+
+    benchmark.group = f"polyfill {size}"
+    benchmark.extra_info["resolution"] = resolution
+    benchmark(babel.polyfill, geometries[size], resolution, ids_only=True)
+
+
+@pytest.mark.parametrize("grid_type", GRIDS)
+def test_polyfill_tiles(benchmark, geometries, grid_type):
+
+    babel = Babel(grid_type)
+    resolution = POLYFILL_RESOLUTIONS["medium"][grid_type][1]
+
+    def polyfill():
+        cache.clear()
+        return [
+            tile.to_dict() for tile in babel.polyfill(geometries["medium"], resolution)
+        ]
+
+    benchmark.group = "polyfill medium with Tile.to_dict"
+    benchmark(polyfill)
+
+
+@pytest.mark.parametrize("grid_type", GRIDS)
+def test_area_km(benchmark, geometries, grid_type):
+
+    babel = Babel(grid_type)
+    resolution = POLYFILL_RESOLUTIONS["medium"][grid_type][1]
+    tile_ids = babel.polyfill(geometries["medium"], resolution, ids_only=True)
+
+    def areas():
+        cache.clear()
+        return [babel.id_to_tile(tile_id).area_km for tile_id in tile_ids]
+
+    benchmark.group = "area_km"
+    benchmark(areas)
+
+
+@pytest.mark.parametrize("grid_type", GRIDS)
+def test_areas_km(benchmark, geometries, grid_type):
+
+    babel = Babel(grid_type)
+    resolution = POLYFILL_RESOLUTIONS["medium"][grid_type][1]
+    tile_ids = babel.polyfill(geometries["medium"], resolution, ids_only=True)
+
+    benchmark.group = "areas_km"
+    benchmark(babel.areas_km, tile_ids)
+
+
+@pytest.mark.parametrize("grid_type", GRIDS)
+def test_best_resolution(benchmark, points, grid_type):
+
+    babel = Babel(grid_type)
+    lats = points[0][:1000].tolist()
+
+    def select():
+        return [babel._best_resolution(lat, 10.0) for lat in lats]
+
+    benchmark.group = "resolution by area (1k latitudes)"
+    benchmark(select)
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import numpy, shapely",
+        "import babelgrid",
+        "import babelgrid; babelgrid.Babel('s2').geo_to_tile(0, 0, 10)",
+        "import babelgrid; babelgrid.Babel('h3').geo_to_tile(0, 0, 8).area_km",
+    ],
+    ids=["baseline", "import", "first s2 use", "first h3 area"],
+)
+def test_import(benchmark, statement):
+    """Cold start of a fresh interpreter. The baseline imports the hard
+    dependencies only, grid backends and pyproj are loaded on first use."""
+
+    benchmark.group = "cold start"
+    benchmark.pedantic(
+        subprocess.run, ([sys.executable, "-c", statement],), {"check": True}, rounds=10
+    )
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `aggregate` package."""
+
+import pytest
+
+import numpy as np
+
+from babelgrid import Babel, aggregate_points
+
+
+@pytest.mark.parametrize("grid_type, resolution", [("s2", 12), ("h3", 8), ("bing", 14)])
+def test_aggregate_points(grid_type, resolution):
+
+    random = np.random.RandomState(0)
+    lats = random.uniform(-23.7, -23.4, 5000)
+    lons = random.uniform(-46.8, -46.4, 5000)
+    values = random.uniform(0, 10, 5000)
+
+    levels = aggregate_points(
+        grid_type,
+        lats,
+        lons,
+        resolution,
+        values,
+        rollups=[resolution - 2, resolution - 4],
+        statistics=["count", "sum", "mean", "min", "max"],
+    )
+
+    assert list(levels) == [resolution, resolution - 2, resolution - 4]
+
+    babel = Babel(grid_type)
+    finest = babel.geo_to_tiles(lats, lons, resolution)
+    for level, columns in levels.items():
+
+        tile_ids = babel.parents(finest, level) if level < resolution else finest
+        expected = {}
+        for tile_id, value in zip(tile_ids, values):
+            expected.setdefault(tile_id, []).append(value)
+
+        assert sorted(columns["tile_id"]) == sorted(expected)
+
+        for i, tile_id in enumerate(columns["tile_id"]):
+            assert columns["count"][i] == len(expected[tile_id])
+            assert columns["sum"][i] == pytest.approx(sum(expected[tile_id]))
+            assert columns["mean"][i] == pytest.approx(np.mean(expected[tile_id]))
+            assert columns["min"][i] == min(expected[tile_id])
+            assert columns["max"][i] == max(expected[tile_id])
+
+
+def test_aggregate_points_count_only():
+
+    levels = aggregate_points(
+        "s2", [1.0, 1.0, 2.0], [3.0, 3.0, 3.0], resolution=10, as_int=True
+    )
+
+    assert list(levels[10]) == ["tile_id", "count"]
+    assert levels[10]["tile_id"].dtype == np.uint64
+    assert sorted(levels[10]["count"]) == [1, 2]
+
+    with pytest.raises(Exception):
+        aggregate_points("s2", [1.0], [3.0], resolution=10, statistics=["sum"])
+
+    with pytest.raises(TypeError):
+        aggregate_points("s2", [1.0], [3.0], rollups=[8])
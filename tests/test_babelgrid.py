@@ -0,0 +1,323 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `babelgrid` package."""
+
+import pytest
+
+import json
+import subprocess
+import sys
+
+import numpy as np
+
+from babelgrid import Babel, Polygon, Tile, s2
+
+LATS = np.array([12.0, -23.5, 40.7128, -33.9])
+LONS = np.array([-3.0, -46.6, -74.006, 151.2])
+
+
+@pytest.mark.parametrize(
+    "grid_type, resolution",
+    [("s2", 10), ("h3", 8), ("bing", 14)],
+)
+def test_geo_to_tiles(grid_type, resolution):
+
+    babel = Babel(grid_type)
+    tile_ids = babel.geo_to_tiles(LATS, LONS, resolution=resolution, chunk_size=3)
+
+    assert isinstance(tile_ids, np.ndarray)
+    assert list(tile_ids) == [
+        babel.geo_to_tile(lat, lon, resolution).tile_id for lat, lon in zip(LATS, LONS)
+    ]
+
+
+def test_geo_to_tiles_shape_mismatch():
+
+    with pytest.raises(Exception):
+        Babel("s2").geo_to_tiles(LATS, LONS[:2], resolution=10)
+
+
+def test_tile_lazy_geometry():
+
+    tile = Babel("s2").id_to_tile("0e3229")
+
+    assert not hasattr(tile, "__dict__")
+    assert tile._geometry is None
+
+    geometry = tile.geometry
+
+    assert tile.geometry is geometry
+    assert geometry.wkt == Polygon(s2.s2_to_geo_boundary("0e3229", True)).wkt
+    assert geometry.geojson["type"] == "Polygon"
+    assert geometry.centroid.latitude == pytest.approx(12.01, abs=0.01)
+
+    boundary = [[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0], [0.0, 0.0]]
+    tile = Tile("0e3229", "s2", polygon=boundary)
+
+    assert tile.geometry.wkt == Polygon(boundary).wkt
+
+    with pytest.raises(TypeError):
+        Tile(boundary, "0e3229", "s2")
+
+
+@pytest.mark.parametrize("grid_type, resolution", [("s2", 10), ("h3", 7), ("bing", 12)])
+def test_polyfill_ids_and_iter(grid_type, resolution):
+
+    babel = Babel(grid_type)
+    with open("notebooks/example_geojson.json") as f:
+        geometry = json.load(f)
+
+    tiles = babel.polyfill(geometry, resolution)
+    tile_ids = babel.polyfill(geometry, resolution, ids_only=True)
+
+    assert tile_ids == [t.tile_id for t in tiles]
+
+    chunks = list(babel.polyfill_iter(geometry, resolution, chunk_size=5))
+
+    assert all(len(chunk) <= 5 for chunk in chunks)
+    assert [t.tile_id for chunk in chunks for t in chunk] == tile_ids
+    assert [
+        tile_id
+        for chunk in babel.polyfill_iter(geometry, resolution, ids_only=True)
+        for tile_id in chunk
+    ] == tile_ids
+
+
+@pytest.mark.parametrize(
+    "grid_type, lat, resolution, area_km",
+    [
+        ("s2", 0, 10, 69.1054836952),
+        ("h3", 60, 5, 780.8504698942),
+        ("bing", 60, 10, 1531.6075919621),
+    ],
+)
+def test_area_km(grid_type, lat, resolution, area_km):
+    """Reference values from notebooks/grids_area_reference.csv"""
+
+    babel = Babel(grid_type)
+    tile = babel.geo_to_tile(lat, 0, resolution)
+
+    assert tile.area_km == pytest.approx(area_km)
+    assert babel.areas_km([tile, tile.tile_id])[0] == tile.area_km
+    assert babel.areas_km([tile.tile_id], geodesic=True)[0] == tile.area_km_geodesic
+    assert tile.area_km_geodesic < tile.area_km
+
+
+@pytest.mark.parametrize(
+    "grid_type, lat, area_km, resolution",
+    [("h3", -23, 1, 8), ("bing", 2, 0.1, 17), ("s2", 60, 1000, 10)],
+)
+def test_best_resolution(grid_type, lat, area_km, resolution):
+
+    babel = Babel(grid_type)
+
+    assert babel._best_resolution(lat, area_km) == resolution
+    assert babel._best_resolution(lat, 10**12) == babel.grid_range()[0]
+    assert babel._best_resolution(lat, 0) == babel.grid_range()[-1]
+
+
+@pytest.mark.parametrize("grid_type, resolution", [("s2", 11), ("h3", 8), ("bing", 13)])
+def test_polyfill_processes(grid_type, resolution):
+
+    babel = Babel(grid_type)
+    geometry = {
+        "type": "MultiPolygon",
+        "coordinates": [
+            [[[-46, -24], [-45.5, -24], [-45.5, -23.5], [-46, -24]]],
+            [[[-45.6, -24], [-45.2, -24], [-45.2, -23.6], [-45.6, -24]]],
+        ],
+    }
+
+    serial = babel.polyfill(geometry, resolution, ids_only=True)
+    parallel = babel.polyfill(geometry, resolution, ids_only=True, processes=2)
+
+    assert parallel == serial
+
+
+@pytest.mark.parametrize("grid_type, resolution", [("s2", 13), ("h3", 9), ("bing", 15)])
+def test_compact_uncompact(grid_type, resolution):
+
+    babel = Babel(grid_type)
+    with open("notebooks/example_geojson.json") as f:
+        geometry = json.load(f)
+
+    tile_ids = babel.polyfill(geometry, resolution, ids_only=True)
+    compacted = babel.compact(tile_ids)
+
+    assert len(compacted) < len(tile_ids)
+    assert len({babel.id_to_tile(t).resolution for t in compacted}) > 1
+    assert sorted(babel.uncompact(compacted, resolution)) == sorted(tile_ids)
+
+
+@pytest.mark.parametrize("grid_type", ["s2", "h3", "bing"])
+def test_compact_uncompact_mixed_resolutions(grid_type):
+
+    babel = Babel(grid_type)
+    parent = babel.geo_to_tile(-23.5, -46.6, 7)
+    children = [tile.tile_id for tile in parent.to_children()]
+    grandchildren = [tile.tile_id for tile in parent.to_children(9)]
+
+    # Children already covered by their parent are dropped
+    assert babel.compact([parent.tile_id, children[0]]) == [parent.tile_id]
+    assert babel.compact(children[:-1] + grandchildren) == [parent.tile_id]
+    assert sorted(babel.uncompact([parent.tile_id, children[0]], 8)) == sorted(
+        children
+    )
+
+    with pytest.raises(Exception, match="must have a resolution up to 7"):
+        babel.uncompact([children[0]], 7)
+
+
+@pytest.mark.parametrize("grid_type, resolution", [("s2", 10), ("h3", 7), ("bing", 12)])
+def test_int_ids(grid_type, resolution):
+
+    babel = Babel(grid_type)
+    tile_ids = babel.geo_to_tiles([-23.5, 2.0], [-46.6, 3.0], resolution)
+    tile_ints = babel.geo_to_tiles([-23.5, 2.0], [-46.6, 3.0], resolution, as_int=True)
+
+    assert list(babel.to_ints(tile_ids)) == list(tile_ints)
+    assert list(babel.from_ints(tile_ints)) == list(tile_ids)
+
+    tile = babel.id_to_tile(tile_ints[0])
+    tile_int = tile.tile_int
+
+    assert tile.tile_id == tile_ids[0]
+    assert babel.int_resolution(tile_int) == resolution
+    assert babel.from_ints([babel.int_parent(tile_int)])[0] == tile.to_parent().tile_id
+    assert sorted(babel.from_ints(babel.int_children(tile_int))) == sorted(
+        child.tile_id for child in tile.to_children()
+    )
+
+    with pytest.raises(Exception, match="must have a resolution from"):
+        babel.int_parent(tile_int, resolution + 2)
+
+    with pytest.raises(Exception, match="must have a resolution up to"):
+        babel.int_children(tile_int, resolution - 2)
+
+
+@pytest.mark.parametrize("grid_type, resolution", [("s2", 14), ("h3", 9), ("bing", 15)])
+def test_polyfill_adaptive(grid_type, resolution):
+
+    with open("notebooks/example_geojson.json") as f:
+        geometry = json.load(f)
+
+    babel = Babel(grid_type)
+    tile_ids = babel.polyfill(geometry, resolution, ids_only=True)
+
+    cover = babel.polyfill_adaptive(geometry, resolution, ids_only=True)
+
+    assert sorted(cover) == sorted(babel.compact(tile_ids))
+
+    budgeted = babel.polyfill_adaptive(geometry, resolution, max_cells=50)
+
+    assert len(budgeted) <= 50
+    assert min(tile.resolution for tile in budgeted) < resolution
+    assert set(tile_ids) <= set(
+        babel.uncompact([tile.tile_id for tile in budgeted], resolution)
+    )
+
+
+@pytest.mark.parametrize("grid_type, resolution", [("s2", 12), ("h3", 8), ("bing", 14)])
+def test_multi_level_hierarchy(grid_type, resolution):
+
+    babel = Babel(grid_type)
+    tile_ids = babel.geo_to_tiles(LATS, LONS, resolution)
+    tile_ints = babel.geo_to_tiles(LATS, LONS, resolution, as_int=True)
+    coarse = resolution - 3
+
+    parents = babel.parents(tile_ids, coarse)
+
+    assert list(parents) == [
+        babel.id_to_tile(t).to_parent().to_parent().to_parent().tile_id
+        for t in tile_ids
+    ]
+    assert list(babel.parents(tile_ints, coarse)) == list(babel.to_ints(parents))
+    assert set(babel.resolutions(parents)) == {coarse}
+
+    descendants = babel.descendants(parents, resolution)
+    counts = babel.descendant_counts(parents, resolution)
+
+    assert len(descendants) == counts.sum()
+    assert set(tile_ids) <= set(descendants)
+    assert sorted(descendants) == sorted(
+        t for p in parents for t in babel.uncompact([p], resolution)
+    )
+    assert list(babel.descendants(babel.to_ints(parents), resolution)) == list(
+        babel.to_ints(descendants)
+    )
+
+    with pytest.raises(Exception):
+        babel.parents(tile_ids, resolution + 1)
+
+
+@pytest.mark.parametrize("grid_type, resolution", [("s2", 10), ("h3", 8), ("bing", 12)])
+def test_hierarchy_resolution_checks(grid_type, resolution):
+
+    babel = Babel(grid_type)
+    tile = babel.geo_to_tile(-23.5, -46.6, resolution)
+    grid_range = babel.grid_range()
+
+    assert tile.to_parent(resolution).tile_id == tile.tile_id
+    assert [t.tile_id for t in tile.to_children(resolution)] == [tile.tile_id]
+
+    with pytest.raises(Exception, match="must have a resolution from"):
+        tile.to_parent(resolution + 2)
+
+    with pytest.raises(Exception, match="must have a resolution up to"):
+        tile.to_children(resolution - 2)
+
+    for invalid in [grid_range[0] - 1, grid_range[-1] + 1]:
+
+        with pytest.raises(Exception, match="is not a valid"):
+            tile.to_parent(invalid)
+
+        with pytest.raises(Exception, match="is not a valid"):
+            tile.to_children(invalid)
+
+        with pytest.raises(Exception, match="is not a valid"):
+            babel.parents([tile.tile_id], invalid)
+
+
+@pytest.mark.parametrize(
+    "grid_type, resolution, k, size",
+    [("s2", 12, 1, 9), ("s2", 12, 2, 25), ("h3", 8, 2, 19), ("bing", 14, 2, 25)],
+)
+def test_neighbors(grid_type, resolution, k, size):
+
+    babel = Babel(grid_type)
+    tile = babel.geo_to_tile(-23.5, -46.6, resolution)
+
+    neighbors = babel.neighbors(tile.tile_id, k)
+
+    assert len(neighbors) == size
+    assert tile.tile_id in neighbors
+    assert [t.tile_id for t in tile.to_neighbors(k)] == neighbors
+
+    pair = neighbors[:2]
+    batch = babel.neighbors_batch(pair, k)
+
+    assert len(set(batch)) == len(batch)
+    assert set(batch) == set(babel.neighbors(pair[0], k)) | set(
+        babel.neighbors(pair[1], k)
+    )
+
+
+def test_quadtree_neighbors_wrap():
+
+    assert Babel("bing").neighbors("0", 1) == ["0", "1", "2", "3"]
+    assert "111" in Babel("bing").neighbors("000", 1)
+
+
+def test_lazy_backends():
+
+    code = (
+        "import sys, babelgrid; "
+        "print(sorted(m for m in ('h3', 's2sphere', 'pyproj', 'babelgrid.quadtree', "
+        "'babelgrid.s2') if m in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+    assert output.strip() == "[]"
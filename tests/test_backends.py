@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `backends` package."""
+
+import pytest
+
+import numpy as np
+
+from babelgrid import Babel, backends
+from babelgrid.backends import GridBackend, QuadkeyBackend, get_backend
+
+LATS = np.array([12.0, -23.5, 40.7128, -33.9])
+LONS = np.array([-3.0, -46.6, -74.006, 151.2])
+
+
+@pytest.mark.parametrize("grid_type, resolution", [("s2", 12), ("h3", 8), ("bing", 14)])
+def test_default_batch_operations(grid_type, resolution):
+    """The loops of GridBackend give the same results as the native batch
+    operations."""
+
+    backend = get_backend(grid_type)
+    tile_ids = backend.index_batch(LATS, LONS, resolution)
+    tile_ints = backend.index_int_batch(LATS, LONS, resolution)
+
+    assert list(GridBackend.index_batch(backend, LATS, LONS, resolution)) == list(
+        tile_ids
+    )
+    assert list(GridBackend.to_ints(backend, tile_ids)) == list(tile_ints)
+    assert list(GridBackend.from_ints(backend, tile_ints)) == list(tile_ids)
+
+    for name, args in [
+        ("ints_resolution", ()),
+        ("ints_parent", (resolution - 2,)),
+        ("ints_children", (resolution + 1,)),
+        ("ints_children_count", (resolution + 2,)),
+    ]:
+        assert list(getattr(GridBackend, name)(backend, tile_ints, *args)) == list(
+            getattr(backend, name)(tile_ints, *args)
+        )
+
+    assert list(GridBackend.neighbors_batch(backend, tile_ids[:2])) == list(
+        backend.neighbors_batch(tile_ids[:2])
+    )
+    assert [p.wkb for p in GridBackend.boundaries(backend, tile_ids)] == [
+        p.wkb for p in backend.boundaries(tile_ids)
+    ]
+
+
+def test_h3_int_resolution_checks():
+
+    backend = get_backend("h3")
+    tile_int = int(backend.index_int_batch(LATS, LONS, 8)[0])
+
+    with pytest.raises(Exception, match="must have a resolution from 10"):
+        backend.int_parent(tile_int, 10)
+
+    with pytest.raises(Exception, match="must have a resolution up to 6"):
+        backend.int_children(tile_int, 6)
+
+
+class CountingQuadkeyBackend(QuadkeyBackend):
+
+    name = "counting"
+
+    def __init__(self):
+
+        self.calls = 0
+
+    def index_batch(self, lats, lons, resolution):
+
+        self.calls += 1
+        return super().index_batch(lats, lons, resolution)
+
+
+@pytest.fixture
+def counting_backend():
+
+    backend = CountingQuadkeyBackend()
+    backends.register_backend(backend)
+    yield backend
+    backends._grids.remove(backend.name)
+    del backends._backends[backend.name]
+
+
+def test_register_backend(counting_backend):
+
+    babel = Babel("counting")
+
+    assert "counting" in Babel.available_grids()
+    assert list(babel.geo_to_tiles(LATS, LONS, 14)) == list(
+        Babel("bing").geo_to_tiles(LATS, LONS, 14)
+    )
+    assert counting_backend.calls == 1
+    assert babel.geo_to_tile(-23.5, -46.6, 14).to_parent().resolution == 13
+
+    with pytest.raises(Exception):
+        Babel("unknown")
+
+
+def test_incomplete_backend():
+
+    class IncompleteBackend(GridBackend):
+
+        name = "incomplete"
+
+        def index(self, lat, lon, resolution):
+            return ""
+
+    with pytest.raises(TypeError):
+        IncompleteBackend()
+
+    with pytest.raises(Exception, match="is not a GridBackend"):
+        backends.register_backend(object())
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `cache` package."""
+
+import pytest
+
+from babelgrid import Babel, cache, s2
+
+
+@pytest.fixture
+def clean_cache():
+
+    cache.clear()
+    yield
+    cache.configure(**cache.DEFAULT_MAXSIZE)
+    cache.clear()
+
+
+def test_lru_cache():
+
+    lru = cache.LRUCache(2)
+
+    lru.put("a", 1)
+    lru.put("b", 2)
+    assert lru.get("a") == 1
+    lru.put("c", 3)
+
+    assert lru.get("b") is None
+    assert lru.get("c") == 3
+    assert lru.stats() == {
+        "hits": 2,
+        "misses": 1,
+        "evictions": 1,
+        "size": 2,
+        "maxsize": 2,
+    }
+
+
+def test_id_to_tile_cache(clean_cache):
+
+    babel = Babel("s2")
+
+    tile = babel.id_to_tile("0e3229")
+    assert babel.id_to_tile("0e3229") is tile
+
+    tile.geometry
+    s2.s2_to_geo_boundary("0e3229", True)
+
+    info = cache.cache_info()["s2"]
+    assert info["tile"]["hits"] == 1
+    assert info["boundary"]["hits"] == 1
+
+    cache.configure(tile=0)
+    assert cache.cache_info()["s2"]["tile"]["size"] == 0
+    assert babel.id_to_tile("0e3229") is not babel.id_to_tile("0e3229")
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `export` package."""
+
+import pytest
+
+from shapely import wkb
+
+from babelgrid import Babel
+from babelgrid.export import FIELDS, to_arrow, to_columns, to_geodataframe
+
+
+def test_to_columns():
+
+    tile = Babel("s2").id_to_tile("0e3229")
+
+    columns = to_columns(["0e3229"], "s2", FIELDS)
+    expected = tile.to_dict()
+
+    assert list(columns) == list(FIELDS)
+    assert columns["tile_id"][0] == expected["tile_id"]
+    assert columns["resolution"][0] == expected["resolution"]
+    assert columns["parent_id"][0] == expected["parent_id"]
+    assert columns["children_id"][0] == expected["children_id"]
+    assert columns["area_km"][0] == tile.area_km
+    assert wkb.loads(columns["geometry"][0]).equals(expected["shapely"])
+
+
+@pytest.mark.parametrize("grid_type", ["s2", "h3", "bing"])
+def test_to_columns_mixed_resolutions(grid_type):
+
+    babel = Babel(grid_type)
+    tiles = [
+        babel.geo_to_tile(-23.5, -46.6, resolution)
+        for resolution in babel.grid_range()[1:4]
+    ]
+
+    columns = to_columns(tiles, fields=["resolution", "parent_id"])
+
+    assert list(columns["resolution"]) == [tile.resolution for tile in tiles]
+    assert list(columns["parent_id"]) == [tile.to_dict()["parent_id"] for tile in tiles]
+
+
+def test_to_columns_only_requested_fields():
+
+    tiles = Babel("h3").polyfill(
+        {
+            "type": "Polygon",
+            "coordinates": [[[-46, -24], [-45, -24], [-45, -23], [-46, -24]]],
+        },
+        6,
+    )
+
+    columns = to_columns(tiles, fields=["tile_id"])
+
+    assert list(columns) == ["tile_id"]
+    assert all(tile._geometry is None for tile in tiles)
+
+    with pytest.raises(Exception):
+        to_columns(["0e3229"], fields=["tile_id"])
+
+
+def test_to_arrow():
+
+    pytest.importorskip("pyarrow")
+
+    table = to_arrow(["0e3229", "0e322b"], "s2")
+
+    assert table.column_names == ["tile_id", "resolution", "parent_id", "geometry"]
+    assert table.num_rows == 2
+
+
+def test_to_geodataframe():
+
+    pytest.importorskip("geopandas")
+
+    gdf = to_geodataframe(["0e3229", "0e322b"], "s2")
+
+    assert gdf.crs.to_epsg() == 4326
+    assert list(gdf.tile_id) == ["0e3229", "0e322b"]
@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `join` package."""
+
+import pytest
+
+import json
+
+import numpy as np
+from shapely.geometry import Point, shape
+
+from babelgrid import SpatialJoin
+
+
+@pytest.fixture
+def regions():
+
+    with open("notebooks/example_geojson.json") as f:
+        geometry = shape(json.load(f))
+
+    return {"inside": geometry, "ring": geometry.buffer(0.05).difference(geometry)}
+
+
+@pytest.mark.parametrize("grid_type, resolution", [("s2", 12), ("h3", 7), ("bing", 13)])
+def test_spatial_join(regions, grid_type, resolution):
+
+    minx, miny, maxx, maxy = regions["ring"].bounds
+    random = np.random.RandomState(0)
+    lons = random.uniform(minx - 0.05, maxx + 0.05, 2000)
+    lats = random.uniform(miny - 0.05, maxy + 0.05, 2000)
+
+    expected = []
+    for lon, lat in zip(lons, lats):
+        point = Point(lon, lat)
+        expected.append(
+            next((k for k, g in regions.items() if g.intersects(point)), None)
+        )
+
+    keys = SpatialJoin(grid_type, regions, resolution).assign(lats, lons)
+
+    assert list(keys) == expected
+    assert set(expected) == {"inside", "ring", None}
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `polyfill_cache` package."""
+
+import pytest
+
+import json
+
+from shapely import geometry as sg
+
+from babelgrid import Babel, PolyfillCache, profiling
+from babelgrid.polyfill_cache import geometry_key
+
+
+@pytest.fixture
+def geometry():
+
+    with open("notebooks/example_geojson.json") as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize("grid_type, resolution", [("s2", 12), ("h3", 8), ("bing", 14)])
+def test_polyfill_disk_cache(tmp_path, geometry, grid_type, resolution):
+
+    path = str(tmp_path / "polyfills.sqlite")
+    babel = Babel(grid_type)
+    expected = babel.polyfill(geometry, resolution, ids_only=True)
+
+    cold = babel.polyfill(
+        geometry, resolution, ids_only=True, disk_cache=PolyfillCache(path)
+    )
+
+    # A new instance reads what the previous one stored
+    disk_cache = PolyfillCache(path)
+    with profiling.profile() as profile:
+        warm = babel.polyfill(geometry, resolution, disk_cache=disk_cache)
+
+    assert cold == expected
+    assert [tile.tile_id for tile in warm] == expected
+    assert type(warm[0].tile_id) is type(expected[0])
+    assert disk_cache.stats()["hits"] == 1
+    assert "s2.candidates" not in profile.counters
+    assert "bing.candidates" not in profile.counters
+    assert profile.counters["polyfill.disk_cache_hits"] == 1
+
+
+def test_geometry_key():
+
+    square = sg.box(0, 0, 1, 1)
+    reversed_square = sg.Polygon(list(square.exterior.coords)[::-1])
+
+    assert geometry_key(square, "s2", 10) == geometry_key(reversed_square, "s2", 10)
+    assert geometry_key(square, "s2", 10) != geometry_key(square, "s2", 11)
+    assert geometry_key(square, "s2", 10) != geometry_key(square, "h3", 10)
+
+    # Starting vertex, holes and parts order
+    coords = list(square.exterior.coords)
+    rotated_square = sg.Polygon(coords[2:-1] + coords[:3])
+    holed = sg.Polygon(coords, [[(0.2, 0.2), (0.4, 0.2), (0.4, 0.4)]])
+    rotated_holed = sg.Polygon(coords[::-1], [[(0.4, 0.4), (0.4, 0.2), (0.2, 0.2)]])
+    other = sg.box(2, 2, 3, 3)
+    multi = sg.MultiPolygon([square, other])
+    reordered_multi = sg.MultiPolygon([other, rotated_square])
+
+    assert geometry_key(square, "s2", 10) == geometry_key(rotated_square, "s2", 10)
+    assert geometry_key(holed, "s2", 10) == geometry_key(rotated_holed, "s2", 10)
+    assert geometry_key(holed, "s2", 10) != geometry_key(square, "s2", 10)
+    assert geometry_key(multi, "s2", 10) == geometry_key(reordered_multi, "s2", 10)
+
+    with pytest.raises(Exception, match="can not be cached"):
+        geometry_key(sg.Point(0, 0), "s2", 10)
+
+
+def test_disk_cache_eviction(tmp_path):
+
+    disk_cache = PolyfillCache(str(tmp_path / "polyfills.sqlite"), max_entries=2)
+    boxes = [sg.box(i, 0, i + 0.5, 0.5) for i in range(3)]
+
+    for box in boxes[:2]:
+        Babel("s2").polyfill(box, 8, ids_only=True, disk_cache=disk_cache)
+
+    # Reading the first box makes the second the least recently used
+    assert disk_cache.get(boxes[0], "s2", 8) is not None
+    Babel("s2").polyfill(boxes[2], 8, ids_only=True, disk_cache=disk_cache)
+
+    assert disk_cache.get(boxes[1], "s2", 8) is None
+    assert disk_cache.get(boxes[0], "s2", 8) is not None
+    assert disk_cache.stats()["size"] == 2
+    assert disk_cache.stats()["evictions"] == 1
+
+    size = disk_cache.stats()["bytes"]
+    disk_cache.max_bytes = size - 1
+    disk_cache.put(boxes[1], "s2", 8, disk_cache.get(boxes[0], "s2", 8))
+    assert disk_cache.stats()["bytes"] < size
+
+    disk_cache.clear()
+    assert disk_cache.stats()["size"] == 0
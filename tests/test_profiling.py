@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `profiling` package."""
+
+import pytest
+
+import json
+
+from babelgrid import Babel, profiling
+
+
+@pytest.fixture
+def geometry():
+
+    with open("notebooks/example_geojson.json") as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize("grid_type, resolution", [("s2", 12), ("bing", 14)])
+def test_polyfill_profile(geometry, grid_type, resolution):
+
+    received = []
+
+    with profiling.profile(callback=received.append) as profile:
+        tiles = Babel(grid_type).polyfill(geometry, resolution)
+        [tile.geometry.wkt for tile in tiles]
+
+    stats = profile.to_dict()
+    counters, timers = stats["counters"], stats["timers"]
+
+    assert received == [stats]
+    assert counters["polyfill"] == 1
+    assert counters["polyfill.tiles_kept"] == len(tiles)
+    assert counters["tile.created"] == len(tiles)
+    assert counters["serialization.wkt"] == len(tiles)
+    assert counters[f"{grid_type}.candidates"] > 0
+    assert (
+        counters[f"{grid_type}.geometry_tests"] >= counters[f"{grid_type}.candidates"]
+    )
+    assert timers["polyfill"] >= timers["polyfill.ids"]
+
+    assert profiling.current is None
+
+
+def test_profiling_disabled(geometry):
+
+    assert profiling.instrument(len, "len") is len
+
+    Babel("s2").polyfill(geometry, 10)
+
+    with pytest.raises(Exception):
+        profiling.disable()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `quadtree` package."""
+
+import pytest
+
+import numpy as np
+from shapely import wkt
+from shapely.geometry import Polygon
+
+from babelgrid import quadtree
+
+
+def test_tile_bounds():
+
+    key = "2103111312330132"
+    expected = wkt.loads(quadtree.tile_to_geo_boundary(key)).bounds
+
+    # Scalar and batch bounds share their formula
+    assert quadtree._key_box(key).bounds == expected
+    assert [
+        bound[0] for bound in quadtree.tile_to_bounds_batch(np.array([key]))
+    ] == list(expected)
+    assert quadtree._xyz_to_quadkey(*quadtree._quadkey_to_xyz(key)) == key
+
+    lats, lons = np.array([-23.5, 0.0, 89.0]), np.array([-46.6, 0.0, 179.9])
+    assert [quadtree.geo_to_tile(lat, lon, 16) for lat, lon in zip(lats, lons)] == list(
+        quadtree.geo_to_tile_batch(lats, lons, 16)
+    )
+
+
+def test_polyfill():
+
+    shell = [(-46, -24), (-45, -24), (-45, -23), (-46, -23)]
+    hole = [(-45.7, -23.7), (-45.3, -23.7), (-45.3, -23.3), (-45.7, -23.3)]
+
+    filled = quadtree.polyfill(Polygon(shell), 12)
+    holed = quadtree.polyfill(Polygon(shell, [hole]), 12)
+
+    assert filled == sorted(filled)
+    assert set(holed) < set(filled)
+    assert quadtree.geo_to_tile(-23.5, -45.5, 12) in filled
+    assert quadtree.geo_to_tile(-23.5, -45.5, 12) not in holed
+
+
+def test_polyfill_deep_resolution():
+
+    geometry = Polygon([(-45.0, -23.0), (-44.999, -23.0), (-44.999, -22.999)])
+
+    keys = quadtree.polyfill(geometry, 23)
+
+    assert len(keys) > 0
+    assert all(len(key) == 23 for key in keys)
+
+
+def test_compact():
+
+    keys = ["0", "00", "10", "11", "12", "130", "131", "132", "133", "2"]
+
+    assert quadtree.compact(keys) == ["0", "1", "2"]
+    assert quadtree.uncompact(["1"], 2) == ["10", "11", "12", "13"]
+
+    with pytest.raises(Exception):
+        quadtree.uncompact(["123"], 2)
+
+
+def test_quadkey_to_int():
+
+    keys = ["1", "10", "103", "11", "2", "3" * quadtree.QUADKEY_MAX_LEVEL]
+    values = [quadtree.quadkey_to_int(key) for key in keys]
+
+    assert [quadtree.int_to_quadkey(value) for value in values] == keys
+    assert values == sorted(values) and max(values) < 2**63
+    assert quadtree.quadint_get_resolution(values[2]) == 3
+    assert quadtree.quadint_to_parent(values[2]) == values[1]
+    assert quadtree.quadint_to_parent(values[2], 1) == values[0]
+    assert [
+        quadtree.int_to_quadkey(child)
+        for child in quadtree.quadint_to_children(values[1])
+    ] == list(quadtree.tile_to_children("10"))
+
+
+@pytest.mark.parametrize("resolution", [3, 12, 23])
+def test_batch_matches_pygeotile(resolution):
+
+    pygeotile = pytest.importorskip("pygeotile.tile")
+
+    random = np.random.RandomState(resolution)
+    lats = random.uniform(-85, 85, 2000)
+    lons = random.uniform(-179, 179, 2000)
+
+    keys = quadtree.geo_to_tile_batch(lats, lons, resolution)
+    expected = [
+        pygeotile.Tile.for_latitude_longitude(lat, lon, resolution).quad_tree
+        for lat, lon in zip(lats.tolist(), lons.tolist())
+    ]
+
+    assert list(keys) == expected
+    assert quadtree.geo_to_tile(lats[0], lons[0], resolution) == expected[0]
+    assert list(quadtree.geo_to_quadint_batch(lats, lons, resolution)) == [
+        quadtree.quadkey_to_int(key) for key in expected
+    ]
+
+    x, y, z = quadtree.quadkey_to_xyz_batch(keys)
+    bounds = np.stack(quadtree.xyz_to_bounds_batch(x, y, z), axis=1)
+
+    for key, tile_bounds in zip(expected[:200], bounds):
+        (south_west, north_east) = pygeotile.Tile.from_quad_tree(key).bounds
+        assert tile_bounds == pytest.approx(
+            [
+                south_west.longitude,
+                south_west.latitude,
+                north_east.longitude,
+                north_east.latitude,
+            ]
+        )
@@ -3,11 +3,11 @@
 
 """Tests for `s2` package."""
 
-
 import pytest
 
 from babelgrid import s2
 import json
+import numpy as np
 import yaml
 
 
@@ -42,6 +42,13 @@ def test_s2_to_geo_boundary():
     assert s2.s2_to_geo_boundary(s2_address) == geo_boundary
     assert s2.s2_to_geo_boundary(s2_address, True) == geo_boundary_geojson
 
+    # Cached boundaries are not shared with the caller
+    s2.s2_to_geo_boundary(s2_address, True).pop()
+    s2.s2_to_geo_boundary(s2_address)[0][0] = 0.0
+
+    assert s2.s2_to_geo_boundary(s2_address) == geo_boundary
+    assert s2.s2_to_geo_boundary(s2_address, True) == geo_boundary_geojson
+
 
 def test_polyfill():
 
@@ -64,3 +71,50 @@ def test_polyfill():
     #     s2.polyfill(data_test["boundary"], 10, True, False)
     #     == data_test["boundary_10_true_false"]
     # )
+
+
+def test_polyfill_ids_holes_and_multipolygons():
+
+    shell = [[-46, -24], [-45, -24], [-45, -23], [-46, -23], [-46, -24]]
+    hole = [[-45.7, -23.7], [-45.3, -23.7], [-45.3, -23.3], [-45.7, -23.3]]
+    other = [[-44, -24], [-43.5, -24], [-43.5, -23.5], [-44, -24]]
+
+    filled = list(s2.polyfill_ids({"type": "Polygon", "coordinates": [shell]}, 10))
+    holed = list(s2.polyfill_ids({"type": "Polygon", "coordinates": [shell, hole]}, 10))
+
+    assert set(holed) < set(filled)
+    assert s2.geo_to_s2(-23.5, -45.5, 10) in filled
+    assert s2.geo_to_s2(-23.5, -45.5, 10) not in holed
+
+    multi = list(
+        s2.polyfill_ids({"type": "MultiPolygon", "coordinates": [[shell], [other]]}, 10)
+    )
+
+    assert set(multi) == set(filled) | set(
+        s2.polyfill_ids({"type": "Polygon", "coordinates": [other]}, 10)
+    )
+    assert multi == sorted(multi, key=lambda t: s2.CellId.from_token(t).id())
+
+
+@pytest.mark.parametrize("res", [0, 5, 13, 30])
+def test_batch_matches_s2sphere(res):
+
+    random = np.random.RandomState(res)
+    lats = np.concatenate([random.uniform(-90, 90, 2000), [0, 90, -90, 45, 0, 0]])
+    lons = np.concatenate([random.uniform(-180, 180, 2000), [0, 0, 0, 45, 180, -180]])
+
+    cell_ids = s2.geo_to_s2_id_batch(lats, lons, res)
+
+    expected = [
+        s2.CellId.from_lat_lng(s2.LatLng.from_degrees(lat, lon)).parent(res).id()
+        for lat, lon in zip(lats.tolist(), lons.tolist())
+    ]
+    assert cell_ids.tolist() == expected
+
+    vertex_lats, vertex_lons = s2.s2_id_to_vertices_batch(cell_ids)
+
+    for cell_id, cell_lats, cell_lons in zip(expected, vertex_lats, vertex_lons):
+        cell = s2.Cell(s2.CellId(cell_id))
+        vertices = [s2.LatLng.from_point(cell.get_vertex(k)) for k in range(4)]
+        assert cell_lats.tolist() == [vertex.lat().degrees for vertex in vertices]
+        assert cell_lons.tolist() == [vertex.lng().degrees for vertex in vertices]
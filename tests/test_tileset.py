@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for `tileset` package."""
+
+import pytest
+
+import json
+
+from babelgrid import Babel, TileSet
+
+
+@pytest.fixture
+def geometry():
+
+    with open("notebooks/example_geojson.json") as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize("grid_type, resolution", [("s2", 13), ("h3", 9), ("bing", 15)])
+def test_tileset(geometry, grid_type, resolution):
+
+    babel = Babel(grid_type)
+    tile_ids = babel.polyfill(geometry, resolution, ids_only=True)
+
+    tileset = TileSet(grid_type, tile_ids)
+    first = TileSet(grid_type, tile_ids[: len(tile_ids) // 2])
+    second = TileSet(grid_type, tile_ids[len(tile_ids) // 2 :])
+
+    assert all(tile_id in tileset for tile_id in tile_ids)
+    assert sorted(list(tileset)) == sorted(babel.compact(tile_ids))
+    assert first | second == tileset
+    assert tileset & first == first
+    assert tileset - first == second
+    assert not first & second
+    assert not tileset - tileset
+
+
+def test_tileset_contains_across_resolutions():
+
+    tileset = TileSet("bing", ["120", "121", "122", "123", "0"])
+
+    assert "12" in tileset
+    assert "0123" in tileset
+    assert "1" not in tileset
+    assert "2" not in tileset
+    assert list(tileset) == ["0", "12"]
+
+
+def test_tileset_h3_pentagon():
+
+    pentagon = "830800fffffffff"
+    children = Babel("h3").uncompact([pentagon], 5)
+
+    assert pentagon in TileSet("h3", children)
+    assert pentagon not in TileSet("h3", children[1:])
+    assert list(TileSet("h3", children)) == [pentagon]